@@ -0,0 +1,37 @@
+"""add notice feed keyset indexes (published_at DESC NULLS LAST, id DESC)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: str | Sequence[str] | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GET /v1/notices keyset 페이지네이션: 전체 피드·단과대 필터 피드
+    op.create_index(
+        "ix_notices_feed",
+        "notices",
+        [sa.text("published_at DESC NULLS LAST"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notices_college_feed",
+        "notices",
+        ["college_id", sa.text("published_at DESC NULLS LAST"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notices_college_feed", table_name="notices")
+    op.drop_index("ix_notices_feed", table_name="notices")
@@ -0,0 +1,85 @@
+"""add notice_schedules (normalized Notice.dates) and user calendar start_at index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+import re
+from collections.abc import Sequence
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008"
+down_revision: str | Sequence[str] | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# app.services.calendar_service.parse_schedule_entries와 같은 규칙 (마이그레이션은 앱 코드에 의존하지 않음)
+_DATE_RE = re.compile(r"(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+
+
+def _entries(dates):
+    seen = set()
+    rows = []
+    for item in dates or []:
+        if not isinstance(item, dict) or not isinstance(item.get("date"), str):
+            continue
+        m = _DATE_RE.search(item["date"])
+        if not m:
+            continue
+        try:
+            d = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            continue
+        t = str(item.get("type") or "").strip()[:64] or None
+        if (t, d) in seen:
+            continue
+        seen.add((t, d))
+        rows.append((t, d))
+    return rows
+
+
+def upgrade() -> None:
+    schedules = op.create_table(
+        "notice_schedules",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("notice_id", sa.Integer(), nullable=False),
+        sa.Column("schedule_type", sa.String(64), nullable=True),
+        sa.Column("schedule_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["notice_id"], ["notices.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_notice_schedules_notice_id", "notice_schedules", ["notice_id"], unique=False)
+    op.create_index(
+        "ix_notice_schedules_date_notice",
+        "notice_schedules",
+        ["schedule_date", "notice_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_calendar_events_user_start",
+        "user_calendar_events",
+        ["user_id", "start_at"],
+        unique=False,
+    )
+
+    # 기존 Notice.dates 백필
+    conn = op.get_bind()
+    result = conn.execute(sa.text("SELECT id, dates FROM notices WHERE dates IS NOT NULL"))
+    rows = [
+        {"notice_id": notice_id, "schedule_type": t, "schedule_date": d}
+        for notice_id, dates in result
+        for t, d in _entries(dates)
+    ]
+    if rows:
+        op.bulk_insert(schedules, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_calendar_events_user_start", table_name="user_calendar_events")
+    op.drop_index("ix_notice_schedules_date_notice", table_name="notice_schedules")
+    op.drop_index("ix_notice_schedules_notice_id", table_name="notice_schedules")
+    op.drop_table("notice_schedules")
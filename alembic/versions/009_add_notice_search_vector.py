@@ -0,0 +1,92 @@
+"""add notices.search_vector (trigger-maintained tsvector, Korean bigrams) + GIN index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "009"
+down_revision: str | Sequence[str] | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 토큰 규칙은 app.services.notice_service.search_tokens와 동일해야 함.
+# 한글 연속 구간 → 2글자 bigram(1글자 구간은 그대로), 영숫자 구간 → 소문자 단어.
+# array_to_tsvector로 파서·사전을 거치지 않고 토큰을 그대로 lexeme으로 저장.
+_TOKENS_FN = """
+CREATE OR REPLACE FUNCTION notice_search_tokens(src text) RETURNS text[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(array_agg(DISTINCT tok), '{}')
+    FROM (
+        SELECT m[1] AS run FROM regexp_matches(lower(coalesce(src, '')), '[가-힣]+|[a-z0-9]+', 'g') AS m
+    ) runs
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN run ~ '^[가-힣]' THEN substr(run, i, 2) ELSE run END AS tok
+        FROM generate_series(1, CASE WHEN run ~ '^[가-힣]' THEN greatest(length(run) - 1, 1) ELSE 1 END) AS i
+    ) toks
+$$
+"""
+
+# 가중치: 제목 A, 해시태그 B, 본문(태그·엔티티 제거, 앞 100k자) D
+_VECTOR_FN = """
+CREATE OR REPLACE FUNCTION notice_search_vector(title text, raw_html text, hashtags jsonb) RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(array_to_tsvector(notice_search_tokens(title)), 'A')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               CASE WHEN jsonb_typeof(hashtags) = 'array'
+                    THEN (SELECT string_agg(h, ' ') FROM jsonb_array_elements_text(hashtags) AS h)
+               END
+           )), 'B')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               regexp_replace(regexp_replace(left(raw_html, 100000), '<[^>]*>', ' ', 'g'), '&[a-zA-Z0-9#]+;', ' ', 'g')
+           )), 'D')
+$$
+"""
+
+_TRIGGER_FN = """
+CREATE OR REPLACE FUNCTION notices_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := notice_search_vector(NEW.title, NEW.raw_html, NEW.hashtags);
+    RETURN NEW;
+END
+$$
+"""
+
+_TRIGGER = """
+CREATE TRIGGER trg_notices_search_vector
+BEFORE INSERT OR UPDATE OF title, raw_html, hashtags ON notices
+FOR EACH ROW EXECUTE FUNCTION notices_search_vector_update()
+"""
+
+
+def upgrade() -> None:
+    op.add_column("notices", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.execute(_TOKENS_FN)
+    op.execute(_VECTOR_FN)
+    op.execute(_TRIGGER_FN)
+    op.execute(_TRIGGER)
+    # 기존 공지 백필
+    op.execute("UPDATE notices SET search_vector = notice_search_vector(title, raw_html, hashtags)")
+    op.create_index(
+        "ix_notices_search_vector",
+        "notices",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notices_search_vector", table_name="notices")
+    op.execute("DROP TRIGGER IF EXISTS trg_notices_search_vector ON notices")
+    op.execute("DROP FUNCTION IF EXISTS notices_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS notice_search_vector(text, text, jsonb)")
+    op.execute("DROP FUNCTION IF EXISTS notice_search_tokens(text)")
+    op.drop_column("notices", "search_vector")
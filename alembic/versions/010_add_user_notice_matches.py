@@ -0,0 +1,42 @@
+"""add user_notice_matches and users match keys (department, grade inverted index)
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010"
+down_revision: str | Sequence[str] | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("match_department", sa.String(128), nullable=True))
+    op.add_column("users", sa.Column("match_grade", sa.SmallInteger(), nullable=True))
+    op.create_index("ix_users_match_keys", "users", ["match_department", "match_grade"], unique=False)
+    op.create_table(
+        "user_notice_matches",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("notice_id", sa.Integer(), nullable=False),
+        sa.Column("matched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["notice_id"], ["notices.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "notice_id"),
+    )
+    op.create_index("ix_user_notice_matches_notice_id", "user_notice_matches", ["notice_id"], unique=False)
+    # 기존 profile_json의 매칭 키·매칭 행은 앱 규칙(match_service)으로 채워야 하므로
+    # 배포 후 python scripts/rebuild_matches.py 실행.
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_notice_matches_notice_id", table_name="user_notice_matches")
+    op.drop_table("user_notice_matches")
+    op.drop_index("ix_users_match_keys", table_name="users")
+    op.drop_column("users", "match_grade")
+    op.drop_column("users", "match_department")
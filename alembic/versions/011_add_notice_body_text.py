@@ -0,0 +1,105 @@
+"""add notices.body_text (sanitized body text); search vector reads body_text
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "011"
+down_revision: str | Sequence[str] | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 본문은 body_text 우선. 아직 백필 전(body_text NULL)인 행은 009와 같이 raw_html에서 태그·엔티티 제거.
+# body_text 백필: python scripts/backfill_body_text.py
+_VECTOR_FN = """
+CREATE FUNCTION notice_search_vector(title text, body_text text, raw_html text, hashtags jsonb) RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(array_to_tsvector(notice_search_tokens(title)), 'A')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               CASE WHEN jsonb_typeof(hashtags) = 'array'
+                    THEN (SELECT string_agg(h, ' ') FROM jsonb_array_elements_text(hashtags) AS h)
+               END
+           )), 'B')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               left(coalesce(
+                   body_text,
+                   regexp_replace(
+                       regexp_replace(left(raw_html, 100000), '<[^>]*>', ' ', 'g'), '&[a-zA-Z0-9#]+;', ' ', 'g'
+                   )
+               ), 100000)
+           )), 'D')
+$$
+"""
+
+_TRIGGER_FN = """
+CREATE OR REPLACE FUNCTION notices_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := notice_search_vector(NEW.title, NEW.body_text, NEW.raw_html, NEW.hashtags);
+    RETURN NEW;
+END
+$$
+"""
+
+_TRIGGER = """
+CREATE TRIGGER trg_notices_search_vector
+BEFORE INSERT OR UPDATE OF title, body_text, raw_html, hashtags ON notices
+FOR EACH ROW EXECUTE FUNCTION notices_search_vector_update()
+"""
+
+_OLD_VECTOR_FN = """
+CREATE FUNCTION notice_search_vector(title text, raw_html text, hashtags jsonb) RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(array_to_tsvector(notice_search_tokens(title)), 'A')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               CASE WHEN jsonb_typeof(hashtags) = 'array'
+                    THEN (SELECT string_agg(h, ' ') FROM jsonb_array_elements_text(hashtags) AS h)
+               END
+           )), 'B')
+        || setweight(array_to_tsvector(notice_search_tokens(
+               regexp_replace(regexp_replace(left(raw_html, 100000), '<[^>]*>', ' ', 'g'), '&[a-zA-Z0-9#]+;', ' ', 'g')
+           )), 'D')
+$$
+"""
+
+_OLD_TRIGGER_FN = """
+CREATE OR REPLACE FUNCTION notices_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := notice_search_vector(NEW.title, NEW.raw_html, NEW.hashtags);
+    RETURN NEW;
+END
+$$
+"""
+
+_OLD_TRIGGER = """
+CREATE TRIGGER trg_notices_search_vector
+BEFORE INSERT OR UPDATE OF title, raw_html, hashtags ON notices
+FOR EACH ROW EXECUTE FUNCTION notices_search_vector_update()
+"""
+
+
+def upgrade() -> None:
+    op.add_column("notices", sa.Column("body_text", sa.Text(), nullable=True))
+    # 인자 목록이 바뀌므로 트리거 → 함수 순으로 교체.
+    # 기존 search_vector 값은 그대로 유효(body_text NULL = 009와 동일 결과).
+    op.execute("DROP TRIGGER IF EXISTS trg_notices_search_vector ON notices")
+    op.execute("DROP FUNCTION IF EXISTS notice_search_vector(text, text, jsonb)")
+    op.execute(_VECTOR_FN)
+    op.execute(_TRIGGER_FN)
+    op.execute(_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_notices_search_vector ON notices")
+    op.execute("DROP FUNCTION IF EXISTS notice_search_vector(text, text, text, jsonb)")
+    op.execute(_OLD_VECTOR_FN)
+    op.execute(_OLD_TRIGGER_FN)
+    op.execute(_OLD_TRIGGER)
+    op.drop_column("notices", "body_text")
@@ -0,0 +1,25 @@
+"""add crawl_runs.stats (per-stage crawl instrumentation, JSONB)
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "012"
+down_revision: str | Sequence[str] | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("crawl_runs", sa.Column("stats", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("crawl_runs", "stats")
@@ -0,0 +1,27 @@
+"""공용 API 의존성."""
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.services.auth_service import AuthError, decode_access_token
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def get_optional_user_id(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer),
+) -> int | None:
+    """Authorization: Bearer <access JWT>가 있으면 user_id, 없으면 None(비로그인). 잘못된 토큰은 401."""
+    if credentials is None:
+        return None
+    try:
+        return decode_access_token(credentials.credentials)
+    except AuthError as e:
+        raise HTTPException(status_code=401, detail=str(e)) from e
+
+
+def get_current_user_id(user_id: int | None = Depends(get_optional_user_id)) -> int:
+    """로그인 필수 엔드포인트용. Bearer 토큰이 없으면 401."""
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return user_id
@@ -2,18 +2,22 @@
 내부 전용 API (Cron·관리). 보안 키 검증 후 크롤 트리거·크롤 이력 조회 등.
 """
 
+from datetime import UTC, datetime, timedelta
+
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.crawler_config import COLLEGE_CODE_TO_MODULE
+from app.core.crawler_config import COLLEGE_CODE_TO_MODULE, CRAWLER_CONFIG
 from app.core.database import get_db
-from app.repositories.crawl_run_repository import get_recent_crawl_runs
+from app.core.metrics import REGISTRY, get_redis_client, instance_name, load_snapshots, observe_broker_queue, render
+from app.repositories.crawl_run_repository import get_recent_crawl_runs, get_runs_since
+from app.services.crawl_stats import summarize_runs
 
 router = APIRouter(prefix="/internal", tags=["internal"])
 
-# 단과대별 크롤 시작 시간 분산(Thundering Herd 방지). 초 단위. 예: 300 = 5분 간격.
-CRAWL_STAGGER_SECONDS = 300
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 
 def _validate_trigger_secret(
@@ -40,21 +44,24 @@ def _validate_trigger_secret(
 def post_trigger_crawl(
     college_code: str | None = Query(
         None,
-        description="단과대 코드(engineering, science, ...). 없으면 전체 순차 enqueue.",
+        description="단과대 코드(engineering, science, ...). 없으면 크롤 주기가 된 단과대만 스케줄.",
     ),
+    full: bool = Query(False, description="True면 증분 모드 끄고 목록 전체 상세 재수집."),
     x_crawl_trigger_secret: str | None = Header(None, alias="X-Crawl-Trigger-Secret"),
     authorization: str | None = Header(None),
     secret: str | None = Query(None),
 ) -> dict:
     """
-    크롤 태스크 enqueue. 보안 키 필수.
+    크롤 스케줄 태스크 enqueue. 보안 키 필수.
+    전체 호출은 crawl_runs 이력 기반 적응형 주기로 due 단과대만, 호스트별 동시 한도 안에서 즉시 시작.
+    college_code 지정·full=true는 주기와 무관하게 강제 실행.
     헤더: X-Crawl-Trigger-Secret 또는 Authorization: Bearer <secret>
-    쿼리: ?secret=... 또는 ?college_code=engineering
+    쿼리: ?secret=... 또는 ?college_code=engineering, ?full=true(전체 재수집)
     """
     _validate_trigger_secret(x_crawl_trigger_secret, authorization, secret)
 
     # app.worker를 먼저 로드해 Celery app이 default가 되도록 한 뒤 태스크 import
-    from app.services.tasks import crawl_college_task
+    from app.services.tasks import schedule_crawls_task
     from app.worker import app  # noqa: F401
 
     if college_code is not None:
@@ -67,30 +74,81 @@ def post_trigger_crawl(
     else:
         codes = list(COLLEGE_CODE_TO_MODULE.keys())
 
-    task_ids = []
-    for i, code in enumerate(codes):
-        countdown = i * CRAWL_STAGGER_SECONDS if len(codes) > 1 else 0
-        result = crawl_college_task.apply_async(args=[code], countdown=countdown)
-        task_ids.append({"college_code": code, "task_id": result.id, "countdown_sec": countdown})
+    force = full or college_code is not None
+    result = schedule_crawls_task.delay(codes, incremental=not full, force=force)
 
     return {
-        "enqueued": len(task_ids),
-        "tasks": task_ids,
+        "task_id": result.id,
+        "college_codes": codes,
+        "force": force,
     }
 
 
+@router.post("/backfill-crawl")
+def post_backfill_crawl(
+    college_code: str = Query(..., description="단과대 코드. 목록 pagination이 설정된 단과대만."),
+    pages: int = Query(50, ge=1, le=500, description="이번 호출에서 처리할 최대 목록 페이지 수."),
+    restart: bool = Query(False, description="True면 체크포인트 무시하고 첫 페이지부터."),
+    x_crawl_trigger_secret: str | None = Header(None, alias="X-Crawl-Trigger-Secret"),
+    authorization: str | None = Header(None),
+    secret: str | None = Query(None),
+) -> dict:
+    """
+    목록 과거 페이지 백필 태스크 enqueue. 보안 키 필수(trigger-crawl과 동일).
+    체크포인트부터 이어서 진행하므로 같은 요청을 반복 호출하면 pages쪽씩 과거로 내려감.
+    """
+    _validate_trigger_secret(x_crawl_trigger_secret, authorization, secret)
+
+    from app.services.tasks import backfill_college_task
+    from app.worker import app  # noqa: F401
+
+    module_name = COLLEGE_CODE_TO_MODULE.get(college_code)
+    if not module_name or not CRAWLER_CONFIG[module_name].get("pagination"):
+        paginated = [code for code, mod in COLLEGE_CODE_TO_MODULE.items() if CRAWLER_CONFIG[mod].get("pagination")]
+        raise HTTPException(
+            status_code=400,
+            detail=f"Backfill not supported for college_code: {college_code}. Valid: {paginated}",
+        )
+    result = backfill_college_task.delay(college_code, pages=pages, restart=restart)
+    return {"task_id": result.id, "college_code": college_code, "pages": pages, "restart": restart}
+
+
 @router.get("/crawl-stats")
 async def get_crawl_stats(
     limit: int = Query(50, ge=1, le=200, description="최근 N건"),
+    days: int = Query(7, ge=1, le=90, description="단과대별 백분위 요약 기간(일)"),
     x_crawl_trigger_secret: str | None = Header(None, alias="X-Crawl-Trigger-Secret"),
     authorization: str | None = Header(None),
     secret: str | None = Query(None),
     session: AsyncSession = Depends(get_db),
 ) -> dict:
     """
-    최근 크롤 실행 이력. 단과대별 last_run_at, status, notices_upserted, error_message.
+    최근 크롤 실행 이력(runs: status, notices_upserted, error_message, 단계별 계측 stats)과
+    최근 days일 단과대별 요약(colleges: 소요 시간·단계별 ms·페이지·바이트 p50/p95/max, 스킵 사유 합계).
     보안 키 필수 (X-Crawl-Trigger-Secret 또는 Authorization: Bearer <secret>).
     """
     _validate_trigger_secret(x_crawl_trigger_secret, authorization, secret)
     runs = await get_recent_crawl_runs(session, limit=limit)
-    return {"runs": runs, "limit": limit}
+    history = await get_runs_since(session, datetime.now(UTC) - timedelta(days=days))
+    return {"runs": runs, "limit": limit, "days": days, "colleges": summarize_runs(history)}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(
+    x_crawl_trigger_secret: str | None = Header(None, alias="X-Crawl-Trigger-Secret"),
+    authorization: str | None = Header(None),
+    secret: str | None = Query(None),
+) -> PlainTextResponse:
+    """
+    Prometheus 텍스트 형식 메트릭. 이 웹 프로세스(라우트별 지연·async DB 풀) + Redis의 워커 스냅샷
+    (크롤 fetch·Celery 태스크·sync DB 풀) + 브로커 큐 깊이(AI 대기 태스크·공지 수). instance 라벨로 프로세스 구분.
+    보안 키 필수 (X-Crawl-Trigger-Secret 또는 Authorization: Bearer <secret>).
+    """
+    _validate_trigger_secret(x_crawl_trigger_secret, authorization, secret)
+    client = get_redis_client()
+    if client is not None:
+        observe_broker_queue(client)
+    sources = [(instance_name("web"), REGISTRY.collect())]
+    if client is not None:
+        sources.extend(load_snapshots(client))
+    return PlainTextResponse(render(sources), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,31 @@
+"""Blob API. 공지 본문의 {"type": "blob", "key": ...} 이미지 참조를 key로 조회."""
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.blob_store import BLOB_KEY_RE, get_blob_store, sniff_image_type
+from app.core.http_validators import is_not_modified
+
+router = APIRouter(prefix="/blobs", tags=["blobs"])
+
+# 내용 주소(sha256) 키라 같은 key의 본문은 바뀌지 않음 → 장기 캐시
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/{key}", responses={200: {"content": {"image/*": {}}}, 404: {"description": "없는 blob"}})
+async def get_blob(key: str, request: Request) -> Response:
+    """
+    blob 본문. Content-Type은 매직 바이트로 판단(이미지가 아니면 application/octet-stream).
+    ETag = key 이므로 If-None-Match 일치 시 저장소 조회 없이 304.
+    """
+    if not BLOB_KEY_RE.match(key):
+        raise HTTPException(status_code=404, detail="blob not found")
+    etag = f'"{key}"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if is_not_modified(request.headers, etag, None):
+        return Response(status_code=304, headers=headers)
+    data = await run_in_threadpool(get_blob_store().get, key)
+    if data is None:
+        raise HTTPException(status_code=404, detail="blob not found")
+    headers["X-Content-Type-Options"] = "nosniff"
+    return Response(content=data, media_type=sniff_image_type(data) or "application/octet-stream", headers=headers)
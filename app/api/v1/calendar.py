@@ -0,0 +1,55 @@
+"""Calendar API. 월별 일정(공지 추출 일정 + 내가 추가한 일정)."""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_optional_user_id
+from app.core.database import get_db
+from app.core.http_validators import is_not_modified, validator_headers
+from app.core.response_cache import get_response_cache
+from app.schemas.calendar import CalendarEventsResponse, NoticeScheduleEvent, UserCalendarEventItem
+from app.services.calendar_service import list_notice_events, list_user_events
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+_NOTICE_EVENTS = TypeAdapter(list[NoticeScheduleEvent])
+
+
+@router.get("/events", response_model=CalendarEventsResponse)
+async def get_events(
+    request: Request,
+    response: Response,
+    year: int = Query(..., ge=2000, le=2100, description="연도. 예: 2026"),
+    month: int = Query(..., ge=1, le=12, description="월 (1~12)"),
+    college: list[str] | None = Query(None, description="단과대 코드 필터(반복 가능). 공지 일정에만 적용"),
+    user_id: int | None = Depends(get_optional_user_id),
+    session: AsyncSession = Depends(get_db),
+) -> CalendarEventsResponse | Response:
+    """
+    월별 달력. notice_events(공지에서 추출된 일정)와 user_events(로그인 시 내 달력 일정)를 함께 반환.
+    프론트에서 두 배열 병합. 비로그인이면 user_events는 빈 배열.
+    notice_events는 유저와 무관하므로 응답 캐시에서, user_events는 매 요청 DB에서.
+    조건부 GET: 비로그인은 데이터 버전 검증자로 본문 생성 전 304, 로그인은 본문 해시 ETag(미들웨어).
+    """
+    cache = get_response_cache()
+    slot = await cache.slot("calendar:notice_events", {"year": year, "month": month}, college)
+    response.headers["Vary"] = "Authorization"
+    if user_id is None and slot.key:
+        headers = validator_headers(slot.etag, slot.last_modified)
+        if is_not_modified(request.headers, slot.etag, slot.last_modified):
+            return Response(status_code=304, headers={**headers, "Vary": "Authorization"})
+        response.headers.update(headers)
+
+    async def build() -> bytes:
+        return _NOTICE_EVENTS.dump_json(
+            await list_notice_events(session, year=year, month=month, college_codes=college)
+        )
+
+    body = await cache.fetch(slot, build)
+    user_events: list[UserCalendarEventItem] = []
+    if user_id is not None:
+        user_events = await list_user_events(session, user_id, year=year, month=month)
+    return CalendarEventsResponse(
+        year=year, month=month, notice_events=_NOTICE_EVENTS.validate_json(body), user_events=user_events
+    )
@@ -0,0 +1,70 @@
+"""Notice API. 공지 피드·검색."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.http_validators import cached_json_response
+from app.core.response_cache import get_response_cache
+from app.schemas.notice import NoticeFeedResponse, NoticeSearchResponse
+from app.services.notice_service import (
+    FEED_DEFAULT_LIMIT,
+    FEED_MAX_LIMIT,
+    InvalidCursorError,
+    get_notice_feed,
+    search_notices,
+)
+
+router = APIRouter(prefix="/notices", tags=["notices"])
+
+
+@router.get("", response_model=NoticeFeedResponse)
+async def get_notices(
+    request: Request,
+    college: list[str] | None = Query(None, description="단과대 코드 필터(반복 가능). 예: ?college=engineering"),
+    cursor: str | None = Query(None, description="직전 응답의 next_cursor. 없으면 첫 페이지."),
+    limit: int = Query(FEED_DEFAULT_LIMIT, ge=1, le=FEED_MAX_LIMIT, description="페이지 크기"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    공지 피드. 최신 게시일순, 커서(keyset) 페이지네이션.
+    무한 스크롤: 응답 next_cursor를 다음 요청 cursor로 전달, null이면 끝.
+    응답은 단과대별 데이터 버전 기준으로 캐시(크롤·AI 반영 시 무효화). ETag·Last-Modified로 조건부 GET(304) 지원.
+    """
+
+    async def build() -> bytes:
+        try:
+            page = await get_notice_feed(session, college_codes=college, cursor=cursor, limit=limit)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return page.model_dump_json().encode()
+
+    return await cached_json_response(
+        request, get_response_cache(), "notices:feed", {"cursor": cursor, "limit": limit}, college, build
+    )
+
+
+@router.get("/search", response_model=NoticeSearchResponse)
+async def get_notice_search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어. 예: ?q=교환학생"),
+    college: list[str] | None = Query(None, description="단과대 코드 필터(반복 가능)"),
+    cursor: str | None = Query(None, description="직전 응답의 next_cursor. 없으면 첫 페이지."),
+    limit: int = Query(FEED_DEFAULT_LIMIT, ge=1, le=FEED_MAX_LIMIT, description="페이지 크기"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    공지 전문 검색 (제목·해시태그·본문). 관련도순, 커서 페이지네이션.
+    한글은 2글자 단위(bigram)로 색인되어 조사·붙여쓰기와 무관하게 부분 일치. 모든 검색어 토큰을 포함한 공지만 반환.
+    응답 캐시·조건부 GET은 피드와 동일.
+    """
+
+    async def build() -> bytes:
+        try:
+            page = await search_notices(session, q, college_codes=college, cursor=cursor, limit=limit)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return page.model_dump_json().encode()
+
+    params = {"q": q.strip(), "cursor": cursor, "limit": limit}
+    return await cached_json_response(request, get_response_cache(), "notices:search", params, college, build)
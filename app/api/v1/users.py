@@ -0,0 +1,51 @@
+"""User API. 내 프로필 저장·맞춤 공지 피드."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_id
+from app.core.database import get_db
+from app.schemas.notice import NoticeFeedResponse
+from app.schemas.user import UserProfile, UserResponse
+from app.services.notice_service import (
+    FEED_DEFAULT_LIMIT,
+    FEED_MAX_LIMIT,
+    InvalidCursorError,
+    get_matched_notice_feed,
+)
+from app.services.user_service import UserNotFoundError, save_profile
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.put("/me/profile", response_model=UserResponse)
+async def put_my_profile(
+    profile: UserProfile,
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db),
+) -> UserResponse:
+    """
+    내 프로필(전공·학년 등) 저장. 저장 후 맞춤 매칭 재계산을 워커에 위임(최근 공지만 재평가).
+    """
+    from app.services.tasks import refresh_user_matches_task
+
+    try:
+        user = await save_profile(session, user_id, profile)
+    except UserNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    refresh_user_matches_task.delay(user.id)
+    return UserResponse.model_validate(user)
+
+
+@router.get("/me/matches", response_model=NoticeFeedResponse)
+async def get_my_matches(
+    cursor: str | None = Query(None, description="직전 응답의 next_cursor. 없으면 첫 페이지."),
+    limit: int = Query(FEED_DEFAULT_LIMIT, ge=1, le=FEED_MAX_LIMIT, description="페이지 크기"),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db),
+) -> NoticeFeedResponse:
+    """맞춤 공지 피드. 프로필과 매칭된 공지를 최신순으로, 커서 페이지네이션."""
+    try:
+        return await get_matched_notice_feed(session, user_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
@@ -0,0 +1,177 @@
+"""
+content-addressed blob 저장소. 키 = 본문 sha256 hex → 같은 이미지는 공지·단과대와 무관하게 1번만 저장.
+공지(Notice.images)에는 base64 대신 {"type": "blob", "key": sha256, ...} 참조만 보관(행 크기·WAL·TOAST 감소).
+백엔드: local(파일시스템, 개발용) | s3(S3 호환 API. MinIO 등 로컬 stand-in도 endpoint_url로 사용).
+컨테이너 파일시스템은 휘발성이므로 APP_ENV가 development가 아니면 s3만 허용(local이면 RuntimeError).
+클라이언트는 참조의 key로 GET /v1/blobs/{key}에서 이미지 본문을 받음.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BLOB_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def blob_key(data: bytes) -> str:
+    """blob 키(sha256 hex)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sniff_image_type(data: bytes) -> str | None:
+    """매직 바이트로 이미지 MIME 추정. 크롤러가 붙인 파일명(img.png 등)은 실제 형식과 다를 수 있음."""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class BlobStore(Protocol):
+    """blob 저장소 인터페이스. put은 멱등(같은 내용이면 같은 키, 재업로드 생략)."""
+
+    def put(self, data: bytes, content_type: str | None = None) -> str: ...
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def exists(self, key: str) -> bool: ...
+
+
+class LocalBlobStore:
+    """파일시스템 백엔드. root/ab/cd/<sha256> 구조, 임시 파일 작성 후 rename으로 원자적 저장."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key[2:4] / key
+
+    def put(self, data: bytes, content_type: str | None = None) -> str:
+        key = blob_key(data)
+        path = self._path(key)
+        if path.exists():
+            return key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return key
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        return path.read_bytes() if path.exists() else None
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+
+class S3BlobStore:
+    """S3 호환 백엔드(boto3). endpoint_url 지정 시 MinIO·R2 등 S3 호환 서버 사용."""
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "blobs/",
+        endpoint_url: str | None = None,
+        region_name: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise RuntimeError("BLOB_STORE_BACKEND=s3 requires boto3 (pip install boto3)") from e
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                region_name=region_name,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+            )
+        self._s3 = client
+        self._bucket = bucket
+        self._prefix = prefix
+
+    def _object_key(self, key: str) -> str:
+        return f"{self._prefix}{key[:2]}/{key}"
+
+    def put(self, data: bytes, content_type: str | None = None) -> str:
+        key = blob_key(data)
+        if self.exists(key):
+            return key
+        self._s3.put_object(
+            Bucket=self._bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=content_type or "application/octet-stream",
+        )
+        return key
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            obj = self._s3.get_object(Bucket=self._bucket, Key=self._object_key(key))
+        except self._s3.exceptions.NoSuchKey:
+            return None
+        data: bytes = obj["Body"].read()
+        return data
+
+    def exists(self, key: str) -> bool:
+        try:
+            self._s3.head_object(Bucket=self._bucket, Key=self._object_key(key))
+        except self._s3.exceptions.ClientError as e:
+            if str(e.response.get("Error", {}).get("Code")) in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+
+_store: BlobStore | None = None
+
+
+def check_blob_store_settings() -> None:
+    """APP_ENV != development에서 local 백엔드면 RuntimeError. 재시작 시 본문이 사라져 참조만 남는 것 방지."""
+    if settings.blob_store_backend != "s3" and settings.app_env != "development":
+        raise RuntimeError(
+            f"BLOB_STORE_BACKEND={settings.blob_store_backend} is for development only "
+            f"(APP_ENV={settings.app_env}); set BLOB_STORE_BACKEND=s3"
+        )
+
+
+def get_blob_store() -> BlobStore:
+    """settings 기준 blob 저장소 (프로세스당 1개). 배포 환경에서 s3가 아니면 RuntimeError."""
+    global _store
+    if _store is None:
+        check_blob_store_settings()
+        if settings.blob_store_backend == "s3":
+            if not settings.s3_bucket:
+                raise RuntimeError("BLOB_STORE_BACKEND=s3 requires S3_BUCKET")
+            _store = S3BlobStore(
+                settings.s3_bucket,
+                endpoint_url=settings.s3_endpoint_url or None,
+                region_name=settings.s3_region or None,
+                access_key_id=settings.s3_access_key_id or None,
+                secret_access_key=settings.s3_secret_access_key or None,
+            )
+        else:
+            _store = LocalBlobStore(settings.blob_store_path)
+    return _store
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
+    # 실행 환경. development 외(production 등)에서는 휘발성 저장소 금지(BLOB_STORE_BACKEND=s3 필수).
+    app_env: str = "development"
+
     # 1단계
     sentry_dsn: str | None = None
 
@@ -32,6 +35,58 @@ class Settings(BaseSettings):
     crawl_trigger_secret: str | None = None
     # 요청/페이지 간 최소 딜레이(초). 대상 서버 부하·IP 차단 완화용. 기본 1.
     polite_delay_seconds: int = 1
+    # 호스트별 적응형 요청 간격(AIMD, 초기값 POLITE_DELAY_SECONDS): 하한·상한, 정상 응답당 감소폭,
+    # 차단·과부하 응답 시 배수, 느린 응답 기준(초), 이보다 오래 막힌 호스트는 대기 대신 크롤 중단(초).
+    crawl_rate_min_delay_seconds: float = 0.5
+    crawl_rate_max_delay_seconds: float = 60.0
+    crawl_rate_decrease_step_seconds: float = 0.1
+    crawl_rate_backoff_factor: float = 2.0
+    crawl_rate_slow_latency_seconds: float = 3.0
+    crawl_rate_max_wait_seconds: float = 120.0
+    # 단과대 1곳 상세 페이지 동시 fetch 상한 (CRAWLER_CONFIG detail_concurrency를 이 값으로 제한). 1이면 순차.
+    crawl_detail_max_concurrency: int = 3
+    # 크롤 스케줄러: 호스트(대학 서버)당 동시 크롤 수, 단과대별 적응형 주기 하한·상한(분), 호스트 lease TTL(초).
+    crawl_host_concurrency: int = 1
+    crawl_min_interval_minutes: int = 30
+    crawl_max_interval_minutes: int = 360
+    crawl_lease_ttl_seconds: int = 3600
+    # 호스트별 서킷 브레이커: 연속 실패 N회면 open, open 유지(초, 탐침·시험 크롤 실패마다 2배·상한),
+    # 탐침 성공 후 closed까지 필요한 연속 크롤 성공 수(그 전 실패는 즉시 재open).
+    crawl_breaker_failure_threshold: int = 3
+    crawl_breaker_open_seconds: int = 900
+    crawl_breaker_max_open_seconds: int = 6 * 3600
+    crawl_breaker_trial_successes: int = 2
+    # 공지 스트리밍 upsert 배치 상한(행 수·payload 바이트). 도달 시 upsert·commit 후 메모리 해제.
+    crawl_upsert_batch_rows: int = 20
+    crawl_upsert_batch_bytes: int = 8 * 1024 * 1024
+    # 크롤러 HTML 파서 백엔드(BeautifulSoup features). lxml 미설치 시 html.parser로 fallback.
+    html_parser_backend: str = "lxml"
+
+    # 공지 인라인(base64) 이미지 blob 저장소. local(개발 전용) | s3(S3 호환: AWS·R2·MinIO 등, 배포 필수).
+    blob_store_backend: str = "local"
+    blob_store_path: str = "data/blobs"
+    s3_bucket: str | None = None
+    s3_endpoint_url: str | None = None
+    s3_region: str | None = None
+    s3_access_key_id: str | None = None
+    s3_secret_access_key: str | None = None
+
+    # 4단계 AI 추출: 태스크 1개가 처리할 공지 수, 모델 호출 속도(워커 전체 공유, Redis 슬롯)
+    ai_batch_size: int = 20
+    ai_rate_limit_per_minute: int = 10
+    ai_rate_limit_burst: int = 1
+    # Gemini 구조화 출력 추출. API 키 미설정이면 AI 추출 없음(배치 태스크는 조회만 하고 종료).
+    gemini_api_key: str = ""
+    gemini_model: str = "gemini-2.5-flash"
+    gemini_timeout_seconds: float = 60.0
+
+    # 유저↔공지 매칭: 프로필 수정 시 재평가할 최근 공지 기간(published_at 기준, 일)
+    match_active_days: int = 90
+
+    # 공개 조회 API 응답 캐시(메모리 LRU + Redis). 단과대별 데이터 버전으로 무효화, TTL은 버전 갱신 실패 대비 상한.
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 3600
+    response_cache_local_max_entries: int = 512
 
     # 6단계 CORS
     allowed_origins: str = ""
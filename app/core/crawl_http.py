@@ -1,14 +1,27 @@
 """
 크롤러 공통 HTTP 래퍼. OOM 방지: Content-Length fail-fast + 무조건 stream chunking.
 악의적 서버가 Content-Length를 속여도 누적 바이트 캡으로 방어.
+워커 프로세스당 호스트별 requests.Session(keep-alive 커넥션 풀) 재사용 + ETag/Last-Modified 조건부 GET.
+비동기 엔진: AsyncCrawlClient(httpx) + AsyncHostThrottle(호스트별 토큰 버킷)로 여러 단과대 동시 크롤.
 """
 
+import asyncio
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlparse
 
+import httpx
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 
+from app.core.crawl_rate import HostRateController
 from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.metrics import CRAWL_FETCH_BYTES, CRAWL_FETCH_DURATION, CRAWL_FETCH_RESULTS
 
 logger = logging.getLogger(__name__)
 
@@ -17,29 +30,142 @@ DEFAULT_MAX_HTML_BYTES = 5 * 1024 * 1024
 DEFAULT_TIMEOUT = 10
 CHUNK_SIZE = 64 * 1024
 
+# 호스트당 커넥션 풀 크기. 단과대 1곳 = 호스트 1개이므로 작게 유지.
+POOL_MAXSIZE = 4
+
+# 조건부 GET 검증자 저장소 상한. 304 응답 시 재사용할 본문을 함께 보관하므로 바이트 기준으로도 제한.
+VALIDATOR_STORE_MAX_ENTRIES = 2000
+VALIDATOR_STORE_MAX_BYTES = 32 * 1024 * 1024
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
 
 class HtmlTooLargeError(Exception):
     """응답 본문이 max_bytes를 초과함 (OOM 방지)."""
     pass
 
 
-def fetch_html(
-    url: str,
-    *,
-    max_bytes: int = DEFAULT_MAX_HTML_BYTES,
-    timeout: int = DEFAULT_TIMEOUT,
-    headers: dict[str, Any] | None = None,
-) -> str:
+@dataclass
+class _Validator:
+    """URL 1건의 조건부 GET 검증자와 마지막 본문(바이트)."""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    content_type: str | None
+
+
+class ValidatorStore:
     """
-    URL에서 HTML 문자열을 안전하게 가져옴.
-    - Content-Length가 있으면 max_bytes 초과 시 본문 읽기 전에 HtmlTooLargeError.
-    - 실제 읽기는 무조건 stream + iter_content; 누적이 max_bytes 초과 시 즉시 close 후 HtmlTooLargeError.
+    ETag/Last-Modified 검증자 LRU 저장소 (프로세스 메모리, 스레드 안전).
+    304 Not Modified 시 보관한 본문을 돌려줘 크롤러는 변경 여부와 무관하게 동일하게 파싱.
     """
-    h = headers or CRAWLER_HEADERS
-    resp = requests.get(url, headers=h, timeout=timeout, stream=True)
-    resp.raise_for_status()
 
-    # Fail-fast: Content-Length가 있고 초과하면 본문 읽지 않음
+    def __init__(
+        self,
+        max_entries: int = VALIDATOR_STORE_MAX_ENTRIES,
+        max_bytes: int = VALIDATOR_STORE_MAX_BYTES,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Validator] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> _Validator | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, url: str, entry: _Validator) -> None:
+        if not entry.etag and not entry.last_modified:
+            return
+        if len(entry.body) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._bytes -= len(old.body)
+            self._entries[url] = entry
+            self._bytes += len(entry.body)
+            while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+
+    def discard(self, url: str) -> None:
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._bytes -= len(old.body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+validator_store = ValidatorStore()
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+# 세션 전송 계층 교체(벤치마크 녹화·재생용, scripts/crawl_replay.py). None이면 호스트별 HTTPAdapter 커넥션 풀.
+_transport: BaseAdapter | None = None
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).netloc or "").lower()
+
+
+def get_session(url: str) -> requests.Session:
+    """호스트별 requests.Session (keep-alive 커넥션 풀). 워커 프로세스 안에서 재사용."""
+    host = host_of(url)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = _transport or HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def close_sessions() -> None:
+    """모든 호스트 세션 종료. prefork 워커 자식 프로세스 시작 시·테스트에서 호출."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def set_transport(adapter: BaseAdapter | None) -> None:
+    """
+    이후 fetch_html이 adapter로 요청을 보내도록 교체(None이면 기본 복원). 기존 세션·검증자는 비움.
+    scripts/crawl_replay.py의 녹화·재생 어댑터로 크롤러 모듈을 네트워크 없이 그대로 실행할 때 사용.
+    """
+    global _transport
+    close_sessions()
+    validator_store.clear()
+    with _sessions_lock:
+        _transport = adapter
+
+
+def _decode(body: bytes, content_type: str | None, encoding: str | None) -> str:
+    """encoding 명시 > Content-Type charset > UTF-8 순으로 디코딩."""
+    if not encoding and content_type:
+        match = _CHARSET_RE.search(content_type)
+        if match:
+            encoding = match.group(1)
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _read_capped(resp: requests.Response, max_bytes: int) -> bytes:
+    """Content-Length fail-fast 후 stream chunking. 누적이 max_bytes 초과 시 HtmlTooLargeError."""
     cl = resp.headers.get("Content-Length")
     if cl:
         try:
@@ -61,5 +187,260 @@ def fetch_html(
                 chunks.append(chunk)
     finally:
         resp.close()
+    return b"".join(chunks)
 
-    return b"".join(chunks).decode("utf-8", errors="replace")
+
+@dataclass(frozen=True)
+class FetchInfo:
+    """fetch 1건 계측값 (crawl_runs.stats용). 304면 bytes_read=0."""
+
+    bytes_read: int
+    not_modified: bool
+
+
+def _record_fetch_metrics(host: str, started: float, info: FetchInfo | None) -> None:
+    """호스트별 fetch 지연·바이트·결과 메트릭 (/internal/metrics). info가 None이면 실패(4xx/5xx·타임아웃·초과)."""
+    CRAWL_FETCH_DURATION.observe(time.perf_counter() - started, host=host)
+    if info is None:
+        CRAWL_FETCH_RESULTS.inc(host=host, result="error")
+        return
+    CRAWL_FETCH_BYTES.inc(info.bytes_read, host=host)
+    CRAWL_FETCH_RESULTS.inc(host=host, result="not_modified" if info.not_modified else "ok")
+
+
+def fetch_html(
+    url: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_HTML_BYTES,
+    timeout: int = DEFAULT_TIMEOUT,
+    headers: dict[str, Any] | None = None,
+    encoding: str | None = None,
+    conditional: bool = True,
+) -> str:
+    """
+    URL에서 HTML 문자열을 안전하게 가져옴.
+    - 호스트별 pooled Session 사용(TCP·TLS 핸드셰이크 재사용).
+    - conditional=True면 저장된 ETag/Last-Modified로 조건부 GET. 304면 보관 본문 반환.
+    - Content-Length가 있으면 max_bytes 초과 시 본문 읽기 전에 HtmlTooLargeError.
+    - 실제 읽기는 무조건 stream + iter_content; 누적이 max_bytes 초과 시 즉시 close 후 HtmlTooLargeError.
+    - encoding: 사이트 인코딩 강제(예: 경영대 cp949). 없으면 Content-Type charset, 그다음 UTF-8.
+    - 4xx/5xx는 requests.HTTPError(RequestException).
+    """
+    html, _ = fetch_html_with_info(
+        url, max_bytes=max_bytes, timeout=timeout, headers=headers, encoding=encoding, conditional=conditional
+    )
+    return html
+
+
+def fetch_html_with_info(
+    url: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_HTML_BYTES,
+    timeout: int = DEFAULT_TIMEOUT,
+    headers: dict[str, Any] | None = None,
+    encoding: str | None = None,
+    conditional: bool = True,
+    rate: HostRateController | None = None,
+) -> tuple[str, FetchInfo]:
+    """
+    fetch_html과 같고 (HTML, 읽은 바이트·304 여부)를 함께 반환. 크롤 단계별 계측용.
+    rate가 있으면 응답 상태·지연·Retry-After(타임아웃·연결 오류는 상태 없음)로 호스트 간격 조정.
+    """
+    host = host_of(url)
+    started = time.perf_counter()
+    info: FetchInfo | None = None
+    status: int | None = None
+    retry_after: str | None = None
+    try:
+        html, info = _fetch_sync(
+            url, max_bytes=max_bytes, timeout=timeout, headers=headers, encoding=encoding, conditional=conditional
+        )
+        status = 304 if info.not_modified else 200
+    except requests.HTTPError as e:
+        if e.response is not None:
+            status = e.response.status_code
+            retry_after = e.response.headers.get("Retry-After")
+        raise
+    except HtmlTooLargeError:
+        status = 200  # 서버는 정상 응답
+        raise
+    finally:
+        _record_fetch_metrics(host, started, info)
+        if rate is not None:
+            rate.observe(host, status=status, latency=time.perf_counter() - started, retry_after_header=retry_after)
+    return html, info
+
+
+def probe_url(url: str, *, timeout: int = 10) -> bool:
+    """
+    호스트 생존 확인용 가벼운 요청 (서킷 브레이커 half_open 탐침). 본문은 읽지 않고 닫음.
+    2xx·3xx면 True, 4xx/5xx·타임아웃·연결 오류면 False.
+    """
+    try:
+        resp = get_session(url).get(url, headers=dict(CRAWLER_HEADERS), timeout=timeout, stream=True)
+    except requests.RequestException:
+        return False
+    resp.close()
+    return resp.status_code < 400
+
+
+def _fetch_sync(
+    url: str,
+    *,
+    max_bytes: int,
+    timeout: int,
+    headers: dict[str, Any] | None,
+    encoding: str | None,
+    conditional: bool,
+) -> tuple[str, FetchInfo]:
+    h = dict(headers or CRAWLER_HEADERS)
+    cached = validator_store.get(url) if conditional else None
+    if cached is not None:
+        if cached.etag:
+            h["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            h["If-Modified-Since"] = cached.last_modified
+
+    resp = get_session(url).get(url, headers=h, timeout=timeout, stream=True)
+    if resp.status_code == 304 and cached is not None:
+        resp.close()
+        logger.debug("fetch_html 304 Not Modified: url=%s", url[:200])
+        return _decode(cached.body, cached.content_type, encoding), FetchInfo(bytes_read=0, not_modified=True)
+    if resp.status_code >= 400:
+        resp.close()
+        validator_store.discard(url)
+    resp.raise_for_status()
+
+    body = _read_capped(resp, max_bytes)
+    content_type = resp.headers.get("Content-Type")
+    if conditional:
+        validator_store.put(
+            url,
+            _Validator(
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+                body=body,
+                content_type=content_type,
+            ),
+        )
+    return _decode(body, content_type, encoding), FetchInfo(bytes_read=len(body), not_modified=False)
+
+
+class AsyncHostThrottle:
+    """
+    호스트별 토큰 버킷(용량 1, interval초마다 1개 충전). 같은 호스트에는 interval 간격으로 최대 1회 요청,
+    서로 다른 호스트는 서로 기다리지 않음. 한 이벤트 루프 안에서만 사용.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = max(0.0, interval)
+        self._next_at: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def wait(self, host: str) -> float:
+        """host 토큰 획득까지 대기. 반환: 실제 대기한 초."""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._next_at.get(host, 0.0) - loop.time())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_at[host] = loop.time() + self._interval
+            return delay
+
+
+class AsyncCrawlClient:
+    """
+    비동기 크롤 HTTP 클라이언트 (httpx.AsyncClient 1개 = 호스트별 keep-alive 풀).
+    fetch_html과 동일 규칙: 조건부 GET(ValidatorStore 공유), 바이트 캡, 인코딩 우선순위.
+    타임아웃·취소 시 소켓까지 정리되므로 to_thread처럼 고아 스레드가 남지 않음.
+    사용: async with AsyncCrawlClient(throttle) as client: html = await client.fetch_html(url)
+    """
+
+    def __init__(
+        self,
+        throttle: AsyncHostThrottle | None = None,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_bytes: int = DEFAULT_MAX_HTML_BYTES,
+    ) -> None:
+        self._throttle = throttle
+        self._max_bytes = max_bytes
+        self._client = httpx.AsyncClient(
+            headers=CRAWLER_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=POOL_MAXSIZE * 8, max_connections=POOL_MAXSIZE * 8),
+        )
+
+    async def __aenter__(self) -> "AsyncCrawlClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def fetch_html(
+        self,
+        url: str,
+        *,
+        encoding: str | None = None,
+        conditional: bool = True,
+    ) -> str:
+        """URL HTML을 비동기로 가져옴. 4xx/5xx는 httpx.HTTPStatusError, 초과 시 HtmlTooLargeError."""
+        host = host_of(url)
+        if self._throttle is not None:
+            await self._throttle.wait(host)
+        started = time.perf_counter()
+        info: FetchInfo | None = None
+        try:
+            html, info = await self._fetch(url, encoding=encoding, conditional=conditional)
+        finally:
+            _record_fetch_metrics(host, started, info)
+        return html
+
+    async def _fetch(self, url: str, *, encoding: str | None, conditional: bool) -> tuple[str, FetchInfo]:
+        h: dict[str, str] = {}
+        cached = validator_store.get(url) if conditional else None
+        if cached is not None:
+            if cached.etag:
+                h["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                h["If-Modified-Since"] = cached.last_modified
+
+        async with self._client.stream("GET", url, headers=h) as resp:
+            if resp.status_code == 304 and cached is not None:
+                return _decode(cached.body, cached.content_type, encoding), FetchInfo(bytes_read=0, not_modified=True)
+            if resp.status_code >= 400:
+                validator_store.discard(url)
+            resp.raise_for_status()
+
+            cl = resp.headers.get("Content-Length")
+            if cl:
+                try:
+                    if int(cl) > self._max_bytes:
+                        raise HtmlTooLargeError(f"Content-Length {cl} > max_bytes {self._max_bytes}")
+                except ValueError:
+                    pass
+            accumulated = 0
+            chunks: list[bytes] = []
+            async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                accumulated += len(chunk)
+                if accumulated > self._max_bytes:
+                    raise HtmlTooLargeError(f"Accumulated {accumulated} > max_bytes {self._max_bytes}")
+                chunks.append(chunk)
+            body = b"".join(chunks)
+            content_type = resp.headers.get("Content-Type")
+            if conditional:
+                validator_store.put(
+                    url,
+                    _Validator(
+                        etag=resp.headers.get("ETag"),
+                        last_modified=resp.headers.get("Last-Modified"),
+                        body=body,
+                        content_type=content_type,
+                    ),
+                )
+        return _decode(body, content_type, encoding), FetchInfo(bytes_read=len(body), not_modified=False)
@@ -0,0 +1,281 @@
+"""
+호스트별 적응형 요청 간격 (AIMD). 고정 POLITE_DELAY_SECONDS 대신 응답을 보고 호스트마다 간격을 조절.
+- 정상·빠른 응답: 간격 -step (가산 감소 → 건강한 호스트는 점점 빠르게, 하한 min_delay)
+- 403·429·502·503·504·타임아웃·연결 오류: 간격 ×factor (승산 증가, 상한 max_delay). WAF 차단 전조에 즉시 후퇴.
+- 느린 응답(slow_latency 초과): 간격 ×(1 + (factor-1)/2) (절반 세기 후퇴)
+- Retry-After: 그 시각까지 해당 호스트 요청 보류(blocked_until), 간격도 최소 그만큼으로.
+상태는 Redis 해시 crawl:rate:<host>(delay·next_at·blocked_until)에 두어 모든 워커가 같은 간격을 따름.
+다음 요청 시각 예약은 Lua 1회(서버 TIME 기준)로 원자적. REDIS_URL 미설정 시 프로세스 메모리 상태.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from typing import Any, Protocol, cast
+
+import redis
+
+from app.core.config import settings
+from app.core.metrics import CRAWL_RATE_DELAY
+
+logger = logging.getLogger(__name__)
+
+RATE_KEY_PREFIX = "crawl:rate:"
+# 마지막 갱신 후 이 시간이 지나면 호스트 상태 초기화(초기 간격부터 다시)
+RATE_STATE_TTL_SECONDS = 24 * 3600
+# 후퇴 신호로 보는 상태 코드 (차단·과부하). 404 등 나머지 4xx/5xx는 간격에 영향 없음.
+BACKOFF_STATUSES = frozenset({403, 429, 502, 503, 504})
+
+
+class HostBackoffError(Exception):
+    """
+    호스트가 Retry-After·최대 간격 때문에 max_wait초 넘게 막혀 있음. 크롤을 미루고 나중에 재시도.
+    retry_after: 호스트 차례까지 남은 초(재시도 countdown).
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f"host {host} backed off for {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RateParams:
+    initial_delay: float
+    min_delay: float
+    max_delay: float
+    step: float
+    factor: float
+    slow_latency: float
+    max_wait: float
+
+
+def default_rate_params() -> RateParams:
+    """settings 기준 (초기 간격 = POLITE_DELAY_SECONDS)."""
+    return RateParams(
+        initial_delay=float(settings.polite_delay_seconds),
+        min_delay=settings.crawl_rate_min_delay_seconds,
+        max_delay=settings.crawl_rate_max_delay_seconds,
+        step=settings.crawl_rate_decrease_step_seconds,
+        factor=settings.crawl_rate_backoff_factor,
+        slow_latency=settings.crawl_rate_slow_latency_seconds,
+        max_wait=settings.crawl_rate_max_wait_seconds,
+    )
+
+
+def parse_retry_after(value: str | None, now: float) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date) → 남은 초. 없거나 해석 불가면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=UTC)
+    return max(0.0, at.timestamp() - now)
+
+
+def adjust_delay(
+    delay: float,
+    params: RateParams,
+    *,
+    status: int | None,
+    latency: float,
+    retry_after: float | None = None,
+) -> float:
+    """
+    응답 1건 → 새 간격 (AIMD). status None은 타임아웃·연결 오류(응답 없음).
+    결과는 [min_delay, max_delay]. Retry-After는 간격 하한으로 쓰고(max_delay까지), 그 시각까지의 보류는
+    blocked_until로 따로 처리.
+    """
+    if status is None or status in BACKOFF_STATUSES:
+        new = delay * params.factor
+        if retry_after is not None:
+            new = max(new, retry_after)
+    elif latency > params.slow_latency:
+        new = delay * (1 + (params.factor - 1) / 2)
+    elif status < 400:
+        new = delay - params.step
+    else:
+        new = delay
+    return min(params.max_delay, max(params.min_delay, new))
+
+
+class RateState(Protocol):
+    def reserve(self, host: str, default_delay: float, max_wait: float) -> float:
+        """다음 요청 시각 예약 후 대기할 초. max_wait 초과면 예약하지 않고 그 값 반환."""
+        ...
+
+    def get_delay(self, host: str) -> float | None: ...
+
+    def update(self, host: str, delay: float, blocked_for: float | None) -> None: ...
+
+
+# KEYS[1]=호스트 키, ARGV=[기본 간격, max_wait, TTL]. 반환: 대기 초(문자열).
+_RESERVE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local delay = tonumber(redis.call('HGET', KEYS[1], 'delay') or ARGV[1])
+local next_at = tonumber(redis.call('HGET', KEYS[1], 'next_at') or '0')
+local blocked = tonumber(redis.call('HGET', KEYS[1], 'blocked_until') or '0')
+local start = math.max(now, next_at, blocked)
+local wait = start - now
+if wait <= tonumber(ARGV[2]) then
+  redis.call('HSET', KEYS[1], 'next_at', tostring(start + delay))
+  redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return tostring(wait)
+"""
+
+
+# KEYS[1]=호스트 키, ARGV=[새 간격, 보류 초(0이면 없음), TTL]. blocked_until은 reserve와 같은 서버 TIME 기준.
+_UPDATE_LUA = """
+redis.call('HSET', KEYS[1], 'delay', ARGV[1])
+local blocked_for = tonumber(ARGV[2])
+if blocked_for > 0 then
+  local t = redis.call('TIME')
+  local blocked = tonumber(t[1]) + tonumber(t[2]) / 1000000 + blocked_for
+  if blocked > tonumber(redis.call('HGET', KEYS[1], 'blocked_until') or '0') then
+    redis.call('HSET', KEYS[1], 'blocked_until', tostring(blocked))
+  end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class RedisRateState:
+    """
+    워커 공유 상태 (Redis 해시). delay 갱신은 HSET(같은 호스트 동시 크롤은 스케줄러가 제한하므로 경합 드묾).
+    시각(next_at·blocked_until)은 모두 Lua 안에서 Redis 서버 TIME으로 계산 — 워커·Redis 간 시계 차이와 무관.
+    """
+
+    def __init__(self, client: redis.Redis) -> None:
+        self._r = client
+        self._reserve = client.register_script(_RESERVE_LUA)
+        self._update = client.register_script(_UPDATE_LUA)
+
+    def reserve(self, host: str, default_delay: float, max_wait: float) -> float:
+        wait = self._reserve(keys=[f"{RATE_KEY_PREFIX}{host}"], args=[default_delay, max_wait, RATE_STATE_TTL_SECONDS])
+        return float(cast(Any, wait))
+
+    def get_delay(self, host: str) -> float | None:
+        value = self._r.hget(f"{RATE_KEY_PREFIX}{host}", "delay")
+        return float(cast(Any, value)) if value is not None else None
+
+    def update(self, host: str, delay: float, blocked_for: float | None) -> None:
+        self._update(keys=[f"{RATE_KEY_PREFIX}{host}"], args=[delay, blocked_for or 0, RATE_STATE_TTL_SECONDS])
+
+
+class MemoryRateState:
+    """프로세스 메모리 상태 (REDIS_URL 미설정·테스트). RedisRateState와 같은 규칙."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._hosts: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def reserve(self, host: str, default_delay: float, max_wait: float) -> float:
+        with self._lock:
+            state = self._hosts.setdefault(host, {})
+            now = self._clock()
+            start = max(now, state.get("next_at", 0.0), state.get("blocked_until", 0.0))
+            wait = start - now
+            if wait <= max_wait:
+                state["next_at"] = start + state.get("delay", default_delay)
+            return wait
+
+    def get_delay(self, host: str) -> float | None:
+        with self._lock:
+            return self._hosts.get(host, {}).get("delay")
+
+    def update(self, host: str, delay: float, blocked_for: float | None) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, {})
+            state["delay"] = delay
+            if blocked_for:
+                state["blocked_until"] = max(state.get("blocked_until", 0.0), self._clock() + blocked_for)
+
+
+class HostRateController:
+    """
+    호스트별 요청 간격 제어. wait(host)로 차례를 기다리고, 응답마다 observe(...)로 간격 조정.
+    crawl_college_sync가 요청 전 wait, crawl_http.fetch_html_with_info(rate=...)가 응답 후 observe.
+    """
+
+    def __init__(
+        self,
+        state: RateState,
+        params: RateParams,
+        *,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._state = state
+        self.params = params
+        self._clock = clock
+        self._sleep = sleep
+
+    def delay(self, host: str) -> float:
+        value = self._state.get_delay(host)
+        return self.params.initial_delay if value is None else value
+
+    def wait(self, host: str) -> float:
+        """host 차례까지 대기. 반환: 대기한 초. max_wait 넘게 막혀 있으면 HostBackoffError."""
+        try:
+            wait = self._state.reserve(host, self.params.initial_delay, self.params.max_wait)
+        except redis.RedisError:
+            logger.warning("crawl rate: reserve failed host=%s, using initial delay", host, exc_info=True)
+            wait = self.params.initial_delay
+        if wait > self.params.max_wait:
+            raise HostBackoffError(host, wait)
+        if wait > 0:
+            self._sleep(wait)
+        return max(0.0, wait)
+
+    def observe(
+        self, host: str, *, status: int | None, latency: float, retry_after_header: str | None = None
+    ) -> float:
+        """응답 1건 반영. 반환: 새 간격(초). Redis 오류는 로그만(간격 유지)."""
+        retry_after = parse_retry_after(retry_after_header, self._clock())
+        try:
+            current = self.delay(host)
+            new = adjust_delay(current, self.params, status=status, latency=latency, retry_after=retry_after)
+            if new != current or retry_after:
+                self._state.update(host, new, retry_after)
+        except redis.RedisError:
+            logger.warning("crawl rate: update failed host=%s", host, exc_info=True)
+            return self.params.initial_delay
+        if new > current:
+            logger.info(
+                "crawl rate backoff: host=%s status=%s latency=%.2fs delay %.2f→%.2fs retry_after=%s",
+                host, status, latency, current, new, retry_after,
+            )
+        CRAWL_RATE_DELAY.set(new, host=host)
+        return new
+
+
+_controller: HostRateController | None = None
+
+
+def get_rate_controller() -> HostRateController:
+    """워커 프로세스용 컨트롤러 (프로세스당 1개). REDIS_URL이 있으면 워커 공유 상태."""
+    global _controller
+    if _controller is None:
+        state: RateState
+        if settings.redis_url:
+            kwargs: dict[str, Any] = {"ssl_cert_reqs": None} if settings.redis_url.startswith("rediss://") else {}
+            state = RedisRateState(redis.Redis.from_url(settings.redis_url, decode_responses=True, **kwargs))
+        else:
+            state = MemoryRateState()
+        _controller = HostRateController(state, default_rate_params())
+    return _controller
+
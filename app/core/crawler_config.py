@@ -3,12 +3,18 @@
 CAUTIONS: 코드를 수정하지 않고 config만 수정하여 대응 가능하도록 설계.
 college.external_id(또는 college_code) -> config 키(모듈명) 매핑. 디스패처에서 사용.
 레지스트리 패턴: get_crawler(module_name)으로 (get_links_fn, scrape_fn) 반환.
+detail_concurrency(선택, 기본 1): 워커 크롤에서 상세 페이지 동시 fetch 수. 같은 호스트 요청 간격은 그대로 유지.
+pagination(선택): 목록 여러 페이지 크롤. param(페이지 쿼리 이름), offset(True면 값 = 페이지×size, 아니면
+first부터 1씩), size_param·size(페이지 크기 쿼리), max_pages(일반 크롤 최대 페이지). 없으면 첫 페이지만.
+첫 페이지 URL은 항상 url 그대로(조건부 GET·fixture 키 유지), 다음 페이지부터 list_page_url로 생성.
+get_parsers(module_name)는 네트워크 없는 (parse_links_fn, parse_detail_fn) 반환(비동기 엔진·벤치마크용).
 크롤러 모듈은 지연 임포트(순환 임포트 회피).
 """
 
 import importlib
 from collections.abc import Callable
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 # 데이터센터 IP·WAF 차단 완화: 실제 Chrome 브라우저 User-Agent 사용. Python 기본 UA 사용 금지.
 CRAWLER_HEADERS = {
@@ -38,45 +44,71 @@ CRAWLER_CONFIG: dict[str, dict[str, Any]] = {
         "url": "https://engineering.yonsei.ac.kr/engineering/board/notice.do?mode=list&articleLimit=10",
         "get_links": "get_notice_links",
         "scrape_detail": "scrape_yonsei_engineering_precise",
+        "parse_links": "parse_notice_links",
+        "parse_detail": "parse_yonsei_engineering_detail",
         "type": "TYPE_A_LIST_NUM",
         "selectors": {"row": "tbody tr", "link": "a"},
+        "detail_concurrency": 2,
+        "pagination": {
+            "param": "article.offset",
+            "offset": True,
+            "size_param": "articleLimit",
+            "size": 10,
+            "max_pages": 5,
+        },
     },
-    # 나머지 단과대: url·get_links·scrape_detail은 크롤러 모듈과 일치.
+    # 나머지 단과대: url·get_links·scrape_detail·parse_*는 크롤러 모듈과 일치.
     "yonsei_science": {
         "name": "이과대학",
         "url": "http://science.yonsei.ac.kr/community/notice",
         "get_links": "get_science_links",
         "scrape_detail": "scrape_science_detail",
+        "parse_links": "parse_science_links",
+        "parse_detail": "parse_science_detail",
     },
     "yonsei_medicine": {
         "name": "의과대학",
         "url": "https://medicine.yonsei.ac.kr/medicine/news/notice.do",
         "get_links": "get_medicine_notice_links",
         "scrape_detail": "scrape_medicine_detail",
+        "parse_links": "parse_medicine_notice_links",
+        "parse_detail": "parse_medicine_detail",
+        "detail_concurrency": 2,
     },
     "yonsei_ai": {
         "name": "인공지능융합대학",
         "url": "https://computing.yonsei.ac.kr/bbs/board.php?bo_table=sub4_4",
         "get_links": "get_computing_notice_links",
         "scrape_detail": "scrape_computing_detail",
+        "parse_links": "parse_computing_notice_links",
+        "parse_detail": "parse_computing_detail",
+        "pagination": {"param": "page", "first": 1, "max_pages": 5},  # 그누보드
     },
     "yonsei_glc": {
         "name": "글로벌인재대학",
         "url": "https://glc.yonsei.ac.kr/notice/?mod=list",
         "get_links": "get_glc_links",
         "scrape_detail": "scrape_glc_detail",
+        "parse_links": "parse_glc_links",
+        "parse_detail": "parse_glc_detail",
+        "pagination": {"param": "pageid", "first": 1, "max_pages": 5},  # KBoard
     },
     "yonsei_underwood": {
         "name": "언더우드국제대학",
         "url": "https://uic.yonsei.ac.kr/main/news.php?mid=m06_01_01",
         "get_links": "get_uic_links",
         "scrape_detail": "scrape_uic_detail",
+        "parse_links": "parse_uic_links",
+        "parse_detail": "parse_uic_detail",
     },
     "yonsei_business": {
         "name": "경영대학",
         "url": "https://ysb.yonsei.ac.kr/board.asp?mid=m06_01",
         "get_links": "get_business_notice_links",
         "scrape_detail": "scrape_business_detail",
+        "parse_links": "parse_business_notice_links",
+        "parse_detail": "parse_business_detail",
+        "encoding": "cp949",  # 경영대 게시판 CP949/EUC-KR (인코딩 오진 방지)
     },
 }
 
@@ -97,3 +129,55 @@ def get_crawler(module_name: str) -> tuple[Callable[..., list], Callable[..., tu
     if not get_links_fn or not scrape_fn:
         raise ValueError(f"Module {module_name} missing {get_links_name} or {scrape_name}")
     return (get_links_fn, scrape_fn)
+
+
+def get_parsers(module_name: str) -> tuple[Callable[..., list], Callable[..., tuple]]:
+    """
+    CRAWLER_CONFIG 기준으로 (parse_links_fn, parse_detail_fn) 반환. 시그니처: fn(html, url).
+    HTTP는 호출 측(비동기 엔진 등)이 담당하고 크롤러 모듈은 파싱만 수행.
+    """
+    config = CRAWLER_CONFIG.get(module_name)
+    if not config:
+        raise ValueError(f"No crawler config for module: {module_name}")
+    parse_links_name = config.get("parse_links")
+    parse_detail_name = config.get("parse_detail")
+    if not parse_links_name or not parse_detail_name:
+        raise ValueError(f"Module {module_name} has no parse_links/parse_detail config")
+    mod = importlib.import_module(f"app.services.crawlers.{module_name}")
+    parse_links_fn = getattr(mod, parse_links_name, None)
+    parse_detail_fn = getattr(mod, parse_detail_name, None)
+    if not parse_links_fn or not parse_detail_fn:
+        raise ValueError(f"Module {module_name} missing {parse_links_name} or {parse_detail_name}")
+    return (parse_links_fn, parse_detail_fn)
+
+
+def get_crawl_host(module_name: str) -> str:
+    """모듈의 목록 URL 호스트(예: engineering.yonsei.ac.kr). 호스트별 polite 스케줄링 키."""
+    config = CRAWLER_CONFIG.get(module_name) or {}
+    return (urlparse(config.get("url") or "").netloc or "").lower()
+
+
+def list_page_url(config: dict[str, Any], page: int) -> str:
+    """
+    목록 page번째(0부터) 페이지 URL. 0이면 config url 그대로. pagination 미설정인데 page>0이면 ValueError.
+    """
+    url: str = config["url"]
+    if page == 0:
+        return url
+    pagination = config.get("pagination")
+    if not pagination:
+        raise ValueError(f"No pagination config for: {url}")
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    size = int(pagination.get("size") or 0)
+    if pagination.get("size_param") and size:
+        query[pagination["size_param"]] = str(size)
+    value = page * size if pagination.get("offset") else int(pagination.get("first", 1)) + page
+    query[pagination["param"]] = str(value)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def get_max_list_pages(config: dict[str, Any]) -> int:
+    """일반 크롤에서 읽을 최대 목록 페이지 수 (pagination max_pages, 미설정이면 1)."""
+    pagination = config.get("pagination") or {}
+    return max(1, int(pagination.get("max_pages") or 1))
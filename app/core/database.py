@@ -8,6 +8,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.metrics import instrument_pool
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ def init_db() -> None:
         echo=False,
         pool_pre_ping=True,
     )
+    instrument_pool(engine.sync_engine.pool, "async")
     async_session_maker = async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -11,6 +11,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import instrument_pool
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ def init_sync_db() -> None:
         pool_size=2,
         max_overflow=0,
     )
+    instrument_pool(sync_engine.pool, "sync")
     sync_session_factory = sessionmaker(
         bind=sync_engine,
         autocommit=False,
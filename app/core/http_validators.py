@@ -0,0 +1,161 @@
+"""
+HTTP 조건부 GET (ETag / Last-Modified → 304). 폴링 클라이언트가 변경 없는 응답을 다시 받지 않도록.
+- 공개 조회(피드·검색·달력 공지 일정): response_cache.CacheSlot의 버전 기반 검증자로 본문 생성 전에 304 판단.
+- 그 외 GET JSON 응답: ConditionalGetMiddleware가 본문 해시로 ETag를 붙이고 If-None-Match 일치 시 304
+  (DB 조회·직렬화는 이미 끝났지만 전송량은 0).
+If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.2.2).
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.response_cache import ResponseCache
+
+# 본문 해시 ETag를 붙일 최대 크기. 넘으면 버퍼링 없이 그대로 전송.
+ETAG_MAX_BODY_BYTES = 1024 * 1024
+# 304 응답에 유지할 헤더 (본문 관련 헤더는 제외)
+_NOT_MODIFIED_KEEP = ("etag", "last-modified", "cache-control", "vary", "expires")
+
+
+def body_etag(body: bytes) -> str:
+    """응답 본문 → weak ETag."""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """If-None-Match(쉼표 목록·`*`)에 etag가 있는지 (weak 비교)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(t) == target for t in if_none_match.split(","))
+
+
+def http_date(dt: datetime) -> str:
+    return format_datetime(dt, usegmt=True)
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str | None, last_modified: datetime | None) -> bool:
+    """요청 헤더 기준 304 여부. If-None-Match 우선, 없을 때만 If-Modified-Since(초 단위 비교)."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    since = headers.get("if-modified-since")
+    if not since or last_modified is None:
+        return False
+    try:
+        since_dt = parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+    if since_dt.tzinfo is None:
+        return False
+    return int(last_modified.timestamp()) <= int(since_dt.timestamp())
+
+
+def validator_headers(etag: str | None, last_modified: datetime | None) -> dict[str, str]:
+    """응답에 붙일 검증자 헤더. no-cache = 저장은 하되 매번 재검증(폴링 시 304)."""
+    headers = {"Cache-Control": "no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+async def cached_json_response(
+    request: Request,
+    cache: ResponseCache,
+    namespace: str,
+    params: Mapping[str, Any],
+    college_codes: Collection[str] | None,
+    build: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """
+    버전 기반 캐시 + 조건부 GET. 검증자가 일치하면 본문 생성·캐시 조회 없이 304,
+    아니면 캐시된(없으면 build한) JSON 바이트를 검증자 헤더와 함께 반환.
+    """
+    slot = await cache.slot(namespace, params, college_codes)
+    headers = validator_headers(slot.etag, slot.last_modified) if slot.key else {}
+    if slot.key and is_not_modified(request.headers, slot.etag, slot.last_modified):
+        return Response(status_code=304, headers=headers)
+    body = await cache.fetch(slot, build)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ConditionalGetMiddleware:
+    """
+    GET 200 JSON 응답에 ETag가 없으면 본문 해시 ETag를 붙이고, If-None-Match 일치 시 304로 교체 (ASGI).
+    라우트가 이미 ETag를 붙인 응답(버전 기반)은 손대지 않음. ETAG_MAX_BODY_BYTES 초과 본문은 그대로 통과.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int = ETAG_MAX_BODY_BYTES) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        if_none_match = next((v.decode("latin-1") for k, v in scope["headers"] if k == b"if-none-match"), None)
+        start: Message | None = None
+        chunks: list[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def _flush_buffer() -> None:
+            assert start is not None
+            await send(start)
+            await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": True})
+            chunks.clear()
+
+        async def _send(message: Message) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] != 200 or "etag" in headers or not content_type.startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            chunks.append(body)
+            size += len(body)
+            if message.get("more_body", False):
+                if size > self.max_body_bytes:
+                    passthrough = True
+                    await _flush_buffer()
+                return
+            full = b"".join(chunks)
+            etag = body_etag(full)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["ETag"] = etag
+            if etag_matches(if_none_match, etag):
+                kept = [(k, v) for k, v in start["headers"] if k.decode("latin-1").lower() in _NOT_MODIFIED_KEEP]
+                await send({"type": "http.response.start", "status": 304, "headers": kept})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": full})
+
+        await self.app(scope, receive, _send)
@@ -0,0 +1,415 @@
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 형식, 외부 의존성 없음). GET /internal/metrics로 노출.
+- 웹: HTTP 라우트별 지연(MetricsMiddleware), 비동기 DB 풀 checkout 대기·포화도.
+- 워커: 크롤 fetch 지연·바이트(호스트별), Celery 태스크 소요 시간·재시도, 동기 DB 풀.
+워커 메트릭은 워커 프로세스 메모리에 있으므로 태스크 종료마다 스냅샷을 Redis(metrics:snapshot:<instance>, TTL)에
+올리고, 웹의 /internal/metrics가 자기 메트릭과 합쳐 instance 라벨로 구분해 출력.
+"""
+
+import base64
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, TypeVar, cast
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY_PREFIX = "metrics:snapshot:"
+# 워커가 멈추면 스냅샷은 이 시간 뒤 사라짐(죽은 워커 메트릭이 계속 노출되지 않도록)
+SNAPSHOT_TTL_SECONDS = 600
+
+# Celery 기본 큐(브로커 Redis 리스트 키)와 AI 태스크 이름. 큐 깊이는 스크레이프 시 LLEN + 앞부분 스캔.
+CELERY_QUEUE = "celery"
+AI_TASK_NAMES = frozenset(
+    {"app.services.tasks.process_notice_ai_batch_task", "app.services.tasks.process_notice_ai_task"}
+)
+# 큐가 폭주해도 스크레이프가 느려지지 않도록 AI 메시지 집계는 앞쪽 N개만
+QUEUE_SCAN_LIMIT = 5000
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labelnames: Sequence[str], labels: dict[str, Any]) -> LabelKey:
+    if set(labels) != set(labelnames):
+        raise ValueError(f"labels {sorted(labels)} != {sorted(labelnames)}")
+    return tuple((name, str(labels[name])) for name in labelnames)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        """(이름 접미사, 라벨, 값) 목록."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            return [("_total", dict(k), v) for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    """현재 값. 스크레이프 시점 값은 collector에서 set."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            return [("", dict(k), v) for k, v in self._values.items()]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (초 단위 지연 등)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [버킷별 개수..., +Inf 개수], 합계
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        out: list[tuple[str, dict[str, str], float]] = []
+        with self._lock:
+            for key, counts in self._counts.items():
+                labels = dict(key)
+                cumulative = 0
+                for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                    cumulative += count
+                    out.append(("_bucket", {**labels, "le": _format_value(bound)}, float(cumulative)))
+                out.append(("_count", labels, float(cumulative)))
+                out.append(("_sum", labels, self._sums[key]))
+        return out
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """메트릭 모음 + 스크레이프 직전에 gauge를 채우는 collector."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"duplicate metric: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, fn: Callable[[], None]) -> None:
+        self._collectors.append(fn)
+
+    def collect(self) -> list[dict[str, Any]]:
+        """collector 실행 후 메트릭 패밀리 목록 (JSON 직렬화 가능, 스냅샷 형식과 동일). 값 없는 메트릭은 제외."""
+        for fn in list(self._collectors):
+            try:
+                fn()
+            except Exception:
+                logger.warning("metrics collector failed: %s", getattr(fn, "__name__", fn), exc_info=True)
+        families = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            samples = metric.samples()
+            if samples:
+                families.append(
+                    {"name": metric.name, "type": metric.type_name, "help": metric.documentation, "samples": samples}
+                )
+        return families
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render(sources: Sequence[tuple[str, list[dict[str, Any]]]]) -> str:
+    """
+    [(instance, families)] → Prometheus 텍스트 형식. 같은 이름 패밀리는 합쳐 HELP/TYPE 1번,
+    샘플마다 instance 라벨 추가.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for instance, families in sources:
+        for family in families:
+            target = merged.setdefault(
+                family["name"], {"type": family["type"], "help": family["help"], "samples": []}
+            )
+            for suffix, labels, value in family["samples"]:
+                target["samples"].append((suffix, {"instance": instance, **labels}, value))
+    lines: list[str] = []
+    for name in sorted(merged):
+        family = merged[name]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for suffix, labels, value in family["samples"]:
+            label_str = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+            lines.append(f"{name}{suffix}{{{label_str}}} {_format_value(float(value))}")
+    return "\n".join(lines) + "\n"
+
+
+def instance_name(role: str) -> str:
+    """메트릭 instance 라벨: <role>:<host>:<pid>."""
+    return f"{role}:{socket.gethostname()}:{os.getpid()}"
+
+
+_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis | None:
+    """스냅샷·큐 깊이용 동기 Redis 클라이언트 (프로세스당 1개). REDIS_URL 없으면 None."""
+    global _client
+    if _client is None and settings.redis_url:
+        kwargs: dict[str, Any] = {"ssl_cert_reqs": None} if settings.redis_url.startswith("rediss://") else {}
+        _client = redis.Redis.from_url(settings.redis_url, **kwargs)
+    return _client
+
+
+def publish_snapshot(client: redis.Redis, instance: str, registry: "MetricsRegistry | None" = None) -> None:
+    """이 프로세스 메트릭을 Redis에 스냅샷으로 저장 (워커용). Redis 오류는 로그만."""
+    try:
+        payload = json.dumps((registry or REGISTRY).collect())
+        client.set(f"{SNAPSHOT_KEY_PREFIX}{instance}", payload, ex=SNAPSHOT_TTL_SECONDS)
+    except redis.RedisError:
+        logger.warning("metrics snapshot publish failed: instance=%s", instance, exc_info=True)
+
+
+def load_snapshots(client: redis.Redis) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Redis의 워커 스냅샷 전부 [(instance, families)]. Redis 오류 시 빈 목록."""
+    sources: list[tuple[str, list[dict[str, Any]]]] = []
+    try:
+        keys = sorted(client.scan_iter(match=f"{SNAPSHOT_KEY_PREFIX}*", count=100))
+        values = cast(list[Any], client.mget(keys)) if keys else []
+    except redis.RedisError:
+        logger.warning("metrics snapshot load failed", exc_info=True)
+        return sources
+    for key, value in zip(keys, values, strict=True):
+        if not value:
+            continue
+        key_str = key.decode() if isinstance(key, bytes) else str(key)
+        try:
+            sources.append((key_str[len(SNAPSHOT_KEY_PREFIX) :], json.loads(value)))
+        except ValueError:
+            continue
+    return sources
+
+
+REGISTRY = MetricsRegistry()
+
+# --- 메트릭 정의 (이름 규칙: dicee_<영역>_<내용>_<단위>) ---
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "dicee_http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status")
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "dicee_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection",
+    ("engine",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKED_OUT = REGISTRY.gauge("dicee_db_pool_checked_out", "Connections currently checked out", ("engine",))
+DB_POOL_SATURATION = REGISTRY.gauge(
+    "dicee_db_pool_saturation", "Checked-out connections / (pool_size + max_overflow)", ("engine",)
+)
+CRAWL_FETCH_DURATION = REGISTRY.histogram(
+    "dicee_crawl_fetch_duration_seconds",
+    "Crawler HTTP fetch latency by host",
+    ("host",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+CRAWL_FETCH_BYTES = REGISTRY.counter("dicee_crawl_fetch_bytes", "Crawler response bytes read by host", ("host",))
+CRAWL_FETCH_RESULTS = REGISTRY.counter(
+    "dicee_crawl_fetch", "Crawler fetches by host and result (ok, not_modified, error)", ("host", "result")
+)
+CRAWL_RATE_DELAY = REGISTRY.gauge(
+    "dicee_crawl_rate_delay_seconds", "Adaptive request spacing per crawled host", ("host",)
+)
+CRAWL_BREAKER_EVENTS = REGISTRY.counter(
+    "dicee_crawl_breaker_events", "Crawl circuit breaker events by host (opened, closed, skipped)", ("host", "event")
+)
+CELERY_TASK_DURATION = REGISTRY.histogram(
+    "dicee_celery_task_duration_seconds",
+    "Celery task run time by task and final state",
+    ("task", "state"),
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 180.0, 600.0, 1800.0),
+)
+CELERY_TASK_RETRIES = REGISTRY.counter("dicee_celery_task_retries", "Celery task retries by task", ("task",))
+CELERY_QUEUE_LENGTH = REGISTRY.gauge("dicee_celery_queue_length", "Messages waiting in the broker queue", ("queue",))
+AI_QUEUE_TASKS = REGISTRY.gauge("dicee_ai_queue_tasks", "AI batch tasks waiting in the broker queue")
+AI_QUEUE_NOTICES = REGISTRY.gauge("dicee_ai_queue_notices", "Notices in AI batch tasks waiting in the broker queue")
+
+
+def _ai_notice_count(raw: bytes | str) -> int | None:
+    """Celery 메시지(JSON, body base64) → AI 태스크면 공지 수, 아니면 None."""
+    try:
+        message = json.loads(raw)
+        if message.get("headers", {}).get("task") not in AI_TASK_NAMES:
+            return None
+        args = json.loads(base64.b64decode(message["body"]))[0]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+    first = args[0] if args else None
+    return len(first) if isinstance(first, list) else 1
+
+
+def observe_broker_queue(client: redis.Redis, queue: str = CELERY_QUEUE, scan_limit: int = QUEUE_SCAN_LIMIT) -> None:
+    """브로커 큐 길이와 대기 중 AI 태스크·공지 수를 gauge에 기록 (스크레이프 시점). Redis 오류는 로그만."""
+    try:
+        length = cast(int, client.llen(queue))
+        messages = cast(list[bytes], client.lrange(queue, 0, scan_limit - 1)) if length else []
+    except redis.RedisError:
+        logger.warning("metrics: broker queue read failed queue=%s", queue, exc_info=True)
+        return
+    tasks = notices = 0
+    for raw in messages:
+        count = _ai_notice_count(raw)
+        if count is not None:
+            tasks += 1
+            notices += count
+    CELERY_QUEUE_LENGTH.set(length, queue=queue)
+    AI_QUEUE_TASKS.set(tasks)
+    AI_QUEUE_NOTICES.set(notices)
+
+
+def instrument_pool(pool: Any, engine_label: str) -> None:
+    """
+    SQLAlchemy 풀 계측: connect() 대기 시간(풀이 꽉 차면 여기서 기다림)과 스크레이프 시점 checkout 수·포화도.
+    pool.connect를 인스턴스 단위로 감쌈(엔진 dispose로 풀이 재생성되면 해제).
+    """
+    original = pool.connect
+
+    def connect() -> Any:
+        start = time.perf_counter()
+        try:
+            return original()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, engine=engine_label)
+
+    pool.connect = connect
+
+    def collect() -> None:
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        capacity = (pool.size() if hasattr(pool, "size") else 0) + max(0, getattr(pool, "_max_overflow", 0))
+        DB_POOL_CHECKED_OUT.set(checked_out, engine=engine_label)
+        DB_POOL_SATURATION.set(checked_out / capacity if capacity else 0.0, engine=engine_label)
+
+    REGISTRY.add_collector(collect)
+
+
+class MetricsMiddleware:
+    """HTTP 요청 지연을 라우트 템플릿(/v1/notices/{id} 등) 라벨로 기록 (ASGI). 매칭 안 된 경로는 'unmatched'."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = {"code": 500}
+
+        async def _send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=f"{status['code'] // 100}xx",
+            )
@@ -0,0 +1,220 @@
+"""
+공개 조회 API 응답 캐시 (2계층: 프로세스 메모리 LRU → Redis). 공지 데이터는 크롤 upsert·AI 결과 반영 때만 바뀌므로
+TTL 추측 대신 단과대별 데이터 버전(Redis INCR)을 캐시 키에 넣어 정확히 무효화.
+- 쓰기 경로(crawl upsert 배치·AI 배치)는 commit 후 bump_data_versions_sync → 이후 요청은 새 키를 보므로
+  이전 항목은 더 이상 조회되지 않고 LRU 축출·Redis TTL로 정리.
+- 요청당 Redis 왕복: 버전 MGET 1번(+ 메모리 미스 시 GET 1번). 히트면 DB 세션을 쓰지 않음.
+- 같은 버전으로 ETag·Last-Modified(마지막 bump 시각)도 계산 → 본문을 만들기 전에 조건부 GET(304) 판단.
+REDIS_URL 미설정·RESPONSE_CACHE_ENABLED=false·Redis 오류 시 캐시 없이 build(DB 조회). 요청은 실패하지 않음.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.crawler_config import COLLEGE_CODE_TO_MODULE
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_KEY_PREFIX = "cache:ver:"
+# 단과대별 마지막 bump 시각(unix 초). Last-Modified용.
+DATA_MTIME_KEY_PREFIX = "cache:mtime:"
+RESPONSE_KEY_PREFIX = "cache:resp:"
+
+
+class LocalLRU:
+    """캐시 키 → 응답 바이트 LRU (프로세스 메모리). 이벤트 루프 단일 스레드에서만 사용."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max = max(0, max_entries)
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if self._max == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def scope_codes(college_codes: Collection[str] | None) -> list[str]:
+    """응답이 의존하는 단과대 코드(정렬·중복 제거). 필터가 없으면 전체 단과대."""
+    return sorted(set(college_codes) if college_codes else COLLEGE_CODE_TO_MODULE)
+
+
+def make_cache_key(namespace: str, params: Mapping[str, Any], versions: Mapping[str, int]) -> str:
+    """엔드포인트(namespace) + 정규화한 파라미터 + 단과대별 데이터 버전 → 캐시 키."""
+    raw = json.dumps({"p": params, "v": versions}, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{RESPONSE_KEY_PREFIX}{namespace}:{hashlib.sha256(raw.encode()).hexdigest()}"
+
+
+@dataclass(frozen=True)
+class CacheSlot:
+    """요청 1건의 캐시 위치와 검증자. key가 None이면 캐시 미사용(Redis 없음·오류) — 검증자도 없음."""
+
+    key: str | None
+    etag: str | None = None
+    last_modified: datetime | None = None
+
+
+class ResponseCache:
+    """응답 캐시 1개 (메모리 LRU + Redis). client가 None이면 캐시 없이 항상 build."""
+
+    def __init__(self, client: aioredis.Redis | None, local: LocalLRU, *, ttl_seconds: int) -> None:
+        self._r = client
+        self._local = local
+        self._ttl = max(1, ttl_seconds)
+
+    async def data_state(self, codes: Iterable[str]) -> tuple[dict[str, int], datetime | None] | None:
+        """
+        단과대별 데이터 버전(없으면 0)과 그중 가장 최근 bump 시각을 MGET 1번으로.
+        bump 기록이 하나도 없으면 시각은 None. Redis 미사용·오류 시 None.
+        """
+        if self._r is None:
+            return None
+        codes = list(codes)
+        keys = [f"{DATA_VERSION_KEY_PREFIX}{c}" for c in codes] + [f"{DATA_MTIME_KEY_PREFIX}{c}" for c in codes]
+        try:
+            values = await self._r.mget(keys)
+        except redis.RedisError:
+            logger.warning("response cache: data version read failed", exc_info=True)
+            return None
+        versions = {c: int(v or 0) for c, v in zip(codes, values[: len(codes)], strict=True)}
+        mtimes = [int(v) for v in values[len(codes) :] if v]
+        last_modified = datetime.fromtimestamp(max(mtimes), UTC) if mtimes else None
+        return versions, last_modified
+
+    async def slot(
+        self, namespace: str, params: Mapping[str, Any], college_codes: Collection[str] | None
+    ) -> CacheSlot:
+        """
+        캐시 키·검증자 계산 (본문 생성·캐시 조회 없음).
+        params는 응답을 결정하는 요청 값 전부(college 필터 제외 — 버전 범위로 키에 포함).
+        """
+        state = await self.data_state(scope_codes(college_codes))
+        if state is None:
+            return CacheSlot(key=None)
+        versions, last_modified = state
+        key = make_cache_key(namespace, params, versions)
+        return CacheSlot(key=key, etag=f'W/"{key.rsplit(":", 1)[1][:32]}"', last_modified=last_modified)
+
+    async def fetch(self, slot: CacheSlot, build: Callable[[], Awaitable[bytes]]) -> bytes:
+        """캐시된 응답 바이트 반환, 없으면 build()로 만들어 두 계층에 저장."""
+        client = self._r
+        key = slot.key
+        if client is None or key is None:
+            return await build()
+        cached = self._local.get(key)
+        if cached is not None:
+            return cached
+        try:
+            cached = await client.get(key)
+        except redis.RedisError:
+            logger.warning("response cache: get failed key=%s", key, exc_info=True)
+            cached = None
+        if cached is not None:
+            self._local.put(key, cached)
+            return cached
+        body = await build()
+        self._local.put(key, body)
+        try:
+            await client.set(key, body, ex=self._ttl)
+        except redis.RedisError:
+            logger.warning("response cache: set failed key=%s", key, exc_info=True)
+        return body
+
+    async def get_or_build(
+        self,
+        namespace: str,
+        params: Mapping[str, Any],
+        college_codes: Collection[str] | None,
+        build: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """slot + fetch. 검증자가 필요 없을 때."""
+        return await self.fetch(await self.slot(namespace, params, college_codes), build)
+
+    async def aclose(self) -> None:
+        if self._r is not None:
+            await self._r.aclose()
+
+
+def _redis_kwargs(url: str) -> dict[str, Any]:
+    # rediss://면 워커·스케줄러와 같이 인증서 검증 생략
+    return {"ssl_cert_reqs": None} if url.startswith("rediss://") else {}
+
+
+_cache: ResponseCache | None = None
+_sync_client: redis.Redis | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """웹 프로세스용 응답 캐시 (프로세스당 1개). 설정이 꺼져 있으면 항상 build하는 인스턴스."""
+    global _cache
+    if _cache is None:
+        client = None
+        if settings.response_cache_enabled and settings.redis_url:
+            client = aioredis.Redis.from_url(settings.redis_url, **_redis_kwargs(settings.redis_url))
+        _cache = ResponseCache(
+            client,
+            LocalLRU(settings.response_cache_local_max_entries),
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        )
+    return _cache
+
+
+async def close_response_cache() -> None:
+    """앱 종료 시 Redis 연결 정리."""
+    global _cache
+    if _cache is not None:
+        await _cache.aclose()
+        _cache = None
+
+
+def bump_data_versions_sync(college_codes: Iterable[str], client: redis.Redis | None = None) -> None:
+    """
+    단과대별 데이터 버전 +1·bump 시각 기록 (동기, 워커용). 해당 단과대를 포함하는 캐시 항목이 모두 무효화됨.
+    반드시 변경을 commit한 뒤 호출(commit 전이면 다른 요청이 옛 데이터를 새 버전 키로 캐시할 수 있음).
+    Redis 오류는 로그만(이전 항목은 RESPONSE_CACHE_TTL_SECONDS 안에 만료).
+    """
+    global _sync_client
+    codes = sorted(set(college_codes))
+    if not codes:
+        return
+    if client is None:
+        if not (settings.response_cache_enabled and settings.redis_url):
+            return
+        if _sync_client is None:
+            _sync_client = redis.Redis.from_url(settings.redis_url, **_redis_kwargs(settings.redis_url))
+        client = _sync_client
+    try:
+        now = int(time.time())
+        pipe = client.pipeline(transaction=False)
+        for code in codes:
+            pipe.incr(f"{DATA_VERSION_KEY_PREFIX}{code}")
+            pipe.set(f"{DATA_MTIME_KEY_PREFIX}{code}", now)
+        pipe.execute()
+    except redis.RedisError:
+        logger.warning("response cache: data version bump failed codes=%s", codes, exc_info=True)
@@ -12,8 +12,16 @@ from fastapi.responses import JSONResponse
 
 from app.api import health, internal
 from app.api.v1 import auth as v1_auth
+from app.api.v1 import blobs as v1_blobs
+from app.api.v1 import calendar as v1_calendar
+from app.api.v1 import notices as v1_notices
+from app.api.v1 import users as v1_users
+from app.core.blob_store import check_blob_store_settings
 from app.core.config import settings
 from app.core.database import engine, init_db, verify_db_connection
+from app.core.http_validators import ConditionalGetMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.response_cache import close_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +40,19 @@ def _init_sentry() -> None:
                 LoggingIntegration(level=logging.INFO, event_level=logging.ERROR),
             ],
             traces_sample_rate=0.1,
-            environment="production",
+            environment=settings.app_env,
         )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 수명 주기: Sentry 초기화, DB 연결 검증."""
+    """앱 수명 주기: Sentry 초기화, blob 저장소 설정·DB 연결 검증."""
     _init_sentry()
+    check_blob_store_settings()
     init_db()
     await verify_db_connection()
     yield
+    await close_response_cache()
     if engine is not None:
         await engine.dispose()
 
@@ -57,10 +67,16 @@ app = FastAPI(
 app.include_router(health.router)
 app.include_router(internal.router)
 app.include_router(v1_auth.router, prefix="/v1")
+app.include_router(v1_notices.router, prefix="/v1")
+app.include_router(v1_calendar.router, prefix="/v1")
+app.include_router(v1_users.router, prefix="/v1")
+app.include_router(v1_blobs.router, prefix="/v1")
 
 allowed_origins = [
     o.strip() for o in settings.allowed_origins.split(",") if o.strip()
 ]
+# GET JSON 응답 ETag·304 (라우트가 버전 기반 ETag를 붙인 응답은 그대로 통과)
+app.add_middleware(ConditionalGetMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -68,6 +84,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 라우트별 요청 지연 (가장 바깥: CORS·ETag 처리 시간 포함)
+app.add_middleware(MetricsMiddleware)
 
 
 @app.exception_handler(RequestValidationError)
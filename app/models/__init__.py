@@ -3,14 +3,18 @@ from app.models.base import Base
 from app.models.college import College
 from app.models.crawl_run import CrawlRun
 from app.models.notice import Notice
+from app.models.notice_schedule import NoticeSchedule
 from app.models.user import User
 from app.models.user_calendar_event import UserCalendarEvent
+from app.models.user_notice_match import UserNoticeMatch
 
 __all__ = [
     "Base",
     "College",
     "CrawlRun",
     "Notice",
+    "NoticeSchedule",
     "User",
     "UserCalendarEvent",
+    "UserNoticeMatch",
 ]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -20,6 +22,8 @@ class CrawlRun(Base):
     celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    status: Mapped[str] = mapped_column(String(32), nullable=False)  # running | success | failed
+    status: Mapped[str] = mapped_column(String(32), nullable=False)  # running | success | failed | skipped(서킷 open)
     notices_upserted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 단계별 계측 (services.crawl_stats.CrawlStats.to_dict): 페이지·바이트·304·스킵 사유·단계별 ms
+    stats: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
@@ -7,10 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from app.models.college import College
+    from app.models.notice_schedule import NoticeSchedule
     from app.models.user_calendar_event import UserCalendarEvent
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -31,9 +32,12 @@ class Notice(Base):
     raw_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     images: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONB, nullable=True)
     attachments: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONB, nullable=True)
+    # 정제된 본문 텍스트 (crawlers.body_text.render_body_text). upsert 시 1번만 생성, AI 입력·content_hash·검색이 읽음.
+    body_text: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # 2. AI 분석 및 구조화 데이터 (핵심)
     # AI가 뽑은 날짜들: [{"type": "서류마감", "date": "2026-03-01"}, {"type": "면접", "date": "2026-03-10"}]
+    # 달력 조회용 정규화 사본: notice_schedules (dates 쓰기 시 함께 교체)
     dates: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONB, nullable=True)
 
     # AI가 뽑은 지원 자격: ["3학년 이상", "전공 무관", "학점 3.0 이상"]
@@ -46,6 +50,8 @@ class Notice(Base):
     # 3. 운영용 필드
     content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     is_manual_edited: Mapped[bool] = mapped_column(default=False, nullable=False)
+    # 전문 검색: DB 트리거(trg_notices_search_vector)가 title·body_text·hashtags로 채움. 앱에서 쓰지 않음.
+    search_vector: Mapped[Any | None] = mapped_column(TSVECTOR, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
     updated_at: Mapped[datetime] = mapped_column(
@@ -56,3 +62,20 @@ class Notice(Base):
 
     college: Mapped["College"] = relationship("College", back_populates="notices")
     user_calendar_events: Mapped[list["UserCalendarEvent"]] = relationship("UserCalendarEvent", back_populates="notice")
+    schedules: Mapped[list["NoticeSchedule"]] = relationship(
+        "NoticeSchedule",
+        back_populates="notice",
+        passive_deletes=True,
+    )
+
+
+# 피드 keyset 페이지네이션: ORDER BY published_at DESC NULLS LAST, id DESC (전체·단과대별)
+Index("ix_notices_feed", Notice.published_at.desc().nulls_last(), Notice.id.desc())
+Index(
+    "ix_notices_college_feed",
+    Notice.college_id,
+    Notice.published_at.desc().nulls_last(),
+    Notice.id.desc(),
+)
+# 전문 검색 (GET /v1/notices/search): search_vector @@ tsquery
+Index("ix_notices_search_vector", Notice.search_vector, postgresql_using="gin")
@@ -0,0 +1,36 @@
+"""NoticeSchedule(공지 일정) 모델. Notice.dates(JSONB)를 일정 1건당 1행으로 정규화한 달력 조회용 테이블."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.notice import Notice
+
+from sqlalchemy import Date, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+
+class NoticeSchedule(Base):
+    """
+    공지 일정 1건. Notice.dates가 쓰일 때마다 해당 공지 행 전체를 교체(calendar_service.save_notice_dates_sync).
+    월별 달력 조회는 schedule_date B-tree 범위 스캔 (JSONB 전체 스캔 없음).
+    """
+
+    __tablename__ = "notice_schedules"
+    __table_args__ = (Index("ix_notice_schedules_date_notice", "schedule_date", "notice_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    notice_id: Mapped[int] = mapped_column(
+        ForeignKey("notices.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # dates 항목의 type ("서류마감", "면접" 등). 없으면 None.
+    schedule_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    schedule_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    notice: Mapped["Notice"] = relationship("Notice", back_populates="schedules")
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from app.models.user_calendar_event import UserCalendarEvent
 
-from sqlalchemy import DateTime, String, UniqueConstraint
+from sqlalchemy import DateTime, Index, SmallInteger, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,7 +19,11 @@ class User(Base):
     """유저. OAuth 전용(provider, provider_user_id). 비밀번호 해시 없음."""
 
     __tablename__ = "users"
-    __table_args__ = (UniqueConstraint("provider", "provider_user_id", name="uq_user_provider_uid"),)
+    __table_args__ = (
+        UniqueConstraint("provider", "provider_user_id", name="uq_user_provider_uid"),
+        # 매칭 역색인: 공지 대상 학과·학년 → 후보 유저
+        Index("ix_users_match_keys", "match_department", "match_grade"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     provider: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
@@ -30,6 +34,9 @@ class User(Base):
     # 프로필 (5단계 매칭용)
     profile_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     # 예: {"major": "컴퓨터공학", "grade": 3, "military_served": true, "gpa": 3.5}
+    # profile_json에서 뽑은 매칭 키 (match_service.user_match_keys). 프로필 저장 시 함께 갱신.
+    match_department: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    match_grade: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from app.models.notice import Notice
     from app.models.user import User
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -19,7 +19,11 @@ class UserCalendarEvent(Base):
     """유저가 달력에 추가한 공지 일정. 한 공지를 내 달력에 중복 추가 방지."""
 
     __tablename__ = "user_calendar_events"
-    __table_args__ = (UniqueConstraint("user_id", "notice_id", name="uq_user_calendar_user_notice"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "notice_id", name="uq_user_calendar_user_notice"),
+        # 달력 월별 조회: user_id 고정 + start_at 범위 스캔
+        Index("ix_user_calendar_events_user_start", "user_id", "start_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
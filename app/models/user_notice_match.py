@@ -0,0 +1,33 @@
+"""UserNoticeMatch 모델. 유저 프로필 ↔ 공지 자격 요건 매칭 결과(사전 계산)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class UserNoticeMatch(Base):
+    """
+    유저-공지 매칭 1건. 요청마다 전체 공지를 평가하지 않도록 match_service가 미리 채움.
+    - 공지 AI 처리 완료 시: 해당 공지 대상 후보 유저(users.match_department·match_grade 인덱스)만 평가.
+    - 프로필 수정 시: 해당 유저 × 최근 공지만 재평가.
+    맞춤 피드는 PK(user_id, notice_id) 역순 범위 스캔 1번.
+    """
+
+    __tablename__ = "user_notice_matches"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    notice_id: Mapped[int] = mapped_column(
+        ForeignKey("notices.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+    matched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
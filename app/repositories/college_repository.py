@@ -1,5 +1,7 @@
 """College Repository. DB 쿼리만 수행."""
 
+from collections.abc import Collection
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -23,3 +25,11 @@ def get_by_external_id_sync(session: Session, external_id: str) -> College | Non
         select(College).where(College.external_id == external_id)
     )
     return result.scalars().one_or_none()
+
+
+def get_external_ids_by_ids_sync(session: Session, college_ids: Collection[int]) -> list[str]:
+    """단과대 id 목록 → external_id(코드) 목록 (동기, 워커용)."""
+    if not college_ids:
+        return []
+    result = session.execute(select(College.external_id).where(College.id.in_(list(college_ids))))
+    return list(result.scalars().all())
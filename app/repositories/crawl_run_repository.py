@@ -39,6 +39,7 @@ def update_crawl_run_sync(
     status: str | None = None,
     notices_upserted: int | None = None,
     error_message: str | None = None,
+    stats: dict[str, Any] | None = None,
 ) -> CrawlRun | None:
     """celery_task_id로 1건 갱신 (동기, 워커용)."""
     stmt = select(CrawlRun).where(CrawlRun.celery_task_id == celery_task_id).limit(1)
@@ -54,6 +55,8 @@ def update_crawl_run_sync(
         row.notices_upserted = notices_upserted
     if error_message is not None:
         row.error_message = error_message
+    if stats is not None:
+        row.stats = stats
     session.flush()
     session.refresh(row)
     return row
@@ -80,6 +83,36 @@ async def get_recent_crawl_runs(
             "status": run.status,
             "notices_upserted": run.notices_upserted,
             "error_message": run.error_message,
+            "stats": run.stats,
         }
         for run, ext_id in rows
     ]
+
+
+async def get_runs_since(session: AsyncSession, since: datetime) -> list[tuple[CrawlRun, str]]:
+    """since 이후 시작한 크롤 이력 (CrawlRun, 단과대 코드). GET /internal/crawl-stats 백분위 요약용."""
+    stmt = (
+        select(CrawlRun, College.external_id)
+        .join(College, CrawlRun.college_id == College.id)
+        .where(CrawlRun.started_at >= since)
+        .order_by(CrawlRun.started_at.desc())
+    )
+    result = await session.execute(stmt)
+    return [(run, ext_id) for run, ext_id in result.all()]
+
+
+def get_runs_since_sync(
+    session: Session,
+    since: datetime,
+) -> dict[str, list[CrawlRun]]:
+    """since 이후 시작한 크롤 이력을 단과대 코드별로 최신순 반환 (동기, 스케줄러용)."""
+    stmt = (
+        select(CrawlRun, College.external_id)
+        .join(College, CrawlRun.college_id == College.id)
+        .where(CrawlRun.started_at >= since)
+        .order_by(CrawlRun.started_at.desc())
+    )
+    history: dict[str, list[CrawlRun]] = {}
+    for run, ext_id in session.execute(stmt).all():
+        history.setdefault(ext_id, []).append(run)
+    return history
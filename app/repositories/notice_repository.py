@@ -1,30 +1,91 @@
 """Notice Repository. DB 쿼리만 수행. 크롤 결과 upsert."""
 
+from collections.abc import Collection
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Integer, and_, any_, cast, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, TSQUERY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.models.college import College
 from app.models.notice import Notice
 
+# 조회 용도별 로드 프로필. 무거운(TOAST) 컬럼을 필요한 용도에서만 SELECT.
+# - list_card: 목록·캘린더 카드. raw_html·body_text·images·attachments·ai_extracted_json 제외.
+# - detail: 상세 화면. ai_extracted_json(AI Raw)만 제외.
+# - ai_input: 4단계 AI 입력. body_text(정제 본문)·ai_extracted_json만, raw_html·images·attachments 제외.
+# - full: 전 컬럼.
+# search_vector(트리거 관리 tsvector)는 어떤 프로필에서도 응답에 쓰지 않으므로 full에서만 로드.
+# 제외 컬럼은 raiseload: 접근 시 지연 SELECT 대신 예외(비동기 세션 MissingGreenlet·N+1 방지).
+NoticeLoadProfile = Literal["list_card", "detail", "ai_input", "full"]
 
-def get_by_id_sync(session: Session, notice_id: int) -> Notice | None:
-    """notice_id로 1건 조회 (동기, 워커용). 4단계 AI 태스크 멱등 처리용."""
-    result = session.execute(select(Notice).where(Notice.id == notice_id).limit(1))
+_HEAVY_COLUMNS = {
+    "raw_html": Notice.raw_html,
+    "body_text": Notice.body_text,
+    "images": Notice.images,
+    "attachments": Notice.attachments,
+    "ai_extracted_json": Notice.ai_extracted_json,
+    "search_vector": Notice.search_vector,
+}
+
+_PROFILE_LOADED_HEAVY: dict[str, frozenset[str]] = {
+    "list_card": frozenset(),
+    "detail": frozenset({"raw_html", "body_text", "images", "attachments"}),
+    "ai_input": frozenset({"body_text", "ai_extracted_json"}),
+    "full": frozenset(_HEAVY_COLUMNS),
+}
+
+
+def notice_load_options(profile: NoticeLoadProfile) -> list[ORMOption]:
+    """프로필에 맞는 ORM 로더 옵션 (select(Notice).options(*...))."""
+    loaded = _PROFILE_LOADED_HEAVY[profile]
+    return [defer(col, raiseload=True) for name, col in _HEAVY_COLUMNS.items() if name not in loaded]
+
+
+def get_by_id_sync(
+    session: Session,
+    notice_id: int,
+    *,
+    profile: NoticeLoadProfile = "full",
+) -> Notice | None:
+    """notice_id로 1건 조회 (동기, 워커용). 4단계 AI 태스크 멱등 처리용. profile로 무거운 컬럼 제외."""
+    stmt = select(Notice).options(*notice_load_options(profile)).where(Notice.id == notice_id).limit(1)
+    result = session.execute(stmt)
     return result.scalars().one_or_none()
 
 
+def get_by_ids_sync(
+    session: Session,
+    notice_ids: Collection[int],
+    *,
+    profile: NoticeLoadProfile = "full",
+) -> list[Notice]:
+    """
+    notice_id 목록 일괄 조회 (동기, 워커용). WHERE id = ANY(:ids) 한 번(배열 1개 바인딩, 개수와 무관한 SQL).
+    순서는 보장하지 않음. 4단계 AI 배치 처리용.
+    """
+    if not notice_ids:
+        return []
+    ids = cast(literal(list(notice_ids), ARRAY(Integer)), ARRAY(Integer))
+    stmt = select(Notice).options(*notice_load_options(profile)).where(Notice.id == any_(ids))
+    result = session.execute(stmt)
+    return list(result.scalars().all())
+
+
 def get_by_college_external_sync(
     session: Session,
     college_id: int,
     external_id: str,
+    *,
+    profile: NoticeLoadProfile = "full",
 ) -> Notice | None:
     """college_id + external_id로 기존 Notice 조회 (동기, 워커용). 3→4 content_hash 변경 감지용."""
     stmt = (
         select(Notice)
+        .options(*notice_load_options(profile))
         .where(
             Notice.college_id == college_id,
             Notice.external_id == external_id,
@@ -35,6 +96,139 @@ def get_by_college_external_sync(
     return result.scalar_one_or_none()
 
 
+def update_dates_sync(session: Session, notice_id: int, dates: list[dict[str, Any]] | None) -> None:
+    """Notice.dates만 갱신 (동기, 워커용). notice_schedules 동기화는 calendar_service.save_notice_dates_sync."""
+    session.execute(update(Notice).where(Notice.id == notice_id).values(dates=dates, updated_at=datetime.now(UTC)))
+
+
+def bulk_update_ai_results_sync(session: Session, rows: list[dict[str, Any]]) -> None:
+    """
+    AI 추출 결과 일괄 반영 (동기, 워커용). rows: [{"id", "ai_extracted_json", "dates", ...}] (모든 행 같은 키).
+    PK 기준 ORM bulk UPDATE: UPDATE 문 1개를 executemany로 실행.
+    """
+    if not rows:
+        return
+    now = datetime.now(UTC)
+    session.execute(update(Notice), [{**row, "updated_at": now} for row in rows])
+
+
+def list_ai_targets_since_sync(session: Session, since: datetime) -> list[tuple[int, dict[str, Any]]]:
+    """
+    published_at >= since 이고 AI 처리된 공지의 (id, 대상 조건) (동기, 워커용). 유저 매칭 재계산용.
+    ai_extracted_json 전체 대신 target_departments·target_grades만 SELECT.
+    """
+    stmt = select(
+        Notice.id,
+        Notice.ai_extracted_json["target_departments"],
+        Notice.ai_extracted_json["target_grades"],
+    ).where(Notice.published_at >= since, Notice.ai_extracted_json.is_not(None))
+    result = session.execute(stmt)
+    return [
+        (notice_id, {"target_departments": departments, "target_grades": grades})
+        for notice_id, departments, grades in result.all()
+    ]
+
+
+async def list_feed(
+    session: AsyncSession,
+    *,
+    college_codes: Collection[str] | None = None,
+    after: tuple[datetime | None, int] | None = None,
+    limit: int = 20,
+    profile: NoticeLoadProfile = "list_card",
+) -> list[tuple[Notice, str]]:
+    """
+    공지 피드 (published_at DESC NULLS LAST, id DESC) keyset 페이지. (Notice, college_code) 목록.
+    after: 직전 페이지 마지막 행의 (published_at, id). ix_notices_feed / ix_notices_college_feed 인덱스 사용.
+    published_at NULL 공지는 날짜 있는 공지 뒤에 id 역순으로 이어짐.
+    """
+    stmt = (
+        select(Notice, College.external_id)
+        .join(College, Notice.college_id == College.id)
+        .options(*notice_load_options(profile))
+    )
+    if college_codes:
+        stmt = stmt.where(College.external_id.in_(list(college_codes)))
+    if after is not None:
+        after_published_at, after_id = after
+        if after_published_at is None:
+            stmt = stmt.where(and_(Notice.published_at.is_(None), Notice.id < after_id))
+        else:
+            stmt = stmt.where(
+                or_(
+                    tuple_(Notice.published_at, Notice.id) < tuple_(literal(after_published_at), literal(after_id)),
+                    Notice.published_at.is_(None),
+                )
+            )
+    stmt = stmt.order_by(Notice.published_at.desc().nulls_last(), Notice.id.desc()).limit(limit)
+    result = await session.execute(stmt)
+    return [(notice, code) for notice, code in result.all()]
+
+
+async def search(
+    session: AsyncSession,
+    tsquery: str,
+    *,
+    college_codes: Collection[str] | None = None,
+    after: tuple[float, int] | None = None,
+    limit: int = 20,
+    profile: NoticeLoadProfile = "list_card",
+) -> list[tuple[Notice, str, float]]:
+    """
+    전문 검색 (search_vector @@ tsquery, ix_notices_search_vector GIN). (Notice, college_code, rank) 목록.
+    정렬 ts_rank DESC, id DESC. after: 직전 페이지 마지막 행의 (rank, id) keyset.
+    tsquery는 tsquery 문법 문자열(notice_service.build_search_query).
+    """
+    query = cast(literal(tsquery), TSQUERY)
+    rank = func.ts_rank(Notice.search_vector, query)
+    stmt = (
+        select(Notice, College.external_id, rank)
+        .join(College, Notice.college_id == College.id)
+        .options(*notice_load_options(profile))
+        .where(Notice.search_vector.bool_op("@@")(query))
+    )
+    if college_codes:
+        stmt = stmt.where(College.external_id.in_(list(college_codes)))
+    if after is not None:
+        after_rank, after_id = after
+        stmt = stmt.where(tuple_(rank, Notice.id) < tuple_(literal(after_rank), literal(after_id)))
+    stmt = stmt.order_by(rank.desc(), Notice.id.desc()).limit(limit)
+    result = await session.execute(stmt)
+    return [(notice, code, float(score)) for notice, code, score in result.all()]
+
+
+async def get_known_titles(
+    session: AsyncSession,
+    college_id: int,
+    external_ids: Collection[str],
+) -> dict[str, str]:
+    """college_id + external_id 목록으로 기존 공지 일괄 조회 → {external_id: title}. 증분 크롤 스킵 판단용."""
+    if not external_ids:
+        return {}
+    stmt = select(Notice.external_id, Notice.title).where(
+        Notice.college_id == college_id,
+        Notice.external_id.in_(list(external_ids)),
+    )
+    result = await session.execute(stmt)
+    return {ext_id: title for ext_id, title in result.all()}
+
+
+def get_known_titles_sync(
+    session: Session,
+    college_id: int,
+    external_ids: Collection[str],
+) -> dict[str, str]:
+    """get_known_titles 동기 버전 (워커용). 목록의 (college_id, external_id)를 한 번의 IN 쿼리로 조회."""
+    if not external_ids:
+        return {}
+    stmt = select(Notice.external_id, Notice.title).where(
+        Notice.college_id == college_id,
+        Notice.external_id.in_(list(external_ids)),
+    )
+    result = session.execute(stmt)
+    return {ext_id: title for ext_id, title in result.all()}
+
+
 async def upsert_notice(
     session: AsyncSession,
     college_id: int,
@@ -46,6 +240,7 @@ async def upsert_notice(
     attachments: list[dict[str, Any]] | None,
     content_hash: str | None,
     published_at: datetime | None = None,
+    body_text: str | None = None,
 ) -> Notice:
     """
     college_id + external_id 기준으로 insert or update.
@@ -57,6 +252,7 @@ async def upsert_notice(
         "title": title,
         "url": url,
         "raw_html": raw_html,
+        "body_text": body_text,
         "images": images,
         "attachments": attachments,
         "content_hash": content_hash,
@@ -71,6 +267,7 @@ async def upsert_notice(
                 "title": title,
                 "url": url,
                 "raw_html": raw_html,
+                "body_text": body_text,
                 "images": images,
                 "attachments": attachments,
                 "content_hash": content_hash,
@@ -98,6 +295,7 @@ def upsert_notice_sync(
     attachments: list[dict[str, Any]] | None,
     content_hash: str | None,
     published_at: datetime | None = None,
+    body_text: str | None = None,
 ) -> Notice:
     """
     college_id + external_id 기준으로 insert or update (동기, 워커용).
@@ -109,6 +307,7 @@ def upsert_notice_sync(
         "title": title,
         "url": url,
         "raw_html": raw_html,
+        "body_text": body_text,
         "images": images,
         "attachments": attachments,
         "content_hash": content_hash,
@@ -123,6 +322,7 @@ def upsert_notice_sync(
                 "title": title,
                 "url": url,
                 "raw_html": raw_html,
+                "body_text": body_text,
                 "images": images,
                 "attachments": attachments,
                 "content_hash": content_hash,
@@ -145,6 +345,7 @@ def _notice_upsert_set_excluded(stmt: Any) -> dict:
         "title": stmt.excluded.title,
         "url": stmt.excluded.url,
         "raw_html": stmt.excluded.raw_html,
+        "body_text": stmt.excluded.body_text,
         "images": stmt.excluded.images,
         "attachments": stmt.excluded.attachments,
         "content_hash": stmt.excluded.content_hash,
@@ -0,0 +1,50 @@
+"""NoticeSchedule Repository. DB 쿼리만 수행. 공지 일정 교체·월별 범위 조회."""
+
+from collections.abc import Collection, Sequence
+from datetime import date
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.college import College
+from app.models.notice import Notice
+from app.models.notice_schedule import NoticeSchedule
+
+
+def replace_for_notice_sync(
+    session: Session,
+    notice_id: int,
+    entries: Sequence[tuple[str | None, date]],
+) -> None:
+    """공지 1건의 일정 행을 entries [(type, date)]로 전부 교체 (동기, 워커용). commit은 호출자."""
+    session.execute(delete(NoticeSchedule).where(NoticeSchedule.notice_id == notice_id))
+    if entries:
+        session.execute(
+            insert(NoticeSchedule),
+            [{"notice_id": notice_id, "schedule_type": t, "schedule_date": d} for t, d in entries],
+        )
+
+
+async def list_in_range(
+    session: AsyncSession,
+    start: date,
+    end: date,
+    *,
+    college_codes: Collection[str] | None = None,
+) -> list[tuple[NoticeSchedule, str, str | None, str]]:
+    """
+    start <= schedule_date < end 일정 목록 → (NoticeSchedule, 공지 제목, 공지 URL, college_code).
+    ix_notice_schedules_date_notice 범위 스캔. 공지는 카드용 컬럼만 조인(무거운 컬럼 미로드).
+    """
+    stmt = (
+        select(NoticeSchedule, Notice.title, Notice.url, College.external_id)
+        .join(Notice, NoticeSchedule.notice_id == Notice.id)
+        .join(College, Notice.college_id == College.id)
+        .where(NoticeSchedule.schedule_date >= start, NoticeSchedule.schedule_date < end)
+    )
+    if college_codes:
+        stmt = stmt.where(College.external_id.in_(list(college_codes)))
+    stmt = stmt.order_by(NoticeSchedule.schedule_date, NoticeSchedule.notice_id, NoticeSchedule.id)
+    result = await session.execute(stmt)
+    return [(schedule, title, url, code) for schedule, title, url, code in result.all()]
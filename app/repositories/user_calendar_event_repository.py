@@ -0,0 +1,29 @@
+"""UserCalendarEvent Repository. DB 쿼리만 수행."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user_calendar_event import UserCalendarEvent
+
+
+async def list_for_user_in_range(
+    session: AsyncSession,
+    user_id: int,
+    start: datetime,
+    end: datetime,
+) -> Sequence[UserCalendarEvent]:
+    """유저가 추가한 일정 중 start <= start_at < end. ix_user_calendar_events_user_start 범위 스캔."""
+    stmt = (
+        select(UserCalendarEvent)
+        .where(
+            UserCalendarEvent.user_id == user_id,
+            UserCalendarEvent.start_at >= start,
+            UserCalendarEvent.start_at < end,
+        )
+        .order_by(UserCalendarEvent.start_at, UserCalendarEvent.id)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
@@ -0,0 +1,81 @@
+"""UserNoticeMatch Repository. DB 쿼리만 수행. 매칭 행 추가·삭제·맞춤 피드 조회."""
+
+from collections.abc import Collection, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.college import College
+from app.models.notice import Notice
+from app.models.user_notice_match import UserNoticeMatch
+from app.repositories.notice_repository import NoticeLoadProfile, notice_load_options
+
+# 한 INSERT 문에 넣는 최대 행 수 (바인드 파라미터 상한 대비)
+_INSERT_CHUNK = 1000
+
+
+def get_user_ids_for_notice_sync(session: Session, notice_id: int) -> set[int]:
+    """공지에 매칭된 유저 ID (동기, 워커용)."""
+    result = session.execute(select(UserNoticeMatch.user_id).where(UserNoticeMatch.notice_id == notice_id))
+    return set(result.scalars().all())
+
+
+def get_notice_ids_for_user_sync(session: Session, user_id: int) -> set[int]:
+    """유저에 매칭된 공지 ID (동기, 워커용)."""
+    result = session.execute(select(UserNoticeMatch.notice_id).where(UserNoticeMatch.user_id == user_id))
+    return set(result.scalars().all())
+
+
+def add_matches_sync(session: Session, pairs: Sequence[tuple[int, int]]) -> None:
+    """(user_id, notice_id) 매칭 추가. 이미 있으면 무시(matched_at 유지)."""
+    for i in range(0, len(pairs), _INSERT_CHUNK):
+        rows = [{"user_id": uid, "notice_id": nid} for uid, nid in pairs[i : i + _INSERT_CHUNK]]
+        session.execute(insert(UserNoticeMatch).values(rows).on_conflict_do_nothing())
+
+
+def delete_for_notice_sync(session: Session, notice_id: int, user_ids: Collection[int]) -> None:
+    """공지의 매칭 중 user_ids 삭제."""
+    session.execute(
+        delete(UserNoticeMatch).where(
+            UserNoticeMatch.notice_id == notice_id,
+            UserNoticeMatch.user_id.in_(list(user_ids)),
+        )
+    )
+
+
+def delete_for_user_sync(session: Session, user_id: int, notice_ids: Collection[int]) -> None:
+    """유저의 매칭 중 notice_ids 삭제."""
+    session.execute(
+        delete(UserNoticeMatch).where(
+            UserNoticeMatch.user_id == user_id,
+            UserNoticeMatch.notice_id.in_(list(notice_ids)),
+        )
+    )
+
+
+async def list_matched_notices(
+    session: AsyncSession,
+    user_id: int,
+    *,
+    before_id: int | None = None,
+    limit: int = 20,
+    profile: NoticeLoadProfile = "list_card",
+) -> list[tuple[Notice, str]]:
+    """
+    맞춤 피드 (notice_id DESC) keyset 페이지. (Notice, college_code) 목록.
+    PK(user_id, notice_id) 역순 범위 스캔 후 공지 카드 컬럼만 조인.
+    """
+    stmt = (
+        select(Notice, College.external_id)
+        .join(UserNoticeMatch, UserNoticeMatch.notice_id == Notice.id)
+        .join(College, Notice.college_id == College.id)
+        .options(*notice_load_options(profile))
+        .where(UserNoticeMatch.user_id == user_id)
+    )
+    if before_id is not None:
+        stmt = stmt.where(UserNoticeMatch.notice_id < before_id)
+    stmt = stmt.order_by(UserNoticeMatch.notice_id.desc()).limit(limit)
+    result = await session.execute(stmt)
+    return [(notice, code) for notice, code in result.all()]
@@ -1,12 +1,21 @@
 """User Repository. DB 쿼리만 수행."""
 
-from sqlalchemy import select
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.schemas.user import UserBase
 
 
+async def get_by_id(session: AsyncSession, user_id: int) -> User | None:
+    """user_id로 유저 조회."""
+    return await session.get(User, user_id)
+
+
 async def get_by_provider_uid(
     session: AsyncSession, provider: str, provider_user_id: str
 ) -> User | None:
@@ -48,3 +57,44 @@ async def upsert_by_provider_uid(
     await session.flush()
     await session.refresh(user)
     return user
+
+
+def get_by_id_sync(session: Session, user_id: int) -> User | None:
+    """user_id로 유저 조회 (동기, 워커용)."""
+    return session.get(User, user_id)
+
+
+async def update_profile(
+    session: AsyncSession,
+    user: User,
+    profile_json: dict[str, Any] | None,
+    match_department: str | None,
+    match_grade: int | None,
+) -> User:
+    """프로필과 매칭 역색인 키를 함께 갱신."""
+    user.profile_json = profile_json
+    user.match_department = match_department
+    user.match_grade = match_grade
+    session.add(user)
+    await session.flush()
+    await session.refresh(user)
+    return user
+
+
+def find_match_candidates_sync(
+    session: Session,
+    *,
+    departments: Collection[str],
+    grades: Collection[int],
+) -> list[int]:
+    """
+    공지 대상 학과·학년에 맞는 유저 ID (동기, 워커용). ix_users_match_keys 사용.
+    조건이 비었으면 제한 없음, 유저 키가 NULL(프로필 미입력)이면 통과 ("애매하면 노출").
+    """
+    stmt = select(User.id)
+    if departments:
+        stmt = stmt.where(or_(User.match_department.in_(list(departments)), User.match_department.is_(None)))
+    if grades:
+        stmt = stmt.where(or_(User.match_grade.in_(list(grades)), User.match_grade.is_(None)))
+    result = session.execute(stmt)
+    return list(result.scalars().all())
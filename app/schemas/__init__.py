@@ -1,12 +1,23 @@
 # Pydantic schemas (2단계~)
+from app.schemas.ai import NoticeExtraction
 from app.schemas.auth import RefreshTokenPayload, TokenPayload, TokenResponse
+from app.schemas.calendar import CalendarEventsResponse, NoticeScheduleEvent, UserCalendarEventItem
+from app.schemas.notice import NoticeCard, NoticeFeedResponse, NoticeSearchHit, NoticeSearchResponse
 from app.schemas.user import UserBase, UserCreate, UserProfile, UserResponse
 
 __all__ = [
+    "CalendarEventsResponse",
+    "NoticeCard",
+    "NoticeExtraction",
+    "NoticeFeedResponse",
+    "NoticeScheduleEvent",
+    "NoticeSearchHit",
+    "NoticeSearchResponse",
     "RefreshTokenPayload",
     "TokenPayload",
     "TokenResponse",
     "UserBase",
+    "UserCalendarEventItem",
     "UserCreate",
     "UserProfile",
     "UserResponse",
@@ -0,0 +1,20 @@
+"""4단계 AI 추출 출력 Pydantic 스키마. Gemini response schema로 전달해 JSON 형식 강제 (4·5·6단계 공용)."""
+
+from pydantic import BaseModel, Field
+
+
+class NoticeExtraction(BaseModel):
+    """공지 1건에서 추출한 대상·일정·자격 요건. 날짜는 ISO(YYYY-MM-DD), 없으면 null."""
+
+    target_departments: list[str] = Field(
+        default_factory=list, description="대상 학과·전공 이름. 제한 없거나 불분명하면 [\"전체\"]."
+    )
+    target_grades: list[str] = Field(
+        default_factory=list, description="대상 학년(예: \"3학년\", \"대학원생\"). 제한 없거나 불분명하면 [\"전체\"]."
+    )
+    deadline: str | None = Field(default=None, description="신청·제출 마감일 (YYYY-MM-DD).")
+    event_title: str | None = Field(default=None, description="행사·일정 이름.")
+    event_start: str | None = Field(default=None, description="행사 시작일 (YYYY-MM-DD).")
+    event_end: str | None = Field(default=None, description="행사 종료일 (YYYY-MM-DD).")
+    eligibility: list[str] = Field(default_factory=list, description="지원 자격 요건 문장 목록.")
+    hashtags: list[str] = Field(default_factory=list, description="공지 분류 해시태그 (# 없이, 최대 5개).")
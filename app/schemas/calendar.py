@@ -0,0 +1,37 @@
+"""달력(일정) 관련 Pydantic 스키마."""
+
+from datetime import date, datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NoticeScheduleEvent(BaseModel):
+    """공지에서 추출된 일정 1건 (notice_schedules 행)."""
+
+    notice_id: int
+    college_code: str
+    title: str
+    url: str | None = None
+    type: str | None = None
+    date: date
+
+
+class UserCalendarEventItem(BaseModel):
+    """유저가 '내 달력에 추가'한 일정."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    notice_id: int
+    title: str
+    start_at: datetime
+    end_at: datetime | None = None
+
+
+class CalendarEventsResponse(BaseModel):
+    """월별 달력 응답. 프론트에서 notice_events와 user_events를 병합."""
+
+    year: int
+    month: int
+    notice_events: list[NoticeScheduleEvent]
+    user_events: list[UserCalendarEventItem]
@@ -0,0 +1,39 @@
+"""Notice 관련 Pydantic 스키마."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class NoticeCard(BaseModel):
+    """목록(피드) 카드. 무거운 컬럼(raw_html·images 등) 제외."""
+
+    id: int
+    college_code: str
+    title: str
+    url: str | None = None
+    published_at: datetime | None = None
+    dates: list[dict[str, Any]] | None = None
+    eligibility: list[str] | None = None
+    hashtags: list[str] | None = None
+
+
+class NoticeFeedResponse(BaseModel):
+    """커서 페이지네이션 피드 응답. next_cursor가 없으면 마지막 페이지."""
+
+    items: list[NoticeCard]
+    next_cursor: str | None = Field(None, description="다음 페이지 요청 시 cursor로 전달")
+
+
+class NoticeSearchHit(NoticeCard):
+    """검색 결과 카드. rank: 관련도(ts_rank, 제목 > 해시태그 > 본문 가중)."""
+
+    rank: float
+
+
+class NoticeSearchResponse(BaseModel):
+    """검색 응답 (관련도순 커서 페이지네이션). next_cursor가 없으면 마지막 페이지."""
+
+    items: list[NoticeSearchHit]
+    next_cursor: str | None = Field(None, description="다음 페이지 요청 시 cursor로 전달")
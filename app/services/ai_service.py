@@ -0,0 +1,250 @@
+"""
+AI 추출 배치 처리 (4단계). 공지 id를 묶음 단위로 처리: 1회 조회(WHERE id = ANY) → 워커 전체가 공유하는
+Redis 속도 제한 아래에서 모델 호출 → 결과를 bulk UPDATE 1번으로 반영 → 일정(notice_schedules)·매칭 갱신
+→ commit 후 응답 캐시 데이터 버전 갱신(해당 단과대).
+모델 호출은 GeminiExtractor(Gemini 구조화 출력, httpx). GEMINI_API_KEY 미설정이면 default_extractor()가
+None이라 호출·속도 제한 대기 없음.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, cast
+
+import httpx
+import redis
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.response_cache import bump_data_versions_sync
+from app.models.notice import Notice
+from app.repositories.college_repository import get_external_ids_by_ids_sync
+from app.repositories.notice_repository import bulk_update_ai_results_sync, get_by_ids_sync
+from app.schemas.ai import NoticeExtraction
+from app.services.calendar_service import sync_notice_schedules_sync
+from app.services.crawl_scheduler import get_redis
+from app.services.match_service import refresh_notice_matches_sync
+
+logger = logging.getLogger(__name__)
+
+AI_RATE_KEY = "ai:rate"
+# 모델 결과 중 Notice 컬럼으로 반영하는 필드 (bulk UPDATE 행 키를 통일하기 위해 고정)
+AI_RESULT_FIELDS = ("ai_extracted_json", "dates", "eligibility", "hashtags")
+# 예약 가능한 미래 슬롯 수. 이보다 먼 슬롯밖에 없으면 예약하지 않고 그만큼 기다린 뒤 재시도.
+_MAX_SLOTS_AHEAD = 120
+
+# KEYS[1]=limiter 키(다음 슬롯 시각), ARGV=[간격, burst 허용(초), 최대 대기(초), TTL]. Redis 서버 TIME 기준.
+# 반환: 대기 초(문자열), 최대 대기 초과면 nil(예약 안 함).
+_RESERVE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local next_at = math.max(tonumber(redis.call('GET', KEYS[1]) or '0'), now)
+local wait = math.max(0, next_at - tonumber(ARGV[2]) - now)
+if wait > tonumber(ARGV[3]) then
+  return false
+end
+redis.call('SET', KEYS[1], tostring(next_at + tonumber(ARGV[1])), 'EX', ARGV[4])
+return tostring(wait)
+"""
+
+
+class SlotRateLimiter:
+    """
+    워커 간 공유 속도 제한 (Redis Lua 1회 왕복). 호출마다 60/rate초 간격의 다음 슬롯을 원자적으로 예약하고
+    그 시각까지 대기. 쉬던 동안의 슬롯은 burst개까지 즉시 사용 가능(토큰 버킷 용량 burst와 같은 효과).
+    시각은 Lua 안에서 Redis 서버 TIME으로 계산 — 워커 간 시계 차이와 무관.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        key: str,
+        *,
+        rate_per_minute: int,
+        burst: int = 1,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._key = key
+        self._interval = 60.0 / max(1, rate_per_minute)
+        self._burst = max(1, burst)
+        self._max_wait = self._interval * _MAX_SLOTS_AHEAD
+        self._ttl = int(self._interval * (self._burst + _MAX_SLOTS_AHEAD)) + 1
+        self._reserve = client.register_script(_RESERVE_LUA)
+        self._sleep = sleep
+
+    def reserve(self) -> float | None:
+        """슬롯 1개 예약 후 그 시각까지 남은 대기 시간(초) 반환. 예약 가능 범위가 모두 차 있으면 None."""
+        wait = self._reserve(
+            keys=[self._key],
+            args=[self._interval, self._interval * (self._burst - 1), self._max_wait, self._ttl],
+        )
+        return None if wait is None else float(cast(Any, wait))
+
+    def acquire(self) -> None:
+        """호출 1회 허가를 받을 때까지 대기."""
+        while True:
+            wait = self.reserve()
+            if wait is None:
+                self._sleep(self._max_wait)
+                continue
+            if wait > 0:
+                self._sleep(wait)
+            return
+
+
+def default_ai_limiter(client: redis.Redis | None = None) -> SlotRateLimiter:
+    """settings 기준 모델 호출 속도 제한 (AI_RATE_LIMIT_PER_MINUTE, AI_RATE_LIMIT_BURST)."""
+    return SlotRateLimiter(
+        client or get_redis(),
+        AI_RATE_KEY,
+        rate_per_minute=settings.ai_rate_limit_per_minute,
+        burst=settings.ai_rate_limit_burst,
+    )
+
+
+# Gemini generateContent (REST). 구조화 출력: responseJsonSchema에 NoticeExtraction 스키마 전달.
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+# 모델 입력 본문 상한(문자). body_text는 이미 정제된 텍스트지만 긴 첨부 표 등으로 토큰 초과 방지.
+_MAX_INPUT_CHARS = 20000
+# 429·5xx는 재시도 대상으로 raise(배치 태스크 지수 백오프), 그 밖의 4xx는 해당 공지만 건너뜀.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_EXTRACTION_INSTRUCTIONS = """너는 대학 공지에서 대상·일정·자격 요건을 뽑는 추출기다. 공지 본문에 적힌 내용만 사용하라.
+- 날짜는 YYYY-MM-DD. 연도가 없으면 공지 게시 연도로 보완하고, 날짜가 없으면 null.
+- 대상 학과·학년 판단이 애매하거나 조건이 명시되지 않았으면 ["전체"]로 두어 공지가 노출되게 하라.
+- hashtags는 장학·채용·행사·학사 등 분류어로 최대 5개, # 없이."""
+
+
+def extraction_to_result(extraction: NoticeExtraction) -> dict[str, Any]:
+    """NoticeExtraction → AI_RESULT_FIELDS 값. dates는 calendar_service가 읽는 [{"type", "date"}] 형태."""
+    event = extraction.event_title or "행사"
+    dates = [
+        {"type": schedule_type, "date": value}
+        for schedule_type, value in (
+            ("마감", extraction.deadline),
+            (event, extraction.event_start),
+            (f"{event} 종료", extraction.event_end),
+        )
+        if value
+    ]
+    return {
+        "ai_extracted_json": extraction.model_dump(exclude={"eligibility", "hashtags"}),
+        "dates": dates,
+        "eligibility": extraction.eligibility,
+        "hashtags": extraction.hashtags,
+    }
+
+
+class GeminiExtractor:
+    """
+    공지 1건 AI 추출 (Gemini 구조화 출력). 입력은 title + body_text(정제 본문; raw_html은 로드하지 않음).
+    응답은 NoticeExtraction 스키마로 검증(문자열에서 JSON을 긁어내지 않음). 반환: AI_RESULT_FIELDS 값,
+    차단·빈 응답·스키마 불일치·재시도 불가 오류면 None(로그). 429·5xx·네트워크 오류는 raise.
+    """
+
+    def __init__(self, api_key: str, model: str, *, timeout: float, client: httpx.Client | None = None) -> None:
+        self._url = GEMINI_API_URL.format(model=model)
+        self._headers = {"x-goog-api-key": api_key}
+        self._client = client or httpx.Client(timeout=timeout)
+        self._schema = NoticeExtraction.model_json_schema()
+
+    def __call__(self, notice: Notice) -> dict[str, Any] | None:
+        body = {
+            "systemInstruction": {"parts": [{"text": _EXTRACTION_INSTRUCTIONS}]},
+            "contents": [{"role": "user", "parts": [{"text": _notice_prompt(notice)}]}],
+            "generationConfig": {"responseMimeType": "application/json", "responseJsonSchema": self._schema},
+        }
+        response = self._client.post(self._url, headers=self._headers, json=body)
+        if response.status_code in _RETRY_STATUSES:
+            response.raise_for_status()
+        if response.is_error:
+            logger.warning("AI extract failed: notice_id=%s status=%s", notice.id, response.status_code)
+            return None
+        try:
+            text = response.json()["candidates"][0]["content"]["parts"][0]["text"]
+            return extraction_to_result(NoticeExtraction.model_validate_json(text))
+        except (KeyError, IndexError, TypeError, ValueError):
+            # ValidationError는 ValueError 하위. 차단(promptFeedback)·빈 후보도 여기로.
+            logger.warning("AI extract: no valid result notice_id=%s", notice.id, exc_info=True)
+            return None
+
+
+def _notice_prompt(notice: Notice) -> str:
+    published = notice.published_at.date().isoformat() if notice.published_at else "알 수 없음"
+    body = (notice.body_text or "")[:_MAX_INPUT_CHARS]
+    return f"제목: {notice.title}\n게시일: {published}\n\n{body}"
+
+
+_default_extractor: GeminiExtractor | None = None
+
+
+def default_extractor() -> Callable[[Notice], dict[str, Any] | None] | None:
+    """
+    워커 기본 추출기 (프로세스당 1개, HTTP 연결 재사용). GEMINI_API_KEY 미설정이면 None(모델 없음) —
+    모델 호출이 없으니 속도 제한 슬롯도 쓰지 않음.
+    """
+    global _default_extractor
+    if not settings.gemini_api_key:
+        return None
+    if _default_extractor is None:
+        _default_extractor = GeminiExtractor(
+            settings.gemini_api_key, settings.gemini_model, timeout=settings.gemini_timeout_seconds
+        )
+    return _default_extractor
+
+
+def process_ai_batch_sync(
+    session: Session,
+    notice_ids: Sequence[int],
+    *,
+    limiter: SlotRateLimiter,
+    extract: Callable[[Notice], dict[str, Any] | None] | None = None,
+) -> dict[str, int]:
+    """
+    공지 묶음 AI 처리 (동기, 워커용). 이미 ai_extracted_json이 있는 공지는 스킵(멱등).
+    조회 직후 commit으로 읽기 트랜잭션을 끝내고(expire_on_commit=False라 로드한 값 유지) 모델 호출마다
+    limiter.acquire() — 속도 제한 대기 동안 DB 연결이 idle in transaction으로 묶이지 않음.
+    extract 미지정 시 default_extractor(); 모델이 없으면(None) limiter 대기 없이 바로 반환.
+    추출 중 예외(429 등)면 그때까지의 결과를 반영한 뒤 raise.
+    결과는 bulk UPDATE 1번 + 공지별 일정·매칭 갱신 후 commit 1번, 이어서 결과가 있는 단과대의 응답 캐시 버전 갱신.
+    반환: {"loaded", "skipped", "extracted"}.
+    """
+    if extract is None:
+        extract = default_extractor()
+    notices = get_by_ids_sync(session, notice_ids, profile="ai_input")
+    session.commit()
+    pending = [n for n in notices if not n.ai_extracted_json]
+    results: dict[int, dict[str, Any]] = {}
+    if extract is None:
+        if pending:
+            logger.debug("AI batch: no model configured, %s notice(s) left for later", len(pending))
+    else:
+        try:
+            for notice in pending:
+                limiter.acquire()
+                extracted = extract(notice)
+                if extracted is not None:
+                    results[notice.id] = extracted
+        except Exception:
+            # 429·네트워크 오류 등: 그때까지의 결과는 반영한 뒤 raise → 태스크 재시도는 남은 공지만 호출(멱등 스킵)
+            if results:
+                _apply_results(session, pending, results)
+            raise
+    if results:
+        _apply_results(session, pending, results)
+    stats = {"loaded": len(notices), "skipped": len(notices) - len(pending), "extracted": len(results)}
+    if len(notices) < len(notice_ids):
+        logger.warning("AI batch: %s notice(s) not found", len(notice_ids) - len(notices))
+    return stats
+
+
+def _apply_results(session: Session, notices: Sequence[Notice], results: dict[int, dict[str, Any]]) -> None:
+    """추출 결과 bulk UPDATE 1번 + 공지별 일정·매칭 갱신 → commit → 결과가 있는 단과대 응답 캐시 버전 갱신."""
+    rows = [{"id": nid, **{f: r.get(f) for f in AI_RESULT_FIELDS}} for nid, r in results.items()]
+    bulk_update_ai_results_sync(session, rows)
+    for nid, r in results.items():
+        sync_notice_schedules_sync(session, nid, r.get("dates"))
+        refresh_notice_matches_sync(session, nid, r.get("ai_extracted_json"))
+    college_codes = get_external_ids_by_ids_sync(session, {n.college_id for n in notices if n.id in results})
+    session.commit()
+    bump_data_versions_sync(college_codes)
@@ -99,6 +99,19 @@ def create_jwt_pair(user_id: int) -> tuple[str, str]:
     return access_token, refresh_token
 
 
+def decode_access_token(token: str) -> int:
+    """Access JWT 검증 → user_id. 만료·서명 불일치·refresh 토큰이면 AuthError."""
+    if not settings.jwt_secret:
+        raise AuthError("JWT_SECRET not configured")
+    try:
+        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        if payload.get("type") != "access":
+            raise AuthError("Not an access token")
+        return int(payload["sub"])
+    except (jwt.InvalidTokenError, KeyError, ValueError) as e:
+        raise AuthError("Invalid access token") from e
+
+
 async def google_login(
     session: AsyncSession,
     code: str,
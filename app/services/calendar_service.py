@@ -0,0 +1,99 @@
+"""
+Calendar Service. 공지 일정(Notice.dates → notice_schedules) 정규화·동기화와 월별 달력 조회.
+Notice.dates를 쓰는 경로는 모두 save_notice_dates_sync를 거쳐야 notice_schedules와 어긋나지 않음.
+"""
+
+import re
+from collections.abc import Collection
+from datetime import date, datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.repositories.notice_repository import update_dates_sync
+from app.repositories.notice_schedule_repository import list_in_range, replace_for_notice_sync
+from app.repositories.user_calendar_event_repository import list_for_user_in_range
+from app.schemas.calendar import NoticeScheduleEvent, UserCalendarEventItem
+
+# 달력 월 경계 기준 시간대 (user_calendar_events.start_at은 timestamptz)
+CALENDAR_TZ = ZoneInfo("Asia/Seoul")
+
+# dates 항목의 "date": "2026-03-01" (AI 출력). 2026.3.1, 2026/03/01, 뒤에 시간이 붙은 값도 허용.
+_DATE_RE = re.compile(r"(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+_TYPE_MAX_LEN = 64
+
+
+def parse_schedule_entries(dates: list[dict[str, Any]] | None) -> list[tuple[str | None, date]]:
+    """Notice.dates → [(type, date)]. 날짜가 없거나 잘못된 항목은 제외, 같은 (type, date)는 1건."""
+    seen: set[tuple[str | None, date]] = set()
+    entries: list[tuple[str | None, date]] = []
+    for item in dates or []:
+        if not isinstance(item, dict) or not isinstance(item.get("date"), str):
+            continue
+        m = _DATE_RE.search(item["date"])
+        if not m:
+            continue
+        try:
+            d = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            continue
+        schedule_type = str(item.get("type") or "").strip()[:_TYPE_MAX_LEN] or None
+        if (schedule_type, d) in seen:
+            continue
+        seen.add((schedule_type, d))
+        entries.append((schedule_type, d))
+    return entries
+
+
+def save_notice_dates_sync(session: Session, notice_id: int, dates: list[dict[str, Any]] | None) -> None:
+    """Notice.dates 저장 + notice_schedules 교체를 같은 트랜잭션에서 (동기, 워커용). commit은 호출자."""
+    update_dates_sync(session, notice_id, dates)
+    sync_notice_schedules_sync(session, notice_id, dates)
+
+
+def sync_notice_schedules_sync(session: Session, notice_id: int, dates: list[dict[str, Any]] | None) -> None:
+    """이미 저장된(또는 같은 트랜잭션에서 bulk UPDATE한) dates로 notice_schedules만 교체."""
+    replace_for_notice_sync(session, notice_id, parse_schedule_entries(dates))
+
+
+def month_window(year: int, month: int) -> tuple[date, date]:
+    """해당 월 [1일, 다음 달 1일)."""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+async def list_notice_events(
+    session: AsyncSession,
+    *,
+    year: int,
+    month: int,
+    college_codes: Collection[str] | None = None,
+) -> list[NoticeScheduleEvent]:
+    """월별 공지 추출 일정 (notice_schedules 날짜 범위 스캔). 유저와 무관하므로 응답 캐시 대상."""
+    start, end = month_window(year, month)
+    rows = await list_in_range(session, start, end, college_codes=college_codes)
+    return [
+        NoticeScheduleEvent(
+            notice_id=schedule.notice_id,
+            college_code=code,
+            title=title,
+            url=url,
+            type=schedule.schedule_type,
+            date=schedule.schedule_date,
+        )
+        for schedule, title, url, code in rows
+    ]
+
+
+async def list_user_events(
+    session: AsyncSession, user_id: int, *, year: int, month: int
+) -> list[UserCalendarEventItem]:
+    """월별 유저 일정 ('내 달력에 추가'). 월 경계는 CALENDAR_TZ 기준."""
+    start, end = month_window(year, month)
+    start_at = datetime(start.year, start.month, start.day, tzinfo=CALENDAR_TZ)
+    end_at = datetime(end.year, end.month, end.day, tzinfo=CALENDAR_TZ)
+    events = await list_for_user_in_range(session, user_id, start_at, end_at)
+    return [UserCalendarEventItem.model_validate(e) for e in events]
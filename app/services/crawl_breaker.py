@@ -0,0 +1,161 @@
+"""
+호스트별 서킷 브레이커 (Redis 공유). 다운·차단된 대학 서버에 대한 재시도 폭주로 워커 슬롯이 묶이는 것 방지.
+- closed: 크롤 허용. 연속 실패(네트워크 오류·HostBackoffError)가 failure_threshold에 닿으면 open.
+- open: open_seconds 동안 같은 호스트 크롤은 즉시 skipped(crawl_runs status=skipped)로 종료.
+- half_open: open 기간이 지나면 워커 1곳만(probe 락) 목록 URL에 가벼운 탐침 요청. 실패하면 다시 open(기간 2배,
+  상한 max_open_seconds). 성공하면 시험 기간(trial): 크롤은 허용하되 실제 크롤이 trial_successes회 연속 성공해야
+  closed, 그 전에 1회라도 실패하면 곧바로 다시 open(기간 2배).
+상태는 Redis 해시 crawl:breaker:<host>(state·failures·open_until·open_seconds·trial). Redis 오류 시 허용(fail-open).
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import cast
+
+import redis
+
+from app.core.config import settings
+from app.core.metrics import CRAWL_BREAKER_EVENTS
+from app.services.crawl_scheduler import get_redis
+
+logger = logging.getLogger(__name__)
+
+BREAKER_KEY_PREFIX = "crawl:breaker:"
+# 마지막 상태 변경 후 이 시간이 지나면 상태 삭제(closed로 간주)
+BREAKER_STATE_TTL_SECONDS = 7 * 24 * 3600
+# half_open 탐침 락 TTL(초). 탐침 워커가 죽어도 다음 워커가 다시 탐침.
+PROBE_LOCK_TTL_SECONDS = 60
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class HostCircuitBreaker:
+    """
+    allow(host, probe)로 크롤 가능 여부 확인, 크롤 결과는 record_success / record_failure로 반영.
+    probe: half_open 탐침(성공 여부 반환). 예: crawl_http.probe_url(목록 URL).
+    trial_successes: 탐침 성공 후 closed로 돌아가기까지 필요한 연속 크롤 성공 수.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        *,
+        failure_threshold: int,
+        open_seconds: float,
+        max_open_seconds: float,
+        trial_successes: int = 1,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._r = client
+        self._threshold = max(1, failure_threshold)
+        self._open_seconds = max(1.0, open_seconds)
+        self._max_open_seconds = max(self._open_seconds, max_open_seconds)
+        self._trial_successes = max(1, trial_successes)
+        self._clock = clock
+
+    def _key(self, host: str) -> str:
+        return f"{BREAKER_KEY_PREFIX}{host}"
+
+    def state(self, host: str) -> dict[str, str]:
+        """현재 상태 해시 (없으면 빈 dict = closed)."""
+        return cast(dict[str, str], self._r.hgetall(self._key(host)))
+
+    def allow(self, host: str, probe: Callable[[], bool]) -> bool:
+        """크롤 허용 여부. open 기간이 지났으면 탐침 1회로 closed 또는 다시 open. Redis 오류는 허용."""
+        try:
+            current = self.state(host)
+            if current.get("state", CLOSED) == CLOSED or _in_trial(current):
+                return True
+            if self._clock() < float(current.get("open_until") or 0):
+                CRAWL_BREAKER_EVENTS.inc(host=host, event="skipped")
+                return False
+            # half_open: 탐침은 워커 1곳만. 락을 못 얻으면 탐침 결과 나올 때까지 skip.
+            if not self._r.set(f"{self._key(host)}:probe", "1", nx=True, ex=PROBE_LOCK_TTL_SECONDS):
+                CRAWL_BREAKER_EVENTS.inc(host=host, event="skipped")
+                return False
+            self._write(host, {"state": HALF_OPEN})
+        except redis.RedisError:
+            logger.warning("crawl breaker: state read failed host=%s, allowing", host, exc_info=True)
+            return True
+
+        ok = False
+        try:
+            ok = probe()
+        except Exception:
+            logger.warning("crawl breaker: probe raised host=%s", host, exc_info=True)
+        try:
+            if ok:
+                self._write(host, {"state": HALF_OPEN, "trial": 0, "failures": 0})
+                logger.info("crawl breaker trial: host=%s", host)
+            else:
+                self._reopen(host, current)
+            self._r.delete(f"{self._key(host)}:probe")
+        except redis.RedisError:
+            logger.warning("crawl breaker: probe result not saved host=%s", host, exc_info=True)
+        if not ok:
+            CRAWL_BREAKER_EVENTS.inc(host=host, event="skipped")
+        return ok
+
+    def record_success(self, host: str) -> None:
+        """크롤 성공. closed로 되돌리고 실패 횟수 초기화. 시험 기간이면 trial_successes회 연속 성공 시에만 closed."""
+        try:
+            current = self.state(host)
+            previous = current.get("state", CLOSED)
+            if _in_trial(current):
+                successes = cast(int, self._r.hincrby(self._key(host), "trial", 1))
+                if successes < self._trial_successes:
+                    return
+            self._r.delete(self._key(host))
+            if previous != CLOSED:
+                logger.info("crawl breaker closed: host=%s", host)
+                CRAWL_BREAKER_EVENTS.inc(host=host, event="closed")
+        except redis.RedisError:
+            logger.warning("crawl breaker: reset failed host=%s", host, exc_info=True)
+
+    def record_failure(self, host: str) -> None:
+        """크롤 실패(네트워크·차단) 1회. 연속 failure_threshold회면 open. 시험 기간이면 곧바로 다시 open(기간 2배)."""
+        try:
+            current = self.state(host)
+            if _in_trial(current):
+                self._reopen(host, current)
+                return
+            failures = cast(int, self._r.hincrby(self._key(host), "failures", 1))
+            self._r.expire(self._key(host), BREAKER_STATE_TTL_SECONDS)
+            if failures >= self._threshold and self.state(host).get("state", CLOSED) == CLOSED:
+                self._open(host, self._open_seconds)
+        except redis.RedisError:
+            logger.warning("crawl breaker: failure not recorded host=%s", host, exc_info=True)
+
+    def _reopen(self, host: str, current: dict[str, str]) -> None:
+        """탐침·시험 크롤 실패: 직전 open 기간의 2배(상한 max_open_seconds)로 다시 open."""
+        self._open(host, min(self._max_open_seconds, float(current.get("open_seconds") or 0) * 2))
+
+    def _open(self, host: str, seconds: float) -> None:
+        seconds = max(self._open_seconds, seconds)
+        self._r.hdel(self._key(host), "trial")
+        self._write(host, {"state": OPEN, "open_until": self._clock() + seconds, "open_seconds": seconds})
+        logger.warning("crawl breaker open: host=%s for %.0fs", host, seconds)
+        CRAWL_BREAKER_EVENTS.inc(host=host, event="opened")
+
+    def _write(self, host: str, mapping: dict[str, str | float]) -> None:
+        self._r.hset(self._key(host), mapping=mapping)
+        self._r.expire(self._key(host), BREAKER_STATE_TTL_SECONDS)
+
+
+def default_breaker(client: redis.Redis | None = None) -> HostCircuitBreaker:
+    """settings 기준 HostCircuitBreaker."""
+    return HostCircuitBreaker(
+        client or get_redis(),
+        failure_threshold=settings.crawl_breaker_failure_threshold,
+        open_seconds=settings.crawl_breaker_open_seconds,
+        max_open_seconds=settings.crawl_breaker_max_open_seconds,
+        trial_successes=settings.crawl_breaker_trial_successes,
+    )
+
+
+def _in_trial(current: dict[str, str]) -> bool:
+    """탐침 성공 후 시험 기간(half_open + trial 필드)인지."""
+    return current.get("state") == HALF_OPEN and "trial" in current
@@ -0,0 +1,207 @@
+"""
+크롤 스케줄러: 호스트별 동시 실행 한도(Redis lease) + crawl_runs 이력 기반 단과대별 적응형 크롤 주기.
+trigger-crawl → schedule_crawls_task가 due 단과대를 pending(Redis hash)에 적재하고 빈 슬롯만큼 즉시 시작.
+crawl_college_task 종료 시 lease 반환 후 dispatch_crawls_task로 다음 pending 시작(고정 stagger 없음).
+목록 백필(backfill_college_task) 진행 페이지 체크포인트도 Redis hash(crawl:backfill)에 저장.
+"""
+
+import json
+import logging
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime, timedelta
+from typing import cast
+
+import redis
+
+from app.core.config import settings
+from app.core.crawler_config import COLLEGE_CODE_TO_MODULE, get_crawl_host
+from app.models.crawl_run import CrawlRun
+
+logger = logging.getLogger(__name__)
+
+# pending 단과대: field=college_code, value="1"(증분) | "0"(전체 재수집)
+PENDING_KEY = "crawl:pending"
+LEASE_KEY_PREFIX = "crawl:lease:"
+# 목록 백필 진행: field=college_code, value=JSON {page: 다음에 읽을 목록 페이지(0부터), last_urls: 직전 페이지 URL}
+BACKFILL_KEY = "crawl:backfill"
+_LEASE_SEP = "#"
+
+# 적응형 주기 산정에 쓰는 crawl_runs 이력 기간.
+HISTORY_WINDOW = timedelta(days=14)
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    """스케줄러용 Redis 클라이언트 (프로세스당 1개). rediss://면 워커와 같이 인증서 검증 생략."""
+    global _redis_client
+    if _redis_client is None:
+        url = settings.redis_url or "redis://localhost:6379/0"
+        kwargs: dict = {"decode_responses": True}
+        if url.startswith("rediss://"):
+            kwargs["ssl_cert_reqs"] = None
+        _redis_client = redis.Redis.from_url(url, **kwargs)
+    return _redis_client
+
+
+def compute_crawl_interval(
+    runs: Sequence[CrawlRun],
+    *,
+    min_interval: timedelta,
+    max_interval: timedelta,
+) -> timedelta:
+    """
+    성공 이력(최신순)의 관측 게시 속도로 크롤 주기 산정: 주기 = 관측 구간 / 구간 내 upsert 건수
+    (신규 공지 1건당 크롤 1회 기대). 이력 2건 미만이면 min_interval, 신규 0건이면 max_interval.
+    """
+    ok = [(r.finished_at, r.notices_upserted) for r in runs if r.status == "success" and r.finished_at is not None]
+    if len(ok) < 2:
+        return min_interval
+    span = ok[0][0] - ok[-1][0]
+    # 가장 오래된 run의 건수는 관측 구간 이전에 게시된 공지이므로 제외
+    posted = sum(count for _, count in ok[:-1])
+    if span <= timedelta(0):
+        return min_interval
+    if posted <= 0:
+        return max_interval
+    return max(min_interval, min(max_interval, span / posted))
+
+
+def is_crawl_due(
+    runs: Sequence[CrawlRun],
+    now: datetime,
+    *,
+    interval: timedelta,
+    running_timeout: timedelta,
+) -> bool:
+    """최근 성공 후 interval 경과 시 due. 실행 중(running_timeout 이내)이면 아님, 이력 없음·최근 실패면 due."""
+    if not runs:
+        return True
+    latest = runs[0]
+    if latest.status == "running" and now - latest.started_at < running_timeout:
+        return False
+    if latest.status == "failed":
+        return True
+    last_ok = next((r for r in runs if r.status == "success" and r.finished_at is not None), None)
+    if last_ok is None or last_ok.finished_at is None:
+        return True
+    return now - last_ok.finished_at >= interval
+
+
+def select_due_colleges(
+    college_codes: Iterable[str],
+    history: Mapping[str, Sequence[CrawlRun]],
+    now: datetime,
+) -> list[str]:
+    """college_codes 중 settings 주기 하한·상한 기준으로 크롤할 때가 된 단과대만 반환."""
+    min_interval = timedelta(minutes=settings.crawl_min_interval_minutes)
+    max_interval = timedelta(minutes=settings.crawl_max_interval_minutes)
+    running_timeout = timedelta(seconds=settings.crawl_lease_ttl_seconds)
+    due: list[str] = []
+    for code in college_codes:
+        runs = history.get(code, [])
+        interval = compute_crawl_interval(runs, min_interval=min_interval, max_interval=max_interval)
+        if is_crawl_due(runs, now, interval=interval, running_timeout=running_timeout):
+            due.append(code)
+        else:
+            logger.debug("crawl not due: college_code=%s interval=%s", code, interval)
+    return due
+
+
+class HostLeases:
+    """
+    호스트별 동시 크롤 슬롯 (Redis SET NX EX). 슬롯 키 crawl:lease:<host>:<i>, 값은 소유 토큰.
+    TTL로 워커가 죽어도 슬롯이 영구 점유되지 않음. release는 토큰이 일치할 때만 삭제.
+    """
+
+    def __init__(self, client: redis.Redis, *, limit: int, ttl_seconds: int) -> None:
+        self._r = client
+        self._limit = max(1, limit)
+        self._ttl = max(1, ttl_seconds)
+
+    def acquire(self, host: str) -> str | None:
+        """빈 슬롯이 있으면 점유 후 lease 문자열 반환, 없으면 None."""
+        token = uuid.uuid4().hex
+        for slot in range(self._limit):
+            key = f"{LEASE_KEY_PREFIX}{host}:{slot}"
+            if self._r.set(key, token, nx=True, ex=self._ttl):
+                return f"{key}{_LEASE_SEP}{token}"
+        return None
+
+    def release(self, lease: str) -> None:
+        """acquire가 반환한 lease 반환. 이미 만료·재점유된 슬롯은 건드리지 않음."""
+        key, _, token = lease.rpartition(_LEASE_SEP)
+        if key and self._r.get(key) == token:
+            self._r.delete(key)
+
+
+def default_leases(client: redis.Redis | None = None) -> HostLeases:
+    """settings 기준 HostLeases."""
+    return HostLeases(
+        client or get_redis(),
+        limit=settings.crawl_host_concurrency,
+        ttl_seconds=settings.crawl_lease_ttl_seconds,
+    )
+
+
+def enqueue_pending(client: redis.Redis, college_codes: Iterable[str], *, incremental: bool) -> None:
+    """pending에 단과대 적재. 전체 재수집(incremental=False) 요청은 기존 증분 요청을 덮어씀."""
+    for code in college_codes:
+        if incremental:
+            client.hsetnx(PENDING_KEY, code, "1")
+        else:
+            client.hset(PENDING_KEY, code, "0")
+
+
+def dispatch_pending(
+    client: redis.Redis,
+    leases: HostLeases,
+    start: Callable[[str, bool, str], None],
+) -> list[str]:
+    """
+    pending 단과대 중 호스트 슬롯을 얻은 것만 start(college_code, incremental, lease)로 시작.
+    슬롯이 없는 단과대는 pending에 남아 다음 dispatch(다른 크롤 종료 시)에서 시작. 반환: 시작한 단과대 코드.
+    """
+    started: list[str] = []
+    pending = cast(dict[str, str], client.hgetall(PENDING_KEY))
+    for code, flag in pending.items():
+        module_name = COLLEGE_CODE_TO_MODULE.get(code)
+        if not module_name:
+            client.hdel(PENDING_KEY, code)
+            continue
+        lease = leases.acquire(get_crawl_host(module_name))
+        if lease is None:
+            continue
+        # 동시 dispatch 경합: pending에서 먼저 지운 쪽만 시작
+        if not client.hdel(PENDING_KEY, code):
+            leases.release(lease)
+            continue
+        try:
+            start(code, flag == "1", lease)
+        except Exception:
+            leases.release(lease)
+            client.hsetnx(PENDING_KEY, code, flag)
+            raise
+        started.append(code)
+    return started
+
+
+def get_backfill_checkpoint(client: redis.Redis, college_code: str) -> tuple[int, set[str]]:
+    """백필을 이어서 시작할 목록 페이지(0부터)와 직전 페이지 URL 집합. 기록 없으면 (0, 빈 집합)."""
+    value = cast(str | None, client.hget(BACKFILL_KEY, college_code))
+    if not value:
+        return 0, set()
+    data = json.loads(value)
+    if isinstance(data, int):  # 이전 형식(페이지 번호만)
+        return data, set()
+    return int(data["page"]), set(data.get("last_urls") or [])
+
+
+def set_backfill_checkpoint(client: redis.Redis, college_code: str, page: int, last_urls: set[str]) -> None:
+    """page 이전 목록 페이지는 처리(upsert·commit) 완료로 기록. last_urls: 직전 페이지 URL(반복 페이지 판정용)."""
+    client.hset(BACKFILL_KEY, college_code, json.dumps({"page": page, "last_urls": sorted(last_urls)}))
+
+
+def clear_backfill_checkpoint(client: redis.Redis, college_code: str) -> None:
+    client.hdel(BACKFILL_KEY, college_code)
@@ -1,22 +1,46 @@
 """
-크롤 디스패처/서비스: config → get_*_links / scrape_*_detail, 1초 딜레이, external_id·content_hash → Repository.
-HTTP 미의존. 비동기(웹)·동기(워커) 세션 모두 지원.
+크롤 디스패처/서비스: config → get_*_links / scrape_*_detail, 호스트별 요청 간격(crawl_rate),
+external_id·content_hash → Repository.
+동기(워커): 크롤러 get_*/scrape_* 그대로 사용. 비동기(웹·스크립트): AsyncCrawlClient + parse_* 로
+호스트별 polite 스케줄링하며 여러 단과대 동시 크롤(crawl_colleges).
+증분 모드(기본): 목록의 external_id를 일괄 조회해 신규·목록 제목 변경 공지만 상세 fetch.
 """
 
 import asyncio
+import base64
 import hashlib
 import logging
 import re
-import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from urllib.parse import parse_qs, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
-from sqlalchemy.ext.asyncio import AsyncSession
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
+from app.core.blob_store import BlobStore, get_blob_store, sniff_image_type
 from app.core.config import settings
-from app.core.crawler_config import COLLEGE_CODE_TO_MODULE, CRAWLER_CONFIG, get_crawler
+from app.core.crawl_http import (
+    POOL_MAXSIZE,
+    AsyncCrawlClient,
+    AsyncHostThrottle,
+    FetchInfo,
+    HtmlTooLargeError,
+    fetch_html_with_info,
+    host_of,
+)
+from app.core.crawl_rate import HostRateController, get_rate_controller
+from app.core.crawler_config import (
+    COLLEGE_CODE_TO_MODULE,
+    CRAWLER_CONFIG,
+    get_max_list_pages,
+    get_parsers,
+    list_page_url,
+)
+from app.core.response_cache import bump_data_versions_sync
 from app.repositories.college_repository import (
     get_by_external_id as get_college_by_external_id,
 )
@@ -24,21 +48,32 @@ from app.repositories.college_repository import (
     get_by_external_id_sync as get_college_by_external_id_sync,
 )
 from app.repositories.notice_repository import (
+    get_known_titles,
+    get_known_titles_sync,
     upsert_notices_bulk,
     upsert_notices_bulk_sync,
 )
+from app.services.crawl_stats import CrawlStats
+from app.services.crawlers.body_text import render_body_text
 
 logger = logging.getLogger(__name__)
 
 # 요청/페이지 간 최소 딜레이(초). 부하·IP 차단 완화. .env POLITE_DELAY_SECONDS로 오버라이드 가능.
 POLITE_DELAY_SECONDS = settings.polite_delay_seconds
 
-# asyncio.to_thread 호출 상한(초). 스레드 풀 고갈 방지.
+# 페이지 1건 fetch 상한(초).
 CRAWL_PAGE_TIMEOUT_SECONDS = 30
 
 # 본문 HTML 최대 바이트. 초과 시 해당 공지 스킵(OOM 방지).
 MAX_HTML_BYTES = 5 * 1024 * 1024
 
+# 스트리밍 upsert 배치 상한(행 수·payload 바이트). 둘 중 먼저 닿으면 flush·commit.
+UPSERT_BATCH_ROWS = settings.crawl_upsert_batch_rows
+UPSERT_BATCH_BYTES = settings.crawl_upsert_batch_bytes
+
+# 증분 크롤: 목록(최신순)에서 이미 적재된 공지가 연속 N건이면 나머지 행은 확인하지 않음.
+INCREMENTAL_KNOWN_STREAK = 5
+
 
 def _normalize_url_for_hash(url: str) -> str:
     """쿼리 스트링 노이즈(utm, session 등) 제거 후 URL 재조립. 동일 공지가 서로 다른 URL로 무한 적재되는 것 방지."""
@@ -98,12 +133,99 @@ def _external_id_from_url(url: str) -> str:
         return hashlib.sha256(path_only.encode()).hexdigest()[:32]
 
 
-def _content_hash_from_title_and_html(title: str, content_html: str | None) -> str:
-    """제목 + 순수 본문 텍스트(get_text())만으로 sha256."""
-    body_text = ""
-    if content_html:
-        soup = BeautifulSoup(content_html, "html.parser")
-        body_text = soup.get_text(separator="\n", strip=True)
+def _external_id_for_post(post: dict) -> str:
+    """목록 행 → external_id. build_notice_payload와 동일 규칙(no 우선·URL fallback)."""
+    return post.get("no") or _external_id_from_url(post.get("url") or "")
+
+
+def _list_title_changed(list_title: str | None, stored_title: str | None) -> bool:
+    """
+    목록 행 제목이 저장된 제목과 다르면 변경 신호. 목록 전용 표기는 무시:
+    앞쪽 [카테고리] 접두어(UIC 등), 말줄임(... / …)으로 잘린 제목.
+    """
+    if not list_title or not stored_title:
+        return False
+    listed = " ".join(list_title.split())
+    stored = " ".join(stored_title.split())
+    if listed == stored:
+        return False
+    listed = re.sub(r"^\[[^\]]*\]\s*", "", listed)
+    if listed == stored:
+        return False
+    if listed.endswith(("...", "…")):
+        return not stored.startswith(listed.rstrip(".…").rstrip())
+    return True
+
+
+def iter_list_pages(
+    config: dict,
+    fetch_links: Callable[[str], list[dict]],
+    *,
+    start_page: int = 0,
+    max_pages: int = 1,
+    last_page_urls: set[str] | None = None,
+) -> Iterator[list[dict]]:
+    """
+    목록 페이지를 하나씩 lazily fetch해 링크 목록을 yield (fetch_links: 페이지 URL → 파싱된 링크).
+    소비 측이 멈추면 다음 페이지는 요청하지 않음. 빈 페이지, 새 URL이 하나도 없는 페이지(범위 밖 페이지를
+    마지막 페이지로 돌려주는 게시판), max_pages 도달 시 종료.
+    last_page_urls: 직전 페이지 URL 집합. 이 집합과 비교해 시작하고, yield한 페이지의 URL로 제자리 갱신
+    → 페이지를 나눠 여러 번 호출(백필)해도 반복 페이지를 목록 끝으로 판정.
+    """
+    previous = last_page_urls if last_page_urls is not None else set()
+    seen = set(previous)
+    for page in range(start_page, start_page + max(1, max_pages)):
+        links = fetch_links(list_page_url(config, page))
+        urls = {post.get("url") or "" for post in links}
+        if not links or urls <= seen:
+            return
+        seen |= urls
+        previous.clear()
+        previous |= urls
+        yield links
+
+
+def _iter_posts_to_fetch(
+    pages: Iterable[list[dict]],
+    lookup_known: Callable[[set[str]], dict[str, str]],
+    known_streak_stop: int = INCREMENTAL_KNOWN_STREAK,
+) -> Iterator[dict]:
+    """
+    증분 크롤 대상을 페이지 단위로 선별해 yield. 신규 external_id 또는 목록 제목이 바뀐 공지만.
+    기존 공지 조회(lookup_known: external_id 집합 → 저장된 제목)는 페이지마다 1번.
+    기존 공지가 known_streak_stop건 연속이면(페이지 경계 넘어서도) 중단 — 이후 페이지는 fetch하지 않음.
+    0이면 끝까지 확인(백필).
+    """
+    seen: set[str] = set()
+    streak = 0
+    for links in pages:
+        known_titles = lookup_known({_external_id_for_post(p) for p in links})
+        for post in links:
+            ext_id = _external_id_for_post(post)
+            if ext_id in seen:
+                continue
+            seen.add(ext_id)
+            stored_title = known_titles.get(ext_id)
+            if stored_title is None or _list_title_changed(post.get("title") or post.get("title_hint"), stored_title):
+                yield post
+                streak = 0
+                continue
+            streak += 1
+            if known_streak_stop and streak >= known_streak_stop:
+                return
+
+
+def _select_posts_to_fetch(
+    links: list[dict],
+    known_titles: dict[str, str],
+    known_streak_stop: int = INCREMENTAL_KNOWN_STREAK,
+) -> list[dict]:
+    """한 페이지 links에서 증분 크롤 대상 선별 (_iter_posts_to_fetch 단일 페이지판, 비동기 엔진용)."""
+    return list(_iter_posts_to_fetch([links], lambda _ids: known_titles, known_streak_stop))
+
+
+def _content_hash(title: str, body_text: str) -> str:
+    """제목 + 본문 텍스트(Notice.body_text, render_body_text 정의)로 sha256. content_hash 정의는 여기 한 곳."""
     raw = f"{title}\n{body_text}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
@@ -166,10 +288,13 @@ def build_notice_payload(
     html_content: str | None,
     images: list | None,
     attachments: list | None,
+    body_text: str | None = None,
 ) -> dict | None:
     """
     한 건 공지 스크랩 결과 → upsert용 payload dict. 스킵 시 None(로깅 후 반환).
     순수 함수: HTTP/DB 미의존. crawl_college / crawl_college_sync 공통.
+    body_text: 크롤러가 이미 파싱한 트리에서 렌더링한 본문 텍스트(render_body_text). 없으면 html_content로 렌더링.
+    body_text는 Notice.body_text로 저장되어 content_hash·AI 입력·전문 검색이 같은 값을 사용.
     """
     if not title:
         return None
@@ -191,7 +316,9 @@ def build_notice_payload(
         )
         return None
     external_id = post.get("no") or _external_id_from_url(detail_url)
-    content_hash = _content_hash_from_title_and_html(title, html_content)
+    if body_text is None:
+        body_text = render_body_text(html_content)
+    content_hash = _content_hash(title, body_text)
     published_at = _parse_published_at(date_str)
     att_dicts = _attachments_to_dicts(attachments or [])
     return {
@@ -200,6 +327,7 @@ def build_notice_payload(
         "title": title,
         "url": detail_url or None,
         "raw_html": html_content,
+        "body_text": body_text,
         "images": images,
         "attachments": att_dicts,
         "content_hash": content_hash,
@@ -207,12 +335,97 @@ def build_notice_payload(
     }
 
 
-async def crawl_college(session: AsyncSession, college_code: str) -> int:
+def externalize_inline_images(images: list | None, store: BlobStore) -> list | None:
+    """
+    base64 인라인 이미지 → blob 저장소에 올리고 {"type": "blob", "key", "name", "content_type", "size"} 참조로 치환.
+    같은 이미지는 같은 키(중복 저장 없음). 디코딩·저장 실패 시 해당 이미지는 인라인 유지(데이터 보존, 로그).
+    """
+    if not images:
+        return images
+    result: list = []
+    for img in images:
+        if not (isinstance(img, dict) and img.get("type") == "base64"):
+            result.append(img)
+            continue
+        try:
+            data = base64.b64decode("".join(str(img.get("data") or "").split()), validate=True)
+            if not data:
+                raise ValueError("empty image data")
+            content_type = sniff_image_type(data)
+            key = store.put(data, content_type)
+        except Exception as e:
+            logger.warning("inline image externalize failed (kept inline): name=%s error=%s", img.get("name"), e)
+            result.append(img)
+            continue
+        result.append(
+            {"type": "blob", "key": key, "name": img.get("name"), "content_type": content_type, "size": len(data)}
+        )
+    return result
+
+
+def _payload_size(payload: dict) -> int:
+    """배치 상한 판단용 payload 크기 추정(raw_html + body_text + 이미지 data 문자열 길이)."""
+    size = len(payload.get("raw_html") or "") + len(payload.get("body_text") or "")
+    for img in payload.get("images") or []:
+        if isinstance(img, dict):
+            size += len(str(img.get("data") or ""))
+    return size
+
+
+class NoticeBatcher:
+    """
+    upsert payload를 행 수·바이트 상한까지 모았다가 배치로 내줌 (DB 미의존).
+    add()가 배치를 반환하면 호출 측이 즉시 upsert·commit → 크롤 결과 수와 무관하게 메모리 상한 유지.
+    같은 external_id 중복(고정 공지 반복 노출)은 배치 경계와 무관하게 한 번만 통과.
     """
-    단과대 1개 크롤: config에서 모듈·URL 조회 → get_*_links → (1초 딜레이 후) scrape_*_detail
-    → external_id(no 우선·URL fallback), content_hash 계산 → Repository.upsert_notice.
+
+    def __init__(self, max_rows: int = UPSERT_BATCH_ROWS, max_bytes: int = UPSERT_BATCH_BYTES) -> None:
+        self._max_rows = max(1, max_rows)
+        self._max_bytes = max(1, max_bytes)
+        self._rows: list[dict] = []
+        self._bytes = 0
+        self._seen_external_ids: set[str] = set()
+        self.total = 0
+
+    def add(self, payload: dict) -> list[dict] | None:
+        """payload 추가. 상한 도달 시 flush할 배치 반환, 아니면 None. 중복 external_id는 무시."""
+        ext_id = payload["external_id"]
+        if ext_id in self._seen_external_ids:
+            return None
+        self._seen_external_ids.add(ext_id)
+        self._rows.append(payload)
+        self._bytes += _payload_size(payload)
+        self.total += 1
+        if len(self._rows) >= self._max_rows or self._bytes >= self._max_bytes:
+            return self.drain()
+        return None
+
+    def drain(self) -> list[dict]:
+        """남은 payload를 배치로 반환하고 비움."""
+        batch, self._rows, self._bytes = self._rows, [], 0
+        return batch
+
+
+async def crawl_college(
+    session: AsyncSession,
+    college_code: str,
+    *,
+    incremental: bool = True,
+    client: AsyncCrawlClient | None = None,
+) -> int:
+    """
+    단과대 1개 크롤 (비동기 엔진): AsyncCrawlClient로 목록·상세 HTML fetch → parse_* (네트워크 없음)
+    → external_id(no 우선·URL fallback), content_hash 계산 → Repository.upsert_notices_bulk.
+    polite 딜레이는 client의 호스트별 throttle이 담당(같은 호스트만 간격 유지, 다른 단과대는 동시 진행).
+    client 미지정 시 POLITE_DELAY_SECONDS throttle로 1회용 client 생성.
+    incremental=True면 이미 적재된 공지(목록 제목 동일)는 상세 fetch 생략. False면 목록 전체 재수집.
+    upsert는 NoticeBatcher 배치 단위로 session.commit (메모리 상한·부분 실패 시 앞선 배치 보존).
     반환: upsert한 공지 개수.
     """
+    if client is None:
+        async with AsyncCrawlClient(AsyncHostThrottle(POLITE_DELAY_SECONDS)) as own_client:
+            return await crawl_college(session, college_code, incremental=incremental, client=own_client)
+
     college = await get_college_by_external_id(session, college_code)
     if not college:
         raise ValueError(f"College not found: {college_code}")
@@ -226,68 +439,163 @@ async def crawl_college(session: AsyncSession, college_code: str) -> int:
         raise ValueError(f"No crawler config or url for: {module_name}")
 
     list_url = config["url"]
-    get_links_fn, scrape_fn = get_crawler(module_name)
+    encoding = config.get("encoding")
+    parse_links_fn, parse_detail_fn = get_parsers(module_name)
 
     try:
-        links = await asyncio.wait_for(
-            asyncio.to_thread(get_links_fn, list_url),
+        list_html = await asyncio.wait_for(
+            client.fetch_html(list_url, encoding=encoding),
             timeout=CRAWL_PAGE_TIMEOUT_SECONDS,
         )
-    except TimeoutError:
+    except (TimeoutError, httpx.TimeoutException):
         logger.warning(
             "crawl_college get_links timeout: college_code=%s list_url=%s",
             college_code,
             list_url[:200] if list_url else "",
         )
         return 0
+    except HtmlTooLargeError as e:
+        logger.warning("crawl_college list HTML too large: college_code=%s %s", college_code, e)
+        return 0
 
+    links = await asyncio.to_thread(parse_links_fn, list_html, list_url)
     if not links:
         return 0
 
-    notices: list[dict] = []
-    seen_external_ids = set() # ★ Bulk Upsert 에러 방어용 중복 체크 Set
+    if incremental:
+        known = await get_known_titles(session, college.id, {_external_id_for_post(p) for p in links})
+        links = _select_posts_to_fetch(links, known)
+        if not links:
+            return 0
 
-    for post in links:
-        await asyncio.sleep(POLITE_DELAY_SECONDS)
+    # ★ 배치 스트리밍 upsert: 상한마다 upsert·commit (중복 ID 방어 포함)
+    batcher = NoticeBatcher()
+    store = get_blob_store()
 
+    for post in links:
         detail_url = post.get("url") or ""
         try:
-            title, date_str, html_content, images, attachments = await asyncio.wait_for(
-                asyncio.to_thread(scrape_fn, detail_url),
+            detail_html = await asyncio.wait_for(
+                client.fetch_html(detail_url, encoding=encoding),
                 timeout=CRAWL_PAGE_TIMEOUT_SECONDS,
             )
-        except TimeoutError:
+        except (TimeoutError, httpx.TimeoutException):
             logger.warning(
                 "crawl_college scrape timeout: url=%s",
                 detail_url[:200] if detail_url else "",
             )
             continue
+        except HtmlTooLargeError as e:
+            logger.warning("crawl_college detail HTML too large: url=%s %s", detail_url[:200], e)
+            continue
+        except httpx.HTTPError as e:
+            logger.warning("crawl_college detail fetch failed: url=%s %s", detail_url[:200], e)
+            continue
 
-        payload = build_notice_payload(
-            college.id, post, detail_url, title, date_str, html_content, images, attachments
-        )
+        # (title, date, html, images, attachments[, body_text]) — 6번째는 렌더링된 본문 텍스트(선택)
+        detail = await asyncio.to_thread(parse_detail_fn, detail_html, detail_url)
+
+        payload = build_notice_payload(college.id, post, detail_url, *detail)
         if payload is None:
             continue
+        payload["images"] = await asyncio.to_thread(externalize_inline_images, payload["images"], store)
 
-        # ★ 중복 ID 방어 로직 (동일한 목록에 고정 공지가 여러 번 뜰 때 예방)
-        ext_id = payload["external_id"]
-        if ext_id in seen_external_ids:
-            continue
-        seen_external_ids.add(ext_id)
+        batch = batcher.add(payload)
+        if batch:
+            await _flush_async(session, college_code, batch)
 
-        notices.append(payload)
+    batch = batcher.drain()
+    if batch:
+        await _flush_async(session, college_code, batch)
+    return batcher.total
 
-    if not notices:
-        return 0
-    await upsert_notices_bulk(session, notices)
-    return len(notices)
 
+async def _flush_async(session: AsyncSession, college_code: str, batch: list[dict]) -> None:
+    """배치 upsert·commit 후 변경이 있으면 응답 캐시 데이터 버전 갱신."""
+    ids = await upsert_notices_bulk(session, batch)
+    await session.commit()
+    if ids:
+        await asyncio.to_thread(bump_data_versions_sync, [college_code])
 
-def crawl_college_sync(session: Session, college_code: str) -> tuple[int, list[int]]:
+
+async def crawl_colleges(
+    session_maker: async_sessionmaker[AsyncSession],
+    college_codes: Iterable[str],
+    *,
+    incremental: bool = True,
+) -> dict[str, int]:
+    """
+    여러 단과대 동시 크롤. client·호스트별 throttle 1개를 공유해 단과대(호스트)끼리는 병렬,
+    같은 호스트 요청은 POLITE_DELAY_SECONDS 간격 유지. 단과대마다 별도 세션으로 upsert 후 commit.
+    한 단과대 실패는 로그만 남기고 나머지는 계속. 반환: {college_code: upsert 개수} (실패는 -1).
+    """
+    codes = list(dict.fromkeys(college_codes))
+
+    async def _one(code: str, client: AsyncCrawlClient) -> int:
+        async with session_maker() as session:
+            count = await crawl_college(session, code, incremental=incremental, client=client)
+            await session.commit()
+            return count
+
+    async with AsyncCrawlClient(AsyncHostThrottle(POLITE_DELAY_SECONDS)) as client:
+        results = await asyncio.gather(*(_one(code, client) for code in codes), return_exceptions=True)
+
+    counts: dict[str, int] = {}
+    for code, result in zip(codes, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.exception("crawl_colleges failed: college_code=%s", code, exc_info=result)
+            counts[code] = -1
+        else:
+            counts[code] = result
+    return counts
+
+
+def _detail_concurrency(config: dict) -> int:
+    """CRAWLER_CONFIG detail_concurrency(기본 1)를 settings 상한·호스트 커넥션 풀 크기로 제한."""
+    wanted = int(config.get("detail_concurrency") or 1)
+    return max(1, min(wanted, settings.crawl_detail_max_concurrency, POOL_MAXSIZE))
+
+
+def _fetch_detail(
+    url: str, encoding: str | None, rate: HostRateController, stats: CrawlStats
+) -> tuple[str, FetchInfo]:
+    """상세 1건: 호스트 차례 대기 후 fetch (fetch 스레드에서 실행)."""
+    with stats.stage("polite_sleep"):
+        rate.wait(host_of(url))
+    with stats.stage("detail_fetch"):
+        return fetch_html_with_info(url, encoding=encoding, rate=rate)
+
+
+def crawl_college_sync(
+    session: Session,
+    college_code: str,
+    *,
+    incremental: bool = True,
+    on_batch: Callable[[list[int]], None] | None = None,
+    stats: CrawlStats | None = None,
+    rate: HostRateController | None = None,
+    start_page: int = 0,
+    max_pages: int | None = None,
+    known_streak_stop: int = INCREMENTAL_KNOWN_STREAK,
+    last_page_urls: set[str] | None = None,
+) -> tuple[int, list[int]]:
     """
     단과대 1개 크롤 (동기, Celery 워커 전용). 동기 DB 세션·Repository 사용.
-    get_*_links / (1초 sleep) / scrape_*_detail → upsert_notice_sync.
+    fetch_html → parse_*_links / (호스트 간격 대기) / fetch_html → parse_*_detail → upsert_notices_bulk_sync.
+    상세 fetch는 CRAWLER_CONFIG detail_concurrency개 스레드로 겹쳐 받고(파싱은 메인 스레드에서 목록 순서대로),
+    요청 간격은 rate(기본 get_rate_controller: 호스트별 AIMD, 워커 공유)가 응답을 보고 조절.
+    호스트가 crawl_rate_max_wait_seconds 넘게 막혀 있으면 HostBackoffError로 중단(앞선 배치는 commit됨).
+    incremental=True면 상세 fetch 전에 목록 external_id를 페이지마다 일괄 조회해 신규·목록 제목 변경분만 fetch.
+    (본문만 수정되고 제목이 그대로인 공지는 incremental=False 전체 재수집에서 반영.)
+    목록은 start_page부터 max_pages(기본 CRAWLER_CONFIG pagination max_pages, 미설정 1)쪽까지 필요할 때만 fetch:
+    기존 공지가 known_streak_stop건 연속이면 다음 페이지는 요청하지 않음(0이면 max_pages까지, 백필용).
+    첫 페이지(start_page) 목록 fetch 실패(크기 초과·네트워크)는 raise, 이후 페이지 실패는 로그만 남기고 그 페이지에서
+    목록 종료.
+    last_page_urls: iter_list_pages에 그대로 전달(백필이 페이지 단위 호출 사이에 직전 페이지를 이어 줌).
     content_hash가 바뀌었거나 신규 공지는 4단계 AI 큐 대상이므로 notice_id 목록으로 반환.
+    upsert는 NoticeBatcher 배치(UPSERT_BATCH_ROWS/BYTES) 단위로 commit. on_batch가 있으면 배치마다
+    변경 notice_id로 즉시 호출(크롤 종료 전 AI 큐 적재).
+    stats가 있으면 단계별 소요 시간·페이지·바이트·304·스킵 사유를 채움(예외로 중단돼도 그때까지 값 유지).
     반환: (upsert한 개수, AI 처리 대상 notice_id 목록).
     """
     college = get_college_by_external_id_sync(session, college_code)
@@ -302,21 +610,88 @@ def crawl_college_sync(session: Session, college_code: str) -> tuple[int, list[i
     if not config or not config.get("url"):
         raise ValueError(f"No crawler config or url for: {module_name}")
 
-    list_url = config["url"]
-    get_links_fn, scrape_fn = get_crawler(module_name)
-    links = get_links_fn(list_url)
-    if not links:
-        return (0, [])
-
-    notices: list[dict] = []
-    seen_external_ids = set() # ★ Bulk Upsert 에러 방어용 중복 체크 Set
-
-    for post in links:
-        time.sleep(POLITE_DELAY_SECONDS)
-
-        detail_url = post.get("url") or ""
+    if stats is None:
+        stats = CrawlStats()
+    if rate is None:
+        rate = get_rate_controller()
+    encoding = config.get("encoding")
+    parse_links_fn, parse_detail_fn = get_parsers(module_name)
+    list_pages_read = 0
+
+    def _fetch_list_page(page_url: str) -> list[dict]:
+        """
+        목록 1쪽 fetch·파싱. 첫 페이지(start_page)의 크기 초과·네트워크 오류는 그대로 raise(태스크 재시도, 백필은
+        체크포인트 유지), 이후 페이지는 [] 반환(목록 종료).
+        """
+        nonlocal list_pages_read
+        list_pages_read += 1
+        with stats.stage("polite_sleep"):
+            rate.wait(host_of(page_url))
         try:
-            title, date_str, html_content, images, attachments = scrape_fn(detail_url)
+            with stats.stage("list_fetch"):
+                list_html, info = fetch_html_with_info(page_url, encoding=encoding, rate=rate)
+        except HtmlTooLargeError as e:
+            stats.skip("too_large")
+            if list_pages_read == 1:
+                raise
+            logger.warning("crawl_college_sync list HTML too large: college_code=%s %s", college_code, e)
+            return []
+        except (TimeoutError, OSError) as e:
+            stats.skip("fetch_error")
+            if list_pages_read == 1:
+                raise
+            logger.warning("crawl_college_sync list page failed: url=%s error=%s", page_url[:200], e)
+            return []
+        stats.record_fetch(info)
+        with stats.stage("parse"):
+            links = parse_links_fn(list_html, page_url) or []
+        stats.links_listed += len(links)
+        return links
+
+    pages = iter_list_pages(
+        config,
+        _fetch_list_page,
+        start_page=start_page,
+        max_pages=max_pages if max_pages is not None else get_max_list_pages(config),
+        last_page_urls=last_page_urls,
+    )
+    posts: Iterable[dict]
+    if incremental:
+        posts = _iter_posts_to_fetch(
+            pages,
+            lambda ids: get_known_titles_sync(session, college.id, ids),
+            known_streak_stop,
+        )
+    else:
+        posts = (post for links in pages for post in links)
+
+    # ★ 배치 스트리밍 upsert: 상한마다 upsert·commit → 중간 실패해도 앞선 배치는 보존 (중복 ID 방어 포함)
+    batcher = NoticeBatcher()
+    store = get_blob_store()
+    changed_ids: list[int] = []
+    built = 0
+
+    def _flush(batch: list[dict]) -> None:
+        with stats.stage("upsert"):
+            ids = upsert_notices_bulk_sync(session, batch)
+            session.commit()
+        changed_ids.extend(ids)
+        stats.notices_changed += len(ids)
+        stats.skip("unchanged", len(batch) - len(ids))
+        if ids:
+            bump_data_versions_sync([college_code])
+        if on_batch is not None and ids:
+            on_batch(ids)
+
+    def _handle(post: dict, detail_url: str, fetched: Future[tuple[str, FetchInfo]]) -> None:
+        """fetch 결과 1건 → 파싱·payload·배치 (메인 스레드, 목록 순서대로)."""
+        nonlocal built
+        try:
+            detail_html, info = fetched.result()
+        except HtmlTooLargeError as e:
+            logger.warning("crawl_college_sync detail HTML too large: url=%s %s", detail_url[:200], e)
+            stats.skip("too_large")
+            return
         except (TimeoutError, OSError) as e:
             logger.warning(
                 "scrape failed (timeout/network): url=%s error=%s",
@@ -324,7 +699,13 @@ def crawl_college_sync(session: Session, college_code: str) -> tuple[int, list[i
                 e,
                 exc_info=True,
             )
-            continue
+            stats.skip("fetch_error")
+            return
+        stats.record_fetch(info)
+        try:
+            with stats.stage("parse"):
+                # (title, date, html, images, attachments[, body_text]) — 6번째는 렌더링된 본문 텍스트(선택)
+                detail = parse_detail_fn(detail_html, detail_url)
         except Exception as e:
             logger.warning(
                 "scrape failed (parser/other): url=%s error=%s",
@@ -332,24 +713,48 @@ def crawl_college_sync(session: Session, college_code: str) -> tuple[int, list[i
                 e,
                 exc_info=True,
             )
-            continue
+            stats.skip("parse_error")
+            return
 
-        payload = build_notice_payload(
-            college.id, post, detail_url, title, date_str, html_content, images, attachments
-        )
+        with stats.stage("hash"):
+            payload = build_notice_payload(college.id, post, detail_url, *detail)
         if payload is None:
-            continue
-
-        # ★ 중복 ID 방어 로직 (동일한 목록에 고정 공지가 여러 번 뜰 때 예방)
-        ext_id = payload["external_id"]
-        if ext_id in seen_external_ids:
-            continue
-        seen_external_ids.add(ext_id)
-
-        notices.append(payload)
-
-    if not notices:
-        return (0, [])
-    notice_ids_to_process = upsert_notices_bulk_sync(session, notices)
-    session.commit()
-    return (len(notices), notice_ids_to_process)
+            stats.skip("invalid")
+            return
+        with stats.stage("images"):
+            payload["images"] = externalize_inline_images(payload["images"], store)
+
+        built += 1
+        batch = batcher.add(payload)
+        if batch:
+            _flush(batch)
+
+    # 상세 fetch는 스레드 concurrency개(호스트 간격은 rate가 유지), 파싱·upsert는 메인 스레드에서 목록 순서대로.
+    # 미리 받아 두는 페이지는 concurrency*2건까지(메모리 상한: 페이지당 MAX_HTML_BYTES).
+    concurrency = _detail_concurrency(config)
+    window = concurrency * 2
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"crawl-{college_code}")
+    pending: deque[tuple[dict, str, Future[tuple[str, FetchInfo]]]] = deque()
+    selected = 0
+    try:
+        for post in posts:
+            selected += 1
+            detail_url = post.get("url") or ""
+            pending.append((post, detail_url, pool.submit(_fetch_detail, detail_url, encoding, rate, stats)))
+            if len(pending) >= window:
+                _handle(*pending.popleft())
+        while pending:
+            _handle(*pending.popleft())
+    finally:
+        # HostBackoffError 등으로 중단 시 아직 시작 안 한 fetch는 취소
+        pool.shutdown(wait=True, cancel_futures=True)
+    if incremental:
+        stats.skip("known", stats.links_listed - selected)
+        if not selected and stats.links_listed:
+            logger.info("crawl_college_sync: no new notices (incremental) college_code=%s", college_code)
+
+    batch = batcher.drain()
+    if batch:
+        _flush(batch)
+    stats.skip("duplicate", built - batcher.total)
+    return (batcher.total, changed_ids)
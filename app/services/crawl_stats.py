@@ -0,0 +1,130 @@
+"""
+크롤 1회 단계별 계측(CrawlStats → crawl_runs.stats JSONB)과 GET /internal/crawl-stats 단과대별 백분위 요약.
+느린 크롤이 목록/상세 fetch·polite sleep·파싱·해시·이미지 이전·DB upsert 중 어디서 시간을 쓰는지 구분용.
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.crawl_http import FetchInfo
+from app.models.crawl_run import CrawlRun
+
+# 단계: 목록 fetch, 상세 fetch, polite sleep, HTML 파싱(parse_*), body_text 렌더링·content_hash(payload 생성),
+# 인라인 이미지 blob 이전, DB upsert(+commit)
+STAGES = ("list_fetch", "detail_fetch", "polite_sleep", "parse", "hash", "images", "upsert")
+# 스킵 사유: known(증분 모드 기존 공지), fetch_error, too_large, parse_error, invalid(제목 없음 등),
+# duplicate(같은 external_id 반복), unchanged(upsert했지만 content_hash 동일)
+SUMMARY_PERCENTILES = (50, 95)
+
+
+@dataclass
+class CrawlStats:
+    """크롤 1회 계측값. crawl_college_sync가 채우고 태스크가 to_dict()를 crawl_runs.stats로 저장."""
+
+    pages_fetched: int = 0
+    bytes_downloaded: int = 0
+    not_modified: int = 0
+    links_listed: int = 0
+    notices_changed: int = 0
+    skipped: Counter[str] = field(default_factory=Counter)
+    stage_ms: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    clock: Callable[[], float] = field(default=time.perf_counter, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        with 블록 소요 시간을 stage_ms[name]에 누적 (예외로 빠져나와도 기록). 스레드 안전 —
+        상세 동시 fetch 시 polite_sleep·detail_fetch는 스레드별 시간의 합(벽시계 시간보다 클 수 있음).
+        """
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = (self.clock() - start) * 1000
+            with self._lock:
+                self.stage_ms[name] = self.stage_ms.get(name, 0.0) + elapsed
+
+    def record_fetch(self, info: FetchInfo) -> None:
+        self.pages_fetched += 1
+        self.bytes_downloaded += info.bytes_read
+        if info.not_modified:
+            self.not_modified += 1
+
+    def skip(self, reason: str, count: int = 1) -> None:
+        if count > 0:
+            self.skipped[reason] += count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pages_fetched": self.pages_fetched,
+            "bytes_downloaded": self.bytes_downloaded,
+            "not_modified": self.not_modified,
+            "links_listed": self.links_listed,
+            "notices_changed": self.notices_changed,
+            "skipped": dict(self.skipped),
+            "stage_ms": {k: round(v, 1) for k, v in self.stage_ms.items()},
+        }
+
+
+def percentile(values: Sequence[float], q: float) -> float | None:
+    """선형 보간 백분위 (q: 0~100). 값이 없으면 None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def _distribution(values: list[float]) -> dict[str, float | None]:
+    dist: dict[str, float | None] = {f"p{q}": percentile(values, q) for q in SUMMARY_PERCENTILES}
+    dist["max"] = max(values) if values else None
+    return dist
+
+
+def summarize_runs(runs: Iterable[tuple[CrawlRun, str]]) -> dict[str, dict[str, Any]]:
+    """
+    (CrawlRun, college_code) → 단과대별 요약: 실행 수·상태별 수, 완료된 run의 소요 시간·단계별 ms·
+    페이지·바이트 백분위, 스킵 사유 합계. stats 없는 run(계측 이전)은 소요 시간만 반영.
+    """
+    grouped: dict[str, list[CrawlRun]] = {}
+    for run, code in runs:
+        grouped.setdefault(code, []).append(run)
+
+    summary: dict[str, dict[str, Any]] = {}
+    for code, college_runs in sorted(grouped.items()):
+        durations: list[float] = []
+        stage_values: dict[str, list[float]] = {s: [] for s in STAGES}
+        pages: list[float] = []
+        bytes_: list[float] = []
+        skipped: Counter[str] = Counter()
+        statuses: Counter[str] = Counter()
+        for run in college_runs:
+            statuses[run.status] += 1
+            if run.finished_at is not None and run.started_at is not None:
+                durations.append((run.finished_at - run.started_at).total_seconds() * 1000)
+            stats = run.stats or {}
+            if not stats:
+                continue
+            for name, ms in (stats.get("stage_ms") or {}).items():
+                stage_values.setdefault(name, []).append(float(ms))
+            pages.append(float(stats.get("pages_fetched") or 0))
+            bytes_.append(float(stats.get("bytes_downloaded") or 0))
+            skipped.update(stats.get("skipped") or {})
+        summary[code] = {
+            "runs": len(college_runs),
+            "status": dict(statuses),
+            "duration_ms": _distribution(durations),
+            "stage_ms": {name: _distribution(values) for name, values in stage_values.items()},
+            "pages_fetched": _distribution(pages),
+            "bytes_downloaded": _distribution(bytes_),
+            "skipped": dict(skipped),
+        }
+    return summary
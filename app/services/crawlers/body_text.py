@@ -0,0 +1,107 @@
+"""
+공지 본문 텍스트 렌더링 (Notice.body_text). upsert 시 1번만 만들고 AI 입력·content_hash·전문 검색이 모두 이 값을 읽음.
+- script/style/noscript/iframe/svg/img/form 등 제거 (data:image base64·스타일이 모델 입력에 섞이지 않음)
+- 표는 가벼운 markdown(| a | b |), 목록은 "- ", 블록 요소는 줄바꿈, 인라인 요소는 이어 붙임
+- 공백 정리·빈 줄·연속 중복 줄·상투 문구("목록", "이전글" 등) 제거
+입력 트리는 수정하지 않음(크롤러가 같은 트리에서 첨부·이미지를 계속 읽을 수 있음).
+"""
+
+import re
+
+from bs4 import NavigableString, Tag
+from bs4.element import PreformattedString
+
+from app.services.crawlers.html_backend import make_fragment_soup
+
+_SKIP_TAGS = frozenset(
+    {"script", "style", "noscript", "iframe", "svg", "img", "form", "button", "input", "select", "textarea", "head"}
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "p", "div", "section", "article", "header", "footer", "aside", "main", "blockquote", "pre",
+        "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "dl", "dt", "dd", "hr", "figure", "figcaption",
+        "address", "center",
+    }
+)
+_BOILERPLATE_LINES = frozenset({"목록", "목록보기", "이전글", "다음글", "인쇄", "프린트", "top", "맨 위로"})
+_INLINE_SPACE_RE = re.compile(r"[ \t\r\f\v\u00a0\u3000]+")
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+
+
+def _cell_text(cell: Tag) -> str:
+    parts: list[str] = []
+    _render_children(cell, parts)
+    text = _INLINE_SPACE_RE.sub(" ", "".join(parts).replace("\n", " ")).strip()
+    return text.replace("|", "\\|")
+
+
+def _table_markdown(table: Tag) -> str:
+    rows: list[list[str]] = []
+    for tr in table.find_all("tr"):
+        if not isinstance(tr, Tag) or tr.find_parent("table") is not table:
+            continue
+        cells = [_cell_text(c) for c in tr.find_all(["td", "th"], recursive=False) if isinstance(c, Tag)]
+        if any(cells):
+            rows.append(cells)
+    if not rows:
+        return ""
+    width = max(len(r) for r in rows)
+    lines = []
+    for i, row in enumerate(rows):
+        lines.append("| " + " | ".join(row + [""] * (width - len(row))) + " |")
+        if i == 0:
+            lines.append("|" + " --- |" * width)
+    return "\n".join(lines)
+
+
+def _render_children(node: Tag, out: list[str]) -> None:
+    for child in node.children:
+        if isinstance(child, NavigableString):
+            if not isinstance(child, PreformattedString):  # 주석·CDATA·doctype 제외
+                out.append(str(child))
+            continue
+        if not isinstance(child, Tag) or child.name in _SKIP_TAGS:
+            continue
+        name = child.name
+        if name == "br":
+            out.append("\n")
+        elif name == "table":
+            out.append("\n" + _table_markdown(child) + "\n")
+        elif name == "li":
+            out.append("\n- ")
+            _render_children(child, out)
+            out.append("\n")
+        elif name in _BLOCK_TAGS or name == "tr":
+            out.append("\n")
+            _render_children(child, out)
+            out.append("\n")
+        else:
+            _render_children(child, out)
+
+
+def _compact_lines(text: str) -> str:
+    lines: list[str] = []
+    for raw in _ZERO_WIDTH_RE.sub("", text).split("\n"):
+        line = _INLINE_SPACE_RE.sub(" ", raw).strip()
+        if not line or line == "-" or line.lower() in _BOILERPLATE_LINES:
+            continue
+        if lines and lines[-1] == line:
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def render_body_text(content: Tag | str | None) -> str:
+    """
+    본문 트리(또는 HTML 조각 문자열) → 압축 텍스트. 태그·엔티티가 없는 순수 텍스트 본문(공대·인공지능융합대)은
+    파싱 없이 줄 정리만.
+    """
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        if "<" not in content and "&" not in content:
+            return _compact_lines(content)
+        content = make_fragment_soup(content)
+    out: list[str] = []
+    _render_children(content, out)
+    return _compact_lines("".join(out))
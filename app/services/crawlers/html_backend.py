@@ -0,0 +1,60 @@
+"""
+크롤러 공통 HTML 파서 백엔드. 모든 크롤러·content_hash는 BeautifulSoup을 직접 만들지 않고 이 모듈을 거침.
+- make_soup: 페이지 전체(목록·상세) 파싱. 기본 lxml(C 파서), 미설치 시 html.parser로 자동 fallback.
+- make_fragment_soup: 본문 조각 재파싱(깊은 복사·주석 구간 추출·해시). str() 왕복 결과가 기존과 같도록
+  항상 html.parser 사용 (lxml은 조각을 <html><body>로 감싸 raw_html·content_hash가 달라짐).
+BeautifulSoup API(find/select/주석 형제 탐색)는 백엔드와 무관하게 동일하므로 크롤러 코드 변경 없음.
+"""
+
+import logging
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_BACKEND = "html.parser"
+
+# BeautifulSoup features 이름 → 필요한 모듈
+_BACKEND_MODULES: dict[str, str | None] = {
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+    FALLBACK_BACKEND: None,
+}
+
+_backend: str | None = None
+
+
+def available_backends() -> list[str]:
+    """현재 환경에서 사용 가능한 백엔드 이름 (벤치마크용)."""
+    return [name for name, module in _BACKEND_MODULES.items() if module is None or find_spec(module) is not None]
+
+
+def set_parser_backend(name: str | None) -> str:
+    """문서 파싱 백엔드 지정(None이면 settings). 미설치·미지원이면 html.parser. 반환: 실제 적용된 백엔드."""
+    global _backend
+    requested = name or settings.html_parser_backend
+    if requested in available_backends():
+        _backend = requested
+    else:
+        logger.warning("HTML parser backend %r unavailable, falling back to %s", requested, FALLBACK_BACKEND)
+        _backend = FALLBACK_BACKEND
+    return _backend
+
+
+def get_parser_backend() -> str:
+    """현재 문서 파싱 백엔드. 첫 호출 시 settings.html_parser_backend로 결정."""
+    return _backend or set_parser_backend(None)
+
+
+def make_soup(html: str | bytes) -> BeautifulSoup:
+    """목록·상세 페이지 전체 파싱 (빠른 백엔드)."""
+    return BeautifulSoup(html, get_parser_backend())
+
+
+def make_fragment_soup(html: str) -> BeautifulSoup:
+    """본문 HTML 조각 파싱. 왕복 직렬화·해시 안정성을 위해 항상 html.parser."""
+    return BeautifulSoup(html, FALLBACK_BACKEND)
+
@@ -4,11 +4,10 @@ import re
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Comment, NavigableString, Tag
-from requests.exceptions import RequestException
+from bs4 import Comment, NavigableString, Tag
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.html_backend import make_fragment_soup, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -77,10 +76,9 @@ def extract_between_comments(soup, start_keyword, end_keyword):
         curr = curr.next_sibling
     return tags
 
-def scrape_computing_detail(url):
+def parse_computing_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         # 1. 제목
         title = "제목 없음"
@@ -104,7 +102,7 @@ def scrape_computing_detail(url):
 
         if body_tags:
             temp_html = "".join(str(t) for t in body_tags)
-            temp_soup = BeautifulSoup(temp_html, 'html.parser')
+            temp_soup = make_fragment_soup(temp_html)
 
             content_text = get_text_structurally(temp_soup)
             content_text = re.sub(r'\n\s*\n+', '\n\n', content_text).strip()
@@ -156,24 +154,31 @@ def scrape_computing_detail(url):
 
         return title, date, content_text, images, attachments
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_computing_detail parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_computing_detail parsing error url=%s, error=%s", url, e)
         raise
 
 
+def scrape_computing_detail(url):
+    """fetch_html → parse_computing_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("scrape_computing_detail HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_computing_detail(html, url)
+
+
 # ==============================================================================
 # [2] 목록(List) 크롤링 엔진 (NEW)
 # ==============================================================================
 
-def get_computing_notice_links(list_url):
+def parse_computing_notice_links(html, list_url):
     """
     그누보드 게시판 목록에서 '공지'를 제외하고 '번호'가 있는 게시물의 링크를 추출합니다.
     """
     try:
-        response = requests.get(list_url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         links = []
 
@@ -225,8 +230,16 @@ def get_computing_notice_links(list_url):
 
         return links
 
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_computing_notice_links parsing error list_url=%s", list_url)
+        logger.exception("parse_computing_notice_links parsing error list_url=%s", list_url)
+        return []
+
+
+def get_computing_notice_links(list_url):
+    """fetch_html → parse_computing_notice_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(list_url)
+    except HtmlTooLargeError:
+        logger.warning("get_computing_notice_links HTML too large: url=%s", list_url[:200] if list_url else "")
         return []
+    return parse_computing_notice_links(html, list_url)
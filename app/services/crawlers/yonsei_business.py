@@ -4,11 +4,12 @@ import re
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Tag
-from requests.exceptions import RequestException
+from bs4 import Tag
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.core.crawler_config import CRAWLER_CONFIG
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_fragment_soup, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +31,12 @@ def normalize_date(date_str):
         logger.warning("normalize_date failed (format change?): date_str=%r", date_str[:100] if date_str else None)
         return date_str
 
-def clean_html_content(element: Tag) -> str:
-    """HTML 본문 정제 (스크립트 제거, 표 보존, 하단 버튼 제거). 원본 보호를 위해 문자열로 깊은 복사."""
-    element_copy = BeautifulSoup(str(element), 'html.parser')
+def clean_html_content(element: Tag) -> tuple[str, str]:
+    """
+    HTML 본문 정제 (스크립트 제거, 표 보존, 하단 버튼 제거).
+    원본 보호를 위해 문자열로 깊은 복사. 반환: (정제 HTML, 본문 텍스트(Notice.body_text)).
+    """
+    element_copy = make_fragment_soup(str(element))
 
     # 보안상 제거
     for tag in element_copy.find_all(['script', 'style', 'noscript', 'iframe', 'img']):
@@ -49,23 +53,18 @@ def clean_html_content(element: Tag) -> str:
         if not table.get('border'):
             table['border'] = "1"
 
-    return element_copy.decode_contents().strip()
+    return element_copy.decode_contents().strip(), render_body_text(element_copy)
 
 # ==============================================================================
 # [2] 목록 수집 엔진 (List Crawler)
 # ==============================================================================
 
-def get_business_notice_links(list_url):
+def parse_business_notice_links(html, list_url):
     """
     경영대 게시판에서 <td class="Subject"> 내부의 링크만 수집
     """
     try:
-        response = requests.get(list_url, headers=CRAWLER_HEADERS, timeout=10)
-
-        # ★ 경영대 인코딩 보정 (CP949/EUC-KR)
-        response.encoding = 'cp949'  # 경영대 게시판 CP949/EUC-KR 명시
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
         links: list[dict[str, Any]] = []
 
         # 1. <td class="Subject"> 찾기
@@ -111,24 +110,27 @@ def get_business_notice_links(list_url):
 
         return links
 
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_business_notice_links parsing error list_url=%s", list_url)
+        logger.exception("parse_business_notice_links parsing error list_url=%s", list_url)
         return []
 
+
+def get_business_notice_links(list_url):
+    """fetch_html → parse_business_notice_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(list_url, encoding=CRAWLER_CONFIG["yonsei_business"].get("encoding"))
+    except HtmlTooLargeError:
+        logger.warning("get_business_notice_links HTML too large: url=%s", list_url[:200] if list_url else "")
+        return []
+    return parse_business_notice_links(html, list_url)
+
 # ==============================================================================
 # [3] 상세 페이지 수집 엔진 (Detail Crawler) - app5.py 로직 계승
 # ==============================================================================
 
-def scrape_business_detail(url):
+def parse_business_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-
-        # ★ 인코딩 보정
-        response.encoding = 'cp949'  # 경영대 게시판 CP949/EUC-KR 명시
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         # 1. 제목
         title = "제목 없음"
@@ -156,9 +158,10 @@ def scrape_business_detail(url):
 
         # 3. 본문 (HTML 보존)
         content_html = ""
+        body_text: str | None = None  # 본문 텍스트(Notice.body_text) (재파싱 생략)
         container = soup.find('div', id='BoardContent')
         if container and isinstance(container, Tag):
-            content_html = clean_html_content(container)
+            content_html, body_text = clean_html_content(container)
         else:
             content_html = "(본문 BoardContent를 찾을 수 없습니다)"
 
@@ -208,10 +211,18 @@ def scrape_business_detail(url):
                 if fname and fname not in attachments:
                     attachments.append(fname)
 
-        return title, date, content_html, images, attachments
+        return title, date, content_html, images, attachments, body_text
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_business_detail parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_business_detail parsing error url=%s, error=%s", url, e)
         raise
+
+
+def scrape_business_detail(url):
+    """fetch_html → parse_business_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url, encoding=CRAWLER_CONFIG["yonsei_business"].get("encoding"))
+    except HtmlTooLargeError:
+        logger.warning("scrape_business_detail HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_business_detail(html, url)
@@ -3,12 +3,11 @@ import os
 import re
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from bs4 import Comment, NavigableString, Tag
 from bs4.element import PageElement
-from requests.exceptions import RequestException
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.html_backend import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -59,13 +58,9 @@ def finalize_text(text):
     text = re.sub(r'\n\s*\n+', '\n\n', text)
     return text.strip()
 
-def scrape_yonsei_engineering_precise(url):
+def parse_yonsei_engineering_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        if response.status_code != 200:
-            return None, "접속 실패", None, [], []
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         # 제목
         title = "제목 없음"
@@ -180,19 +175,26 @@ def scrape_yonsei_engineering_precise(url):
 
         return title, date, content_text, images_data, attachment_names
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_yonsei_engineering_precise parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_yonsei_engineering_detail parsing error url=%s, error=%s", url, e)
         raise
 
+
+def scrape_yonsei_engineering_precise(url):
+    """fetch_html → parse_yonsei_engineering_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("scrape_yonsei_engineering_precise HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_yonsei_engineering_detail(html, url)
+
 # --------------------------------------------------------------------------------
 # [2] 리스트 페이지 크롤러
 # --------------------------------------------------------------------------------
-def get_notice_links(list_url):
+def parse_notice_links(html, list_url):
     try:
-        response = requests.get(list_url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         links = []
         rows = soup.select('tbody tr')
@@ -225,8 +227,16 @@ def get_notice_links(list_url):
 
         return links
 
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_notice_links parsing error list_url=%s", list_url)
+        logger.exception("parse_notice_links parsing error list_url=%s", list_url)
+        return []
+
+
+def get_notice_links(list_url):
+    """fetch_html → parse_notice_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(list_url)
+    except HtmlTooLargeError:
+        logger.warning("get_notice_links HTML too large: url=%s", list_url[:200] if list_url else "")
         return []
+    return parse_notice_links(html, list_url)
@@ -4,10 +4,11 @@ import re
 import urllib.parse
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
-from requests.exceptions import RequestException
+from bs4 import Tag
 
 from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,11 @@ def normalize_date(date_str):
 # ================================================================================
 # [2] GLC 리스트 페이지 크롤링 엔진 (새로 추가됨)
 # ================================================================================
-def get_glc_links(url):
+def parse_glc_links(html, url):
     """GLC 공지사항 목록에서 '공지'를 제외하고 숫자 번호를 가진 일반 글 링크만 추출합니다."""
     links = []
     try:
-        html = fetch_html(url)
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
 
         # KBoard 게시판의 목록 행(tr) 탐색
         rows = soup.find_all('tr')
@@ -73,22 +73,26 @@ def get_glc_links(url):
                         "url": full_url
                     })
         return links
+    except Exception:
+        logger.exception("parse_glc_links parsing error url=%s", url)
+        return []
+
+
+def get_glc_links(url):
+    """fetch_html → parse_glc_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
     except HtmlTooLargeError:
         logger.warning("get_glc_links HTML too large: url=%s", url[:200] if url else "")
         return []
-    except RequestException:
-        raise
-    except Exception:
-        logger.exception("get_glc_links parsing error url=%s", url)
-        return []
+    return parse_glc_links(html, url)
 
 # ================================================================================
 # [3] GLC 상세 페이지 크롤링 엔진 (기존 로직 유지)
 # ================================================================================
-def scrape_glc_detail(url):
+def parse_glc_detail(html, url):
     try:
-        html = fetch_html(url)
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
 
         # 1. 제목 추출
         title = "제목 없음"
@@ -108,6 +112,7 @@ def scrape_glc_detail(url):
 
         # 3. 본문 및 4. 이미지 추출
         content_html = ""
+        body_text: str | None = None  # 본문 텍스트(Notice.body_text) (재파싱 생략)
         images = []
 
         content_div = soup.find('div', class_='content-view')
@@ -146,6 +151,7 @@ def scrape_glc_detail(url):
                     table['border'] = "1"
 
             content_html = content_div.decode_contents().strip()
+            body_text = render_body_text(content_div)
         else:
             content_html = "(본문 영역을 찾을 수 없습니다)"
 
@@ -159,13 +165,18 @@ def scrape_glc_detail(url):
             if fname and fname not in attachments:
                 attachments.append(fname)
 
-        return title, date, content_html, images, attachments
+        return title, date, content_html, images, attachments, body_text
+
+    except Exception as e:
+        logger.exception("parse_glc_detail parsing error url=%s, error=%s", url, e)
+        raise
+
 
+def scrape_glc_detail(url):
+    """fetch_html → parse_glc_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
     except HtmlTooLargeError:
         logger.warning("scrape_glc_detail HTML too large: url=%s", url[:200] if url else "")
         return "제목 없음", "날짜 없음", "", [], []
-    except RequestException:
-        raise
-    except Exception as e:
-        logger.exception("scrape_glc_detail parsing error url=%s, error=%s", url, e)
-        raise
+    return parse_glc_detail(html, url)
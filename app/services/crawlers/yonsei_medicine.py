@@ -4,12 +4,12 @@ import re
 from typing import Any
 from urllib.parse import parse_qs, urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup, Comment, Tag
+from bs4 import Comment, Tag
 from bs4.element import PageElement
-from requests.exceptions import RequestException
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_fragment_soup, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +32,12 @@ def normalize_date(date_str):
         logger.warning("normalize_date failed (format change?): date_str=%r", date_str[:100] if date_str else None)
         return date_str
 
-def clean_html_content(element: Tag) -> str:
-    """HTML 본문 정제 (스크립트 제거, 표 보존). 원본 보호를 위해 문자열로 깊은 복사."""
-    element_copy = BeautifulSoup(str(element), 'html.parser')
+def clean_html_content(element: Tag) -> tuple[str, str]:
+    """
+    HTML 본문 정제 (스크립트 제거, 표 보존).
+    원본 보호를 위해 문자열로 깊은 복사. 반환: (정제 HTML, 본문 텍스트(Notice.body_text)).
+    """
+    element_copy = make_fragment_soup(str(element))
 
     # 보안상 제거
     for tag in element_copy.find_all(['script', 'style', 'noscript', 'iframe', 'img']):
@@ -47,20 +50,19 @@ def clean_html_content(element: Tag) -> str:
         if not table.get('border'):
             table['border'] = "1"
 
-    return element_copy.decode_contents().strip()
+    return element_copy.decode_contents().strip(), render_body_text(element_copy)
 
 # ==============================================================================
 # [2] 목록 수집 엔진 (List Crawler) - 수정됨
 # ==============================================================================
 
-def get_medicine_notice_links(list_url):
+def parse_medicine_notice_links(html, list_url):
     """
     게시판 목록에서 'bbs-item' 클래스를 가진 요소들의 링크를 수집합니다.
     (페이지네이션 버튼 전까지만 수집하는 효과)
     """
     try:
-        response = requests.get(list_url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         links: list[dict[str, Any]] = []
 
@@ -105,20 +107,27 @@ def get_medicine_notice_links(list_url):
 
         return links
 
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_medicine_notice_links parsing error list_url=%s", list_url)
+        logger.exception("parse_medicine_notice_links parsing error list_url=%s", list_url)
         return []
 
+
+def get_medicine_notice_links(list_url):
+    """fetch_html → parse_medicine_notice_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(list_url)
+    except HtmlTooLargeError:
+        logger.warning("get_medicine_notice_links HTML too large: url=%s", list_url[:200] if list_url else "")
+        return []
+    return parse_medicine_notice_links(html, list_url)
+
 # ==============================================================================
 # [3] 상세 페이지 수집 엔진 (Detail Crawler) - 기존 유지
 # ==============================================================================
 
-def scrape_medicine_detail(url):
+def parse_medicine_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         # 1. 제목
         title = "제목 없음"
@@ -141,6 +150,7 @@ def scrape_medicine_detail(url):
 
         # 3. 본문 (HTML 구조 보존)
         content_html = ""
+        body_text: str | None = None  # 본문 텍스트(Notice.body_text) (재파싱 생략)
         fr_view = soup.find('div', class_='fr-view')
 
         if isinstance(fr_view, Tag):
@@ -155,7 +165,7 @@ def scrape_medicine_detail(url):
                     curr = nxt
 
             # HTML 정제 (이미지 제거, 표 보존)
-            content_html = clean_html_content(fr_view)
+            content_html, body_text = clean_html_content(fr_view)
         else:
             content_html = "(본문 영역 .fr-view를 찾을 수 없습니다)"
 
@@ -210,10 +220,18 @@ def scrape_medicine_detail(url):
                     if fname and fname not in attachments:
                         attachments.append(fname)
 
-        return title, date, content_html, images, attachments
+        return title, date, content_html, images, attachments, body_text
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_medicine_detail parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_medicine_detail parsing error url=%s, error=%s", url, e)
         raise
+
+
+def scrape_medicine_detail(url):
+    """fetch_html → parse_medicine_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("scrape_medicine_detail HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_medicine_detail(html, url)
@@ -4,11 +4,11 @@ import re
 import urllib.parse
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Comment, Tag
-from requests.exceptions import RequestException
+from bs4 import Comment, Tag
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_fragment_soup, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ def get_body_soup(soup):
         temp_html += str(curr)
         curr = curr.next_sibling
 
-    temp_soup = BeautifulSoup(temp_html, 'html.parser')
+    temp_soup = make_fragment_soup(temp_html)
 
     files_div = temp_soup.find('div', class_='nxb-view__files')
     if files_div:
@@ -49,10 +49,9 @@ def get_body_soup(soup):
 
     return temp_soup
 
-def scrape_science_detail(url):
+def parse_science_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         title = "제목 없음"
         t_tag = soup.find('h3', class_='nxb-view__header-title')
@@ -69,6 +68,7 @@ def scrape_science_detail(url):
                     break
 
         content_html = ""
+        body_text: str | None = None  # 본문 텍스트(Notice.body_text) (재파싱 생략)
         images = []
 
         temp_soup = get_body_soup(soup)
@@ -101,6 +101,7 @@ def scrape_science_detail(url):
                 if not table.get('border'):
                     table['border'] = "1"
             content_html = temp_soup.decode_contents().strip()
+            body_text = render_body_text(temp_soup)
         else:
             content_html = "(본문 영역을 찾을 수 없습니다)"
 
@@ -113,23 +114,29 @@ def scrape_science_detail(url):
             if fname and fname not in attachments:
                 attachments.append(fname)
 
-        return title, date, content_html, images, attachments
+        return title, date, content_html, images, attachments, body_text
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_science_detail parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_science_detail parsing error url=%s, error=%s", url, e)
         raise
 
+
+def scrape_science_detail(url):
+    """fetch_html → parse_science_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("scrape_science_detail HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_science_detail(html, url)
+
 # ================================================================================
 # [2] 이과대학 리스트 페이지 크롤러 (절대 수정 안 함, 원본 그대로)
 # ================================================================================
-def get_science_links(url):
+def parse_science_links(html, url):
     links = []
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         rows = soup.select('.nxb-list-table tbody tr')
         for row in rows:
@@ -160,8 +167,16 @@ def get_science_links(url):
                         "url": full_url
                     })
         return links
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_science_links parsing error url=%s", url)
+        logger.exception("parse_science_links parsing error url=%s", url)
+        return []
+
+
+def get_science_links(url):
+    """fetch_html → parse_science_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("get_science_links HTML too large: url=%s", url[:200] if url else "")
         return []
+    return parse_science_links(html, url)
@@ -4,11 +4,11 @@ import re
 import urllib.parse
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Tag
-from requests.exceptions import RequestException
+from bs4 import Tag
 
-from app.core.crawler_config import CRAWLER_HEADERS
+from app.core.crawl_http import HtmlTooLargeError, fetch_html
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +41,11 @@ def normalize_uic_date(date_str):
 # ================================================================================
 # [2] UIC 리스트 페이지 크롤링 엔진 (카테고리별 상위 5개 추출)
 # ================================================================================
-def get_uic_links(url):
+def parse_uic_links(html, url):
     """UIC 메인 페이지의 divbox_half_news 박스 3개에서 각각 상위 5개의 링크를 추출합니다."""
     links = []
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         # 사진에서 확인한 3개의 half box 모두 찾기
         half_boxes = soup.find_all('div', class_='divbox_half_news')
@@ -95,19 +93,26 @@ def get_uic_links(url):
                 count += 1
 
         return links
-    except RequestException:
-        raise
     except Exception:
-        logger.exception("get_uic_links parsing error url=%s", url)
+        logger.exception("parse_uic_links parsing error url=%s", url)
+        return []
+
+
+def get_uic_links(url):
+    """fetch_html → parse_uic_links. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("get_uic_links HTML too large: url=%s", url[:200] if url else "")
         return []
+    return parse_uic_links(html, url)
 
 # ================================================================================
 # [3] UIC 상세 페이지 크롤링 엔진 (기존 로직 유지)
 # ================================================================================
-def scrape_uic_detail(url):
+def parse_uic_detail(html, url):
     try:
-        response = requests.get(url, headers=CRAWLER_HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(html)
 
         title = "제목 없음"
         title_div = soup.find('div', id='BoardViewTitle')
@@ -138,6 +143,7 @@ def scrape_uic_detail(url):
                         attachments.append(fname)
 
         content_html = ""
+        body_text: str | None = None  # 본문 텍스트(Notice.body_text) (재파싱 생략)
         images = []
 
         content_div = soup.find('div', id='BoardContent')
@@ -176,13 +182,22 @@ def scrape_uic_detail(url):
                     table['border'] = "1"
 
             content_html = content_div.decode_contents().strip()
+            body_text = render_body_text(content_div)
         else:
             content_html = "(본문 영역을 찾을 수 없습니다)"
 
-        return title, date, content_html, images, attachments
+        return title, date, content_html, images, attachments, body_text
 
-    except RequestException:
-        raise
     except Exception as e:
-        logger.exception("scrape_uic_detail parsing error url=%s, error=%s", url, e)
+        logger.exception("parse_uic_detail parsing error url=%s, error=%s", url, e)
         raise
+
+
+def scrape_uic_detail(url):
+    """fetch_html → parse_uic_detail. 네트워크 오류(RequestException)는 그대로 전파(태스크 재시도)."""
+    try:
+        html = fetch_html(url)
+    except HtmlTooLargeError:
+        logger.warning("scrape_uic_detail HTML too large: url=%s", url[:200] if url else "")
+        return "제목 없음", "날짜 없음", "", [], []
+    return parse_uic_detail(html, url)
@@ -0,0 +1,160 @@
+"""
+Match Service. 유저 프로필(profile_json) ↔ 공지 자격 요건(ai_extracted_json) 매칭을 user_notice_matches에 사전 계산.
+- 공지 AI 처리 완료: refresh_notice_matches_sync — 대상 학과·학년 역색인(users.match_department·match_grade)으로
+  후보 유저만 조회.
+- 프로필 수정: refresh_user_matches_sync — 해당 유저 × 최근(MATCH_ACTIVE_DAYS) AI 처리 공지만 재평가.
+규칙은 "애매하면 노출": 대상이 비었거나 유저 값이 없으면 해당 조건은 통과.
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.notice_repository import list_ai_targets_since_sync
+from app.repositories.user_notice_match_repository import (
+    add_matches_sync,
+    delete_for_notice_sync,
+    delete_for_user_sync,
+    get_notice_ids_for_user_sync,
+    get_user_ids_for_notice_sync,
+)
+from app.repositories.user_repository import find_match_candidates_sync, get_by_id_sync
+
+logger = logging.getLogger(__name__)
+
+MAX_GRADE = 6
+# 학과 제한 없음으로 보는 값
+_ANY_DEPARTMENT = frozenset({"전체", "전학과", "전공무관", "무관", "모든학과", "all"})
+# "경영학과"·"경영학부"·"경영학전공" → "경영학"
+_DEPARTMENT_SUFFIXES = ("전공", "과", "부")
+_GRADE_RE = re.compile(r"([1-6])")
+
+
+@dataclass(frozen=True)
+class MatchTargets:
+    """공지 대상 조건. 빈 집합이면 제한 없음."""
+
+    departments: frozenset[str] = frozenset()
+    grades: frozenset[int] = frozenset()
+
+
+def department_key(name: Any) -> str | None:
+    """학과명 비교 키: 공백 제거·소문자, 끝의 과/부/전공 제거. "컴퓨터과학과" → "컴퓨터과학"."""
+    if not isinstance(name, str):
+        return None
+    key = re.sub(r"\s+", "", name).lower()
+    for suffix in _DEPARTMENT_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            key = key[: -len(suffix)]
+            break
+    return key[:128] or None
+
+
+def grade_values(value: Any) -> set[int] | None:
+    """
+    학년 표기 → 학년 집합. 3 / "3학년" → {3}, "3학년 이상" → {3..6}, "2학년 이하" → {1, 2}.
+    "전학년"처럼 숫자가 없으면 None(제한 없음).
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return {value} if 1 <= value <= MAX_GRADE else None
+    if not isinstance(value, str):
+        return None
+    m = _GRADE_RE.search(value)
+    if not m:
+        return None
+    grade = int(m.group(1))
+    if "이상" in value:
+        return set(range(grade, MAX_GRADE + 1))
+    if "이하" in value:
+        return set(range(1, grade + 1))
+    return {grade}
+
+
+def notice_targets(extracted: dict[str, Any] | None) -> MatchTargets:
+    """ai_extracted_json의 target_departments·target_grades → MatchTargets. "전체" 등이 섞이면 해당 조건 제한 없음."""
+    if not extracted:
+        return MatchTargets()
+    departments: set[str] = set()
+    for name in extracted.get("target_departments") or []:
+        if isinstance(name, str) and re.sub(r"\s+", "", name).lower() in _ANY_DEPARTMENT:
+            departments = set()
+            break
+        key = department_key(name)
+        if key is not None:
+            departments.add(key)
+    grades: set[int] = set()
+    for value in extracted.get("target_grades") or []:
+        values = grade_values(value)
+        if values is None:
+            grades = set()
+            break
+        grades |= values
+    return MatchTargets(departments=frozenset(departments), grades=frozenset(grades))
+
+
+def user_match_keys(profile_json: dict[str, Any] | None) -> tuple[str | None, int | None]:
+    """profile_json → (match_department, match_grade). users 역색인 컬럼 값."""
+    if not profile_json:
+        return None, None
+    grades = grade_values(profile_json.get("grade"))
+    grade = min(grades) if grades and len(grades) == 1 else None
+    return department_key(profile_json.get("major")), grade
+
+
+def profile_matches(department: str | None, grade: int | None, targets: MatchTargets) -> bool:
+    """매칭 규칙. find_match_candidates_sync의 SQL 조건과 같아야 함."""
+    if targets.departments and department is not None and department not in targets.departments:
+        return False
+    if targets.grades and grade is not None and grade not in targets.grades:
+        return False
+    return True
+
+
+def _apply_diff(existing: set[int], current: Iterable[int]) -> tuple[set[int], set[int]]:
+    current_set = set(current)
+    return current_set - existing, existing - current_set
+
+
+def refresh_notice_matches_sync(session: Session, notice_id: int, extracted: dict[str, Any] | None) -> int:
+    """
+    공지 1건의 매칭 유저 재계산 (AI 처리 완료 시, 워커). 바뀐 행만 추가·삭제(기존 matched_at 유지).
+    commit은 호출자. 반환: 매칭 유저 수.
+    """
+    targets = notice_targets(extracted)
+    user_ids = find_match_candidates_sync(session, departments=targets.departments, grades=targets.grades)
+    added, removed = _apply_diff(get_user_ids_for_notice_sync(session, notice_id), user_ids)
+    if removed:
+        delete_for_notice_sync(session, notice_id, removed)
+    add_matches_sync(session, [(uid, notice_id) for uid in added])
+    logger.debug("notice matches: notice_id=%s users=%s +%s -%s", notice_id, len(user_ids), len(added), len(removed))
+    return len(user_ids)
+
+
+def refresh_user_matches_sync(session: Session, user_id: int, *, now: datetime | None = None) -> int:
+    """
+    유저 1명의 매칭 공지 재계산 (프로필 수정 시, 워커). 최근 MATCH_ACTIVE_DAYS 공지만 평가하고,
+    새 프로필로 더 이상 맞지 않는 기존 매칭은 삭제. commit은 호출자. 반환: 매칭 공지 수.
+    """
+    user = get_by_id_sync(session, user_id)
+    if user is None:
+        return 0
+    since = (now or datetime.now(UTC)) - timedelta(days=settings.match_active_days)
+    notice_ids = [
+        notice_id
+        for notice_id, extracted in list_ai_targets_since_sync(session, since)
+        if profile_matches(user.match_department, user.match_grade, notice_targets(extracted))
+    ]
+    added, removed = _apply_diff(get_notice_ids_for_user_sync(session, user_id), notice_ids)
+    if removed:
+        delete_for_user_sync(session, user_id, removed)
+    add_matches_sync(session, [(user_id, nid) for nid in added])
+    logger.debug("user matches: user_id=%s notices=%s +%s -%s", user_id, len(notice_ids), len(added), len(removed))
+    return len(notice_ids)
@@ -0,0 +1,194 @@
+"""Notice Service. 공지 피드·전문 검색(keyset 커서 페이지네이션) 조회·커서 인코딩."""
+
+import base64
+import binascii
+import json
+import re
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notice import Notice
+from app.repositories.notice_repository import list_feed, search
+from app.repositories.user_notice_match_repository import list_matched_notices
+from app.schemas.notice import NoticeCard, NoticeFeedResponse, NoticeSearchHit, NoticeSearchResponse
+
+FEED_DEFAULT_LIMIT = 20
+FEED_MAX_LIMIT = 100
+
+# 검색 토큰: 한글 연속 구간 → 2글자 bigram, 영숫자 구간 → 소문자 단어.
+# 인덱스 쪽 SQL 함수 notice_search_tokens(마이그레이션 009)와 같은 규칙이어야 함.
+_SEARCH_RUN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+SEARCH_MAX_TOKENS = 32
+
+
+class InvalidCursorError(Exception):
+    """피드 커서 형식 오류. Router에서 400으로 변환."""
+
+    pass
+
+
+def _encode_cursor(data: dict[str, Any]) -> str:
+    raw = json.dumps(data)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(published_at: datetime | None, notice_id: int) -> str:
+    """(published_at, id) → 불투명 커서 문자열(base64url JSON)."""
+    return _encode_cursor({"p": published_at.isoformat() if published_at else None, "i": notice_id})
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, int]:
+    """encode_cursor 역변환. 형식이 틀리면 InvalidCursorError."""
+    try:
+        data = _decode_cursor(cursor)
+        published_at = datetime.fromisoformat(data["p"]) if data["p"] is not None else None
+        notice_id = int(data["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return published_at, notice_id
+
+
+def encode_search_cursor(rank: float, notice_id: int) -> str:
+    """검색 결과 (rank, id) → 불투명 커서 문자열."""
+    return _encode_cursor({"r": rank, "i": notice_id})
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, int]:
+    """encode_search_cursor 역변환. 형식이 틀리면 InvalidCursorError."""
+    try:
+        data = _decode_cursor(cursor)
+        rank = float(data["r"])
+        notice_id = int(data["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return rank, notice_id
+
+
+def encode_id_cursor(notice_id: int) -> str:
+    """맞춤 피드(notice_id DESC) 커서."""
+    return _encode_cursor({"i": notice_id})
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """encode_id_cursor 역변환. 형식이 틀리면 InvalidCursorError."""
+    try:
+        return int(_decode_cursor(cursor)["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def search_tokens(text: str) -> list[str]:
+    """검색 토큰 (중복 제거, 등장 순). 예: "장학금 TOEIC" → ["장학", "학금", "toeic"]."""
+    tokens: list[str] = []
+    for run in _SEARCH_RUN_RE.findall(text.lower()):
+        if "가" <= run[0] <= "힣":
+            parts = [run[i : i + 2] for i in range(max(len(run) - 1, 1))]
+        else:
+            parts = [run]
+        for part in parts:
+            if part not in tokens:
+                tokens.append(part)
+    return tokens
+
+
+def build_search_query(q: str) -> str | None:
+    """
+    검색어 → tsquery 문자열 (모든 토큰 AND). 영숫자 단어와 한 글자 한글은 접두 일치(:*)로
+    "toe" → toeic, "팀" → 팀원 매칭. 토큰이 없으면 None.
+    """
+    tokens = search_tokens(q)[:SEARCH_MAX_TOKENS]
+    if not tokens:
+        return None
+    terms = [f"'{t}'" if len(t) == 2 and "가" <= t[0] <= "힣" else f"'{t}':*" for t in tokens]
+    return " & ".join(terms)
+
+
+def _to_card(notice: Notice, college_code: str) -> NoticeCard:
+    return NoticeCard(
+        id=notice.id,
+        college_code=college_code,
+        title=notice.title,
+        url=notice.url,
+        published_at=notice.published_at,
+        dates=notice.dates,
+        eligibility=notice.eligibility,
+        hashtags=notice.hashtags,
+    )
+
+
+async def get_notice_feed(
+    session: AsyncSession,
+    *,
+    college_codes: Collection[str] | None = None,
+    cursor: str | None = None,
+    limit: int = FEED_DEFAULT_LIMIT,
+) -> NoticeFeedResponse:
+    """
+    공지 피드 1페이지. 최신 게시일순(published_at DESC, id DESC) keyset 페이지네이션이라
+    깊은 페이지도 비용 일정. limit+1건 조회로 다음 페이지 존재 여부 판단.
+    """
+    limit = max(1, min(limit, FEED_MAX_LIMIT))
+    after = decode_cursor(cursor) if cursor else None
+    rows = await list_feed(session, college_codes=college_codes, after=after, limit=limit + 1)
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last, _ = page[-1]
+        next_cursor = encode_cursor(last.published_at, last.id)
+    return NoticeFeedResponse(items=[_to_card(n, code) for n, code in page], next_cursor=next_cursor)
+
+
+async def search_notices(
+    session: AsyncSession,
+    q: str,
+    *,
+    college_codes: Collection[str] | None = None,
+    cursor: str | None = None,
+    limit: int = FEED_DEFAULT_LIMIT,
+) -> NoticeSearchResponse:
+    """
+    공지 전문 검색 1페이지 (제목·해시태그·본문, 관련도순). 커서는 (rank, id) keyset.
+    검색어에 토큰이 없으면(기호만 등) 빈 결과.
+    """
+    limit = max(1, min(limit, FEED_MAX_LIMIT))
+    after = decode_search_cursor(cursor) if cursor else None
+    tsquery = build_search_query(q)
+    if tsquery is None:
+        return NoticeSearchResponse(items=[], next_cursor=None)
+    rows = await search(session, tsquery, college_codes=college_codes, after=after, limit=limit + 1)
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last, _, last_rank = page[-1]
+        next_cursor = encode_search_cursor(last_rank, last.id)
+    items = [
+        NoticeSearchHit(**_to_card(notice, code).model_dump(), rank=rank) for notice, code, rank in page
+    ]
+    return NoticeSearchResponse(items=items, next_cursor=next_cursor)
+
+
+async def get_matched_notice_feed(
+    session: AsyncSession,
+    user_id: int,
+    *,
+    cursor: str | None = None,
+    limit: int = FEED_DEFAULT_LIMIT,
+) -> NoticeFeedResponse:
+    """
+    맞춤 피드 1페이지. 사전 계산된 user_notice_matches를 최신 공지순(notice_id DESC)으로 읽기만 함
+    (요청 시 매칭 평가 없음).
+    """
+    limit = max(1, min(limit, FEED_MAX_LIMIT))
+    before_id = decode_id_cursor(cursor) if cursor else None
+    rows = await list_matched_notices(session, user_id, before_id=before_id, limit=limit + 1)
+    page = rows[:limit]
+    next_cursor = encode_id_cursor(page[-1][0].id) if len(rows) > limit else None
+    return NoticeFeedResponse(items=[_to_card(n, code) for n, code in page], next_cursor=next_cursor)
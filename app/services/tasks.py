@@ -4,19 +4,58 @@ Celery 워커가 실행할 작업(Task) 정의.
 """
 
 import logging
+import math
+import time
 from datetime import UTC, datetime
 
+import httpx
 from celery import shared_task
+from celery.signals import task_postrun, task_prerun, task_retry
 from requests.exceptions import RequestException
 
+from app.core.config import settings
+from app.core.crawl_http import probe_url
+from app.core.crawl_rate import HostBackoffError
+from app.core.crawler_config import COLLEGE_CODE_TO_MODULE, CRAWLER_CONFIG, get_crawl_host
 from app.core.database_sync import get_sync_session
+from app.core.metrics import (
+    CELERY_TASK_DURATION,
+    CELERY_TASK_RETRIES,
+    get_redis_client,
+    instance_name,
+    publish_snapshot,
+)
 from app.repositories.college_repository import get_by_external_id_sync as get_college_by_external_id_sync
-from app.repositories.crawl_run_repository import create_crawl_run_sync, update_crawl_run_sync
-from app.repositories.notice_repository import get_by_id_sync as get_notice_by_id_sync
+from app.repositories.crawl_run_repository import (
+    create_crawl_run_sync,
+    get_runs_since_sync,
+    update_crawl_run_sync,
+)
+from app.services.ai_service import default_ai_limiter, process_ai_batch_sync
+from app.services.crawl_breaker import default_breaker
+from app.services.crawl_scheduler import (
+    HISTORY_WINDOW,
+    clear_backfill_checkpoint,
+    default_leases,
+    dispatch_pending,
+    enqueue_pending,
+    get_backfill_checkpoint,
+    get_redis,
+    select_due_colleges,
+    set_backfill_checkpoint,
+)
 from app.services.crawl_service import crawl_college_sync
+from app.services.crawl_stats import CrawlStats
+from app.services.match_service import refresh_user_matches_sync
 
 logger = logging.getLogger(__name__)
 
+# crawl_college_task 자동 재시도 대상 예외 (일시적 네트워크 오류).
+CRAWL_RETRY_ERRORS = (RequestException, ConnectionError, TimeoutError, OSError)
+# 호스트 서킷 브레이커에 실패로 반영하는 예외 (대상 서버 다운·차단). 파싱 오류 등은 제외.
+# HostBackoffError도 재시도 대상이지만 백오프 대신 호스트 보류 시간(retry_after) 뒤로 재시도.
+HOST_FAILURE_ERRORS = (*CRAWL_RETRY_ERRORS, HostBackoffError)
+
 
 def _set_task_context(task_id: str | None, college_code: str | None = None):
     """Sentry·로그용 컨텍스트. task_id·college_code로 4단계 디버깅 용이."""
@@ -32,44 +71,81 @@ def _set_task_context(task_id: str | None, college_code: str | None = None):
 
 @shared_task(
     name="app.services.tasks.crawl_college_task",
-    autoretry_for=(RequestException, ConnectionError, TimeoutError, OSError),
+    autoretry_for=CRAWL_RETRY_ERRORS,
     retry_backoff=True,
     retry_backoff_max=600,
     retry_jitter=True,
 )
-def crawl_college_task(college_code: str):
-    """Celery가 호출하는 크롤 태스크. 동기 세션·crawl_college_sync 사용. content_hash 변경 분만 AI 큐 enqueue."""
+def crawl_college_task(college_code: str, incremental: bool = True, lease: str | None = None):
+    """
+    Celery가 호출하는 크롤 태스크. 동기 세션·crawl_college_sync 사용. content_hash 변경 분만 AI 큐 enqueue.
+    incremental=False면 이미 적재된 공지도 상세 재수집(본문만 수정된 공지 반영용).
+    lease: 스케줄러가 잡아준 호스트 슬롯. 최종 종료(성공·재시도 없는 실패·재시도 소진) 시 반환하고 다음 pending
+    단과대 dispatch. 자동 재시도될 실패면 반환하지 않음 — 재시도가 같은 lease로 다시 실행되므로, 백오프 동안
+    슬롯을 비우면 스케줄러가 같은 호스트 크롤을 또 시작해 호스트당 동시 한도가 깨짐.
+    HostBackoffError(Retry-After 등으로 호스트가 오래 막힘)는 보류가 풀리는 시각(retry_after초 뒤)에 재시도.
+    호스트 서킷 브레이커가 open이면 크롤 없이 crawl_runs status=skipped로 종료(재시도 폭주 방지).
+    """
     task_id = getattr(crawl_college_task.request, "id", None) or ""
     _set_task_context(str(task_id) if task_id else None, college_code)
     logger.info("Task Started: task_id=%s college_code=%s", task_id, college_code)
-    with get_sync_session() as session:
-        college = get_college_by_external_id_sync(session, college_code)
-        if not college:
-            raise ValueError(f"College not found: {college_code}")
-        create_crawl_run_sync(session, college.id, task_id)
-        session.commit()
-        try:
-            count, notice_ids = crawl_college_sync(session, college_code)
-            update_crawl_run_sync(
-                session,
-                task_id,
-                finished_at=datetime.now(UTC),
-                status="success",
-                notices_upserted=count,
-            )
-            session.commit()
-        except Exception as e:
-            update_crawl_run_sync(
-                session,
-                task_id,
-                finished_at=datetime.now(UTC),
-                status="failed",
-                error_message=(str(e))[:2000],
-            )
+    module_name = COLLEGE_CODE_TO_MODULE.get(college_code, "")
+    host = get_crawl_host(module_name)
+    breaker = default_breaker()
+    retrying = False
+    try:
+        with get_sync_session() as session:
+            college = get_college_by_external_id_sync(session, college_code)
+            if not college:
+                raise ValueError(f"College not found: {college_code}")
+            create_crawl_run_sync(session, college.id, task_id)
             session.commit()
-            raise
-    for nid in notice_ids:
-        process_notice_ai_task.delay(nid)
+            if not breaker.allow(host, probe=lambda: probe_url(CRAWLER_CONFIG[module_name]["url"])):
+                update_crawl_run_sync(
+                    session,
+                    task_id,
+                    finished_at=datetime.now(UTC),
+                    status="skipped",
+                    error_message=f"circuit open: host={host}",
+                )
+                session.commit()
+                logger.warning("Crawl skipped (circuit open): college_code=%s host=%s", college_code, host)
+                return {"upserted": 0, "enqueued_ai": 0, "skipped": True}
+            stats = CrawlStats()
+            try:
+                # 배치 commit마다 변경 공지를 AI 큐에 바로 적재(중간 실패해도 앞선 배치는 처리됨)
+                count, notice_ids = crawl_college_sync(
+                    session, college_code, incremental=incremental, on_batch=_enqueue_ai, stats=stats
+                )
+                update_crawl_run_sync(
+                    session,
+                    task_id,
+                    finished_at=datetime.now(UTC),
+                    status="success",
+                    notices_upserted=count,
+                    stats=stats.to_dict(),
+                )
+                session.commit()
+                breaker.record_success(host)
+            except Exception as e:
+                if isinstance(e, HOST_FAILURE_ERRORS):
+                    breaker.record_failure(host)
+                update_crawl_run_sync(
+                    session,
+                    task_id,
+                    finished_at=datetime.now(UTC),
+                    status="failed",
+                    error_message=(str(e))[:2000],
+                    stats=stats.to_dict(),
+                )
+                session.commit()
+                retrying = _will_retry(e)
+                if retrying and isinstance(e, HostBackoffError):
+                    raise crawl_college_task.retry(exc=e, countdown=math.ceil(e.retry_after)) from e
+                raise
+    finally:
+        if lease and not retrying:
+            _release_lease_and_dispatch(lease)
     msg = (
         f"Crawling {college_code} completed. Upserted {count} notices, "
         f"enqueued AI for {len(notice_ids)}."
@@ -79,29 +155,204 @@ def crawl_college_task(college_code: str):
 
 
 @shared_task(
-    name="app.services.tasks.process_notice_ai_task",
+    name="app.services.tasks.backfill_college_task",
+    autoretry_for=CRAWL_RETRY_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+)
+def backfill_college_task(college_code: str, pages: int = 50, restart: bool = False):
+    """
+    목록 과거 페이지 백필. 체크포인트(crawl:backfill) 페이지부터 1쪽씩 증분 크롤(기존 공지 연속으로 멈추지 않음)하고
+    쪽마다 체크포인트(다음 페이지·직전 페이지 URL) 저장 → 중단·실패 후 다시 호출하면 이어서 진행.
+    빈 페이지나 직전 페이지와 같은 페이지(목록 끝)면 체크포인트 삭제. 목록 페이지를 못 읽으면(네트워크 오류·크기 초과)
+    목록 끝으로 보지 않고 raise → 체크포인트 유지, 네트워크 오류는 자동 재시도가 그 페이지부터 이어서 진행.
+    pages: 이번 호출에서 처리할 최대 페이지 수. restart=True면 첫 페이지부터(자동 재시도 때는 체크포인트부터).
+    호스트 간격은 공유 rate controller가 지키고, 서킷 브레이커가 open이면 중단. crawl_runs에는 기록하지 않음
+    (대량 upsert가 적응형 크롤 주기 산정을 왜곡하지 않도록).
+    """
+    task_id = getattr(backfill_college_task.request, "id", None) or ""
+    _set_task_context(str(task_id) if task_id else None, college_code)
+    module_name = COLLEGE_CODE_TO_MODULE.get(college_code)
+    if not module_name or not CRAWLER_CONFIG[module_name].get("pagination"):
+        raise ValueError(f"No paginated crawler config for college: {college_code}")
+    host = get_crawl_host(module_name)
+    client = get_redis()
+    if restart and not backfill_college_task.request.retries:
+        clear_backfill_checkpoint(client, college_code)
+    first, last_urls = get_backfill_checkpoint(client, college_code)
+    breaker = default_breaker(client)
+    stats = CrawlStats()
+    upserted = enqueued = 0
+    next_page: int | None = first
+    with get_sync_session() as session:
+        for page in range(first, first + max(1, pages)):
+            if not breaker.allow(host, probe=lambda: probe_url(CRAWLER_CONFIG[module_name]["url"])):
+                logger.warning("Backfill paused (circuit open): college_code=%s page=%s", college_code, page)
+                break
+            previous_urls = set(last_urls)
+            try:
+                count, notice_ids = crawl_college_sync(
+                    session,
+                    college_code,
+                    on_batch=_enqueue_ai,
+                    stats=stats,
+                    start_page=page,
+                    max_pages=1,
+                    known_streak_stop=0,
+                    last_page_urls=last_urls,
+                )
+            except HOST_FAILURE_ERRORS:
+                breaker.record_failure(host)
+                raise
+            breaker.record_success(host)
+            upserted += count
+            enqueued += len(notice_ids)
+            # 빈 페이지이거나 직전 페이지의 반복(범위 밖 요청에 마지막 페이지를 돌려주는 게시판) → 목록 끝
+            if last_urls == previous_urls:
+                clear_backfill_checkpoint(client, college_code)
+                next_page = None
+                break
+            next_page = page + 1
+            set_backfill_checkpoint(client, college_code, next_page, last_urls)
+    logger.info(
+        "backfill: college_code=%s pages=%s..%s upserted=%s enqueued_ai=%s",
+        college_code, first, next_page, upserted, enqueued,
+    )
+    return {
+        "college_code": college_code,
+        "from_page": first,
+        "next_page": next_page,
+        "upserted": upserted,
+        "enqueued_ai": enqueued,
+        "stats": stats.to_dict(),
+    }
+
+
+def _will_retry(exc: Exception) -> bool:
+    """crawl_college_task가 이 예외로 재시도될지 (재시도 대상 예외·HostBackoffError이고 max_retries 미소진)."""
+    if not isinstance(exc, HOST_FAILURE_ERRORS):
+        return False
+    max_retries = crawl_college_task.max_retries
+    return max_retries is None or crawl_college_task.request.retries < max_retries
+
+
+def _enqueue_ai(notice_ids: list[int]) -> None:
+    """upsert 배치에서 신규·content_hash 변경된 공지를 AI_BATCH_SIZE개씩 묶어 AI 큐에 적재."""
+    size = max(1, settings.ai_batch_size)
+    for i in range(0, len(notice_ids), size):
+        process_notice_ai_batch_task.delay(notice_ids[i : i + size])
+
+
+def _release_lease_and_dispatch(lease: str) -> None:
+    """호스트 슬롯 반환 후 빈 슬롯으로 다음 pending 단과대 시작. Redis 오류는 로그만(크롤 결과에 영향 없음)."""
+    try:
+        default_leases().release(lease)
+        dispatch_crawls_task.delay()
+    except Exception:
+        logger.exception("crawl lease release/dispatch failed: lease=%s", lease)
+
+
+def _start_crawl(college_code: str, incremental: bool, lease: str) -> None:
+    crawl_college_task.apply_async(
+        args=[college_code],
+        kwargs={"incremental": incremental, "lease": lease},
+    )
+
+
+@shared_task(name="app.services.tasks.schedule_crawls_task")
+def schedule_crawls_task(
+    college_codes: list[str] | None = None,
+    incremental: bool = True,
+    force: bool = False,
+):
+    """
+    trigger-crawl 진입점. force=False면 crawl_runs 이력 기반 적응형 주기로 due 단과대만 골라
+    pending 적재 후 호스트 슬롯이 빈 만큼 즉시 시작. 나머지는 앞선 크롤 종료 시 dispatch.
+    """
+    codes = list(college_codes or COLLEGE_CODE_TO_MODULE.keys())
+    if not force:
+        now = datetime.now(UTC)
+        with get_sync_session() as session:
+            history = get_runs_since_sync(session, now - HISTORY_WINDOW)
+        codes = select_due_colleges(codes, history, now)
+    client = get_redis()
+    enqueue_pending(client, codes, incremental=incremental)
+    started = dispatch_pending(client, default_leases(client), _start_crawl)
+    logger.info("schedule_crawls: due=%s started=%s", codes, started)
+    return {"due": codes, "started": started}
+
+
+@shared_task(name="app.services.tasks.dispatch_crawls_task")
+def dispatch_crawls_task():
+    """pending 단과대 중 호스트 슬롯이 빈 것만 시작. 크롤 종료 시 호출."""
+    client = get_redis()
+    started = dispatch_pending(client, default_leases(client), _start_crawl)
+    if started:
+        logger.info("dispatch_crawls: started=%s", started)
+    return {"started": started}
+
+
+@shared_task(
+    name="app.services.tasks.process_notice_ai_batch_task",
     bind=True,
-    autoretry_for=(RequestException, ConnectionError, TimeoutError, OSError),
+    autoretry_for=(RequestException, httpx.HTTPError, ConnectionError, TimeoutError, OSError),
     retry_backoff=True,
     retry_backoff_max=600,
-    rate_limit="10/m",
 )
-def process_notice_ai_task(self, notice_id: int):
+def process_notice_ai_batch_task(self, notice_ids: list[int]):
     """
-    4단계 AI 처리용 스텁. notice_id로 DB에서 raw_html 등 조회 후 Gemini 호출은 4단계에서 구현.
-    이미 ai_extracted_json이 있으면 스킵(멱등). 현재는 로그만. rate_limit은 4단계 Gemini RPM 대비.
+    4단계 AI 처리 (공지 묶음). 1회 조회(WHERE id = ANY) → 공유 속도 제한(AI_RATE_LIMIT_PER_MINUTE) 아래 모델 호출
+    → bulk UPDATE 1번 + notice_schedules·user_notice_matches 갱신. 이미 ai_extracted_json이 있으면 스킵(멱등).
+    모델은 Gemini(GEMINI_API_KEY 미설정이면 호출·속도 제한 대기 없음). 429·5xx·네트워크 오류는 그때까지 결과를
+    반영한 뒤 지수 백오프로 재시도(이미 처리된 공지는 스킵).
     """
     task_id = getattr(self.request, "id", None) or ""
     _set_task_context(str(task_id) if task_id else None)
     with get_sync_session() as session:
-        notice = get_notice_by_id_sync(session, notice_id)
-        if not notice:
-            logger.warning("process_notice_ai_task: notice_id=%s not found, skipping", notice_id)
-            return
-        if notice.ai_extracted_json:
-            logger.debug(
-                "process_notice_ai_task: notice_id=%s already processed (ai_extracted_json), skipping",
-                notice_id,
-            )
-            return
-    logger.info("process_notice_ai_task: task_id=%s notice_id=%s (stub, 4단계에서 구현)", task_id, notice_id)
+        stats = process_ai_batch_sync(session, notice_ids, limiter=default_ai_limiter())
+    logger.info("process_notice_ai_batch_task: task_id=%s ids=%s %s", task_id, len(notice_ids), stats)
+    return stats
+
+
+@shared_task(name="app.services.tasks.process_notice_ai_task")
+def process_notice_ai_task(notice_id: int):
+    """단건 AI 처리. 배포 전 큐에 남은 메시지 호환용 — 크기 1 묶음으로 처리."""
+    with get_sync_session() as session:
+        return process_ai_batch_sync(session, [notice_id], limiter=default_ai_limiter())
+
+
+@shared_task(name="app.services.tasks.refresh_user_matches_task")
+def refresh_user_matches_task(user_id: int):
+    """프로필 수정 후 해당 유저의 맞춤 매칭 재계산 (최근 MATCH_ACTIVE_DAYS 공지)."""
+    with get_sync_session() as session:
+        matched = refresh_user_matches_sync(session, user_id)
+        session.commit()
+    logger.info("refresh_user_matches: user_id=%s matched=%s", user_id, matched)
+    return {"user_id": user_id, "matched": matched}
+
+
+# --- 태스크 메트릭 (/internal/metrics). 워커 프로세스 메모리 → 태스크 종료마다 Redis 스냅샷 ---
+_task_started: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id: str | None = None, **_kwargs) -> None:
+    if task_id:
+        _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_task_end(task_id: str | None = None, task=None, state: str | None = None, **_kwargs) -> None:
+    """소요 시간을 최종 상태(SUCCESS·FAILURE·RETRY)별로 기록하고 이 프로세스 스냅샷 갱신."""
+    started = _task_started.pop(task_id, None) if task_id else None
+    if started is not None and task is not None:
+        CELERY_TASK_DURATION.observe(time.perf_counter() - started, task=task.name, state=state or "UNKNOWN")
+    client = get_redis_client()
+    if client is not None:
+        publish_snapshot(client, instance_name("worker"))
+
+
+@task_retry.connect
+def _record_task_retry(sender=None, **_kwargs) -> None:
+    CELERY_TASK_RETRIES.inc(task=getattr(sender, "name", "unknown"))
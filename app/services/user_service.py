@@ -0,0 +1,29 @@
+"""User Service. 프로필 저장(매칭 역색인 키 포함)."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.repositories.user_repository import get_by_id, update_profile
+from app.schemas.user import UserProfile
+from app.services.match_service import user_match_keys
+
+
+class UserNotFoundError(Exception):
+    """JWT의 user_id에 해당하는 유저 없음. Router에서 404로 변환."""
+
+    pass
+
+
+async def save_profile(session: AsyncSession, user_id: int, profile: UserProfile) -> User:
+    """
+    프로필 저장 + users.match_department·match_grade 갱신 후 commit.
+    매칭 재계산(refresh_user_matches_task)은 호출자(Router)가 commit 후 enqueue.
+    """
+    user = await get_by_id(session, user_id)
+    if user is None:
+        raise UserNotFoundError(f"User not found: {user_id}")
+    profile_json = profile.model_dump(exclude_none=True)
+    department, grade = user_match_keys(profile_json)
+    user = await update_profile(session, user, profile_json, department, grade)
+    await session.commit()
+    return user
@@ -7,8 +7,10 @@ import logging
 import ssl
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 from app.core.config import settings
+from app.core.crawl_http import close_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,13 @@ if broker_url.startswith("rediss://"):
         "ssl_cert_reqs": ssl.CERT_NONE,
     }
 
+
+@worker_process_init.connect
+def _reset_crawl_http_sessions(**_kwargs) -> None:
+    """prefork 자식 프로세스마다 crawl_http 커넥션 풀을 새로 만들도록 부모에서 물려받은 세션 정리."""
+    close_sessions()
+
+
 # 태스크 등록 (app.services.tasks가 이 app에 바인딩되도록 로드)
 from app.services import tasks  # noqa: F401, E402
 
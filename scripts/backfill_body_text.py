@@ -0,0 +1,59 @@
+"""
+body_text가 비어 있는 기존 공지에 raw_html로 본문 텍스트를 렌더링해 채우고 content_hash를 같은 정의로 재계산.
+content_hash를 함께 맞춰 두면 다음 크롤에서 본문이 안 바뀐 공지가 '변경'으로 잡혀 AI 큐에 다시 들어가지 않음.
+배치마다 commit하므로 중간에 끊겨도 다시 실행하면 이어서 진행.
+로컬: 프로젝트 루트에서 python scripts/backfill_body_text.py [--batch-size=200] [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+# 프로젝트 루트 (스크립트 디렉터리의 상위)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database_sync import get_sync_session, init_sync_db
+from app.models.notice import Notice
+from app.services.crawl_service import _content_hash
+from app.services.crawlers.body_text import render_body_text
+from sqlalchemy import select, update
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render notices.body_text from raw_html and recompute content_hash.")
+    parser.add_argument("--batch-size", type=int, default=200, help="notices per commit (default 200)")
+    parser.add_argument("--dry-run", action="store_true", help="count only, no update")
+    args = parser.parse_args()
+
+    init_sync_db()
+    last_id = 0
+    filled = 0
+    with get_sync_session() as session:
+        while True:
+            rows = session.execute(
+                select(Notice.id, Notice.title, Notice.raw_html)
+                .where(Notice.id > last_id, Notice.body_text.is_(None))
+                .order_by(Notice.id)
+                .limit(args.batch_size)
+            ).all()
+            if not rows:
+                break
+            for notice_id, title, raw_html in rows:
+                last_id = notice_id
+                filled += 1
+                if args.dry_run:
+                    continue
+                body_text = render_body_text(raw_html)
+                session.execute(
+                    update(Notice)
+                    .where(Notice.id == notice_id)
+                    .values(body_text=body_text, content_hash=_content_hash(title, body_text))
+                )
+            if not args.dry_run:
+                session.commit()
+            print(f"... up to notice_id={last_id} ({filled} notice(s))")
+    action = "Would fill" if args.dry_run else "Filled"
+    print(f"{action} body_text of {filled} notice(s).")
+
+
+if __name__ == "__main__":
+    main()
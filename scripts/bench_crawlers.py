@@ -0,0 +1,187 @@
+"""
+오프라인 크롤러 벤치마크. 녹화한 목록·상세 응답을 재생(scripts/crawl_replay.py)해 7개 단과대 크롤러를
+네트워크 없이 측정.
+측정: 모듈별 get_*_links·scrape_* 소요 시간(ms p50/p95/mean), build_notice_payload 처리량(notices/s),
+한 바퀴(목록 + 상세 + payload) 최대 메모리(tracemalloc). 결과는 JSON — 배포 전 이전 결과와 비교해 회귀 확인.
+
+  python scripts/bench_crawlers.py record --details 5      # 실제 사이트에서 fixture 녹화 (모듈당 목록 1 + 상세 N)
+  python scripts/bench_crawlers.py run -n 10               # 재생으로 측정 → bench_results/crawlers.json
+  python scripts/bench_crawlers.py run --baseline old.json # 기준 대비 tolerance 넘게 느려지면 exit 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, os.getcwd())
+
+from app.core.crawl_http import set_transport
+from app.core.crawler_config import CRAWLER_CONFIG, get_crawler
+from app.services.crawl_service import build_notice_payload
+from app.services.crawl_stats import percentile
+from app.services.crawlers.html_backend import get_parser_backend
+from scripts.crawl_replay import DEFAULT_FIXTURE_DIR, FixtureStore, ReplayAdapter, record_fixtures
+
+DEFAULT_OUT = Path("bench_results/crawlers.json")
+# 비교 지표: (경로, 클수록 나쁨 여부)
+COMPARED = (
+    (("get_links_ms", "p50"), True),
+    (("scrape_detail_ms", "p50"), True),
+    (("payload_per_sec",), False),
+    (("peak_memory_kb",), True),
+)
+
+
+def _timings(values_ms: list[float]) -> dict[str, float | None]:
+    return {
+        "p50": percentile(values_ms, 50),
+        "p95": percentile(values_ms, 95),
+        "mean": sum(values_ms) / len(values_ms) if values_ms else None,
+    }
+
+
+def _one_pass(get_links: Any, scrape: Any, list_url: str, detail_urls: list[str]) -> list[tuple[dict, str, tuple]]:
+    """목록 + 상세 1바퀴 → build_notice_payload 입력 목록."""
+    posts = {link["url"]: link for link in get_links(list_url)}
+    return [(posts.get(url, {}), url, scrape(url)) for url in detail_urls]
+
+
+def bench_module(store: FixtureStore, module_name: str, rounds: int) -> dict[str, Any]:
+    index = store.modules[module_name]
+    list_url, detail_urls = index["list_url"], index["detail_urls"]
+    get_links, scrape = get_crawler(module_name)
+
+    links_ms: list[float] = []
+    links: list = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        links = get_links(list_url)
+        links_ms.append((time.perf_counter() - start) * 1000)
+
+    detail_ms: list[float] = []
+    for url in detail_urls:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            scrape(url)
+            detail_ms.append((time.perf_counter() - start) * 1000)
+
+    items = _one_pass(get_links, scrape, list_url, detail_urls)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for post, url, detail in items:
+            build_notice_payload(0, post, url, *detail)
+    elapsed = time.perf_counter() - start
+    processed = rounds * len(items)
+
+    tracemalloc.start()
+    try:
+        for post, url, detail in _one_pass(get_links, scrape, list_url, detail_urls):
+            build_notice_payload(0, post, url, *detail)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "links": len(links),
+        "details": len(detail_urls),
+        "get_links_ms": _timings(links_ms),
+        "scrape_detail_ms": _timings(detail_ms),
+        "payload_per_sec": round(processed / elapsed, 1) if processed and elapsed > 0 else None,
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def run(fixture_dir: Path, rounds: int, out: Path) -> dict[str, Any]:
+    store = FixtureStore(fixture_dir)
+    if not store.modules:
+        sys.exit(f"fixture 없음: {fixture_dir} (먼저 record)")
+    results: dict[str, Any] = {}
+    set_transport(ReplayAdapter(store))
+    try:
+        for module_name in CRAWLER_CONFIG:
+            if module_name not in store.modules:
+                print(f"{module_name:<22} (fixture 없음)")
+                continue
+            r = results[module_name] = bench_module(store, module_name, rounds)
+            print(
+                f"{module_name:<22} links {r['get_links_ms']['p50']:>8.2f}ms  "
+                f"detail {r['scrape_detail_ms']['p50'] or 0:>8.2f}ms  "
+                f"payload {r['payload_per_sec'] or 0:>9.1f}/s  peak {r['peak_memory_kb']:>9.1f}KB"
+            )
+    finally:
+        set_transport(None)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "parser_backend": get_parser_backend(),
+            "rounds": rounds,
+            "fixtures": str(fixture_dir),
+        },
+        "modules": results,
+    }
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {out}")
+    return report
+
+
+def _metric(module_result: dict[str, Any], path: tuple[str, ...]) -> float | None:
+    value: Any = module_result
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """기준 대비 tolerance(비율)를 넘게 나빠진 지표 목록."""
+    regressions = []
+    for module_name, current in report["modules"].items():
+        base = baseline.get("modules", {}).get(module_name)
+        if not base:
+            continue
+        for path, higher_is_worse in COMPARED:
+            now, before = _metric(current, path), _metric(base, path)
+            if not now or not before:
+                continue
+            ratio = now / before if higher_is_worse else before / now
+            if ratio > 1 + tolerance:
+                regressions.append(f"{module_name} {'.'.join(path)}: {before} → {now} ({(ratio - 1) * 100:+.0f}%)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오프라인 크롤러 벤치마크 (녹화 fixture 재생)")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR, help="fixture 디렉터리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="실제 사이트에서 목록·상세 응답 녹화")
+    rec.add_argument("--details", type=int, default=5, help="모듈당 녹화할 상세 페이지 수")
+    bench = sub.add_parser("run", help="녹화 응답 재생으로 측정")
+    bench.add_argument("-n", "--rounds", type=int, default=10, help="반복 횟수")
+    bench.add_argument("--out", type=Path, default=DEFAULT_OUT, help="결과 JSON 경로")
+    bench.add_argument("--baseline", type=Path, help="비교할 이전 결과 JSON")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="회귀 판정 비율 (0.25 = 25%% 악화)")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_fixtures(args.fixtures, args.details)
+        return
+    report = run(args.fixtures, max(1, args.rounds), args.out)
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"⚠️ 회귀: {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
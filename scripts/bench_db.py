@@ -0,0 +1,298 @@
+"""
+DB 벤치마크 (로컬 Postgres). 합성 공지로 notices를 수십만 행까지 채운 뒤 쓰기·읽기 경로를 측정.
+- 쓰기: upsert_notices_bulk_sync 배치 크기별 신규 INSERT / content_hash 변경 UPDATE / 동일 hash no-op
+  (ON CONFLICT ... WHERE content_hash IS DISTINCT FROM + RETURNING id). commit 포함 지연·rows/s.
+- 읽기: get_by_college_external_sync 단건, 피드(list_feed 첫 페이지·깊은 keyset 페이지·단과대 필터),
+  월별 달력(list_in_range).
+합성 데이터는 벤치 전용 단과대(bench_*)에만 쓰므로 실제 공지와 섞이지 않음. --cleanup으로 삭제.
+스키마·인덱스 변경 전후 같은 --rows로 돌려 p50/p95/p99·rows/s 비교.
+
+  alembic upgrade head
+  python scripts/bench_db.py --rows 200000                     # 부족한 만큼 채운 뒤 측정
+  python scripts/bench_db.py --rows 200000 --batch-sizes 50,500 --samples 30
+  python scripts/bench_db.py --cleanup                         # 벤치 데이터 삭제
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.getcwd())
+
+from app.core import database, database_sync
+from app.core.config import settings
+from app.models.college import College
+from app.models.notice import Notice
+from app.models.notice_schedule import NoticeSchedule
+from app.repositories.notice_repository import get_by_college_external_sync, list_feed, upsert_notices_bulk_sync
+from app.repositories.notice_schedule_repository import list_in_range
+from app.services.calendar_service import month_window
+from app.services.crawl_service import _content_hash
+from app.services.crawl_stats import percentile
+from sqlalchemy import delete, func, insert, select
+
+BENCH_PREFIX = "bench_"
+BENCH_COLLEGES = [f"{BENCH_PREFIX}{i}" for i in range(7)]
+SEED_BATCH = 1000
+# 본문 크기 분포 (바이트, 가중치): 짧은 안내 / 일반 / 표·첨부 설명이 긴 공지
+BODY_SIZES = ((800, 0.55), (6_000, 0.35), (60_000, 0.10))
+# 인라인 base64 이미지 개수 분포 (크롤러가 data: 이미지를 그대로 넘기는 단과대 재현)
+IMAGE_COUNTS = ((0, 0.7), (1, 0.2), (3, 0.1))
+SCHEDULE_RATIO = 0.25
+HISTORY_DAYS = 730
+_WORDS = (
+    "장학 모집 안내 신청 마감 학부 대학원 수강 설명회 면접 서류 제출 일정 변경 공지 세미나 인턴십 교환학생 연구"
+).split()
+
+
+def _pick(rng: random.Random, choices: tuple[tuple[Any, float], ...]) -> Any:
+    values, weights = zip(*choices, strict=True)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _text(rng: random.Random, size: int) -> str:
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word.encode()) + 1
+    return " ".join(words)
+
+
+def _image_data(rng: random.Random) -> str:
+    """5~150KB 임의 바이트의 base64 (압축·TOAST 효율이 실제 이미지와 비슷하도록 난수)."""
+    return base64.b64encode(rng.randbytes(rng.randint(5, 150) * 1024)).decode()
+
+
+def synthetic_notice(rng: random.Random, college_id: int, seq: int) -> dict[str, Any]:
+    """upsert payload 1건 (crawl_service.build_notice_payload와 같은 키)."""
+    title = f"[{seq}] {_text(rng, 40)}"
+    body_text = _text(rng, _pick(rng, BODY_SIZES))
+    images = [
+        {"type": "base64", "name": f"img{i}.png", "data": _image_data(rng)} for i in range(_pick(rng, IMAGE_COUNTS))
+    ]
+    return {
+        "college_id": college_id,
+        "external_id": str(seq),
+        "title": title[:500],
+        "url": f"https://bench.example/{college_id}/{seq}",
+        "raw_html": f"<div class=\"content\"><p>{body_text}</p></div>",
+        "body_text": body_text,
+        "images": images or None,
+        "attachments": [{"name": f"{seq}.pdf", "url": f"https://bench.example/f/{seq}.pdf"}] if seq % 4 == 0 else [],
+        "content_hash": _content_hash(title[:500], body_text),
+        "published_at": datetime.now(UTC) - timedelta(days=rng.uniform(0, HISTORY_DAYS)),
+    }
+
+
+def _stats(latencies_ms: list[float], rows: int | None = None) -> str:
+    line = "  ".join(f"p{q} {percentile(latencies_ms, q) or 0:>8.2f}ms" for q in (50, 95, 99))
+    if rows is not None and latencies_ms:
+        line += f"  {rows * len(latencies_ms) / (sum(latencies_ms) / 1000):>10.0f} rows/s"
+    return line
+
+
+def _timed(fn: Callable[[], Any], samples: int) -> list[float]:
+    out = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - start) * 1000)
+    return out
+
+
+def ensure_colleges() -> dict[str, int]:
+    with database_sync.get_sync_session() as session:
+        existing = dict(
+            session.execute(select(College.external_id, College.id).where(College.external_id.in_(BENCH_COLLEGES)))
+            .tuples()
+            .all()
+        )
+        for code in BENCH_COLLEGES:
+            if code not in existing:
+                college = College(name=f"벤치 {code}", external_id=code)
+                session.add(college)
+                session.flush()
+                existing[code] = college.id
+    return existing
+
+
+def _college_for(college_ids: list[int], seq: int) -> int:
+    """external_id seq → 단과대 (단건 조회가 실제 있는 (college_id, external_id)를 고를 수 있도록 고정 매핑)."""
+    return college_ids[seq % len(college_ids)]
+
+
+def _bench_count(college_ids: list[int]) -> int:
+    """벤치 단과대 공지 수 = 다음 seq (external_id는 0부터 연속)."""
+    with database_sync.get_sync_session() as session:
+        count = session.scalar(select(func.count()).select_from(Notice).where(Notice.college_id.in_(college_ids)))
+    return int(count or 0)
+
+
+def seed(rng: random.Random, college_ids: list[int], target_rows: int) -> int:
+    """target_rows까지 채움 (단과대 순환, 공지 SCHEDULE_RATIO만큼 일정 1~3건)."""
+    count = seq = _bench_count(college_ids)
+    if count >= target_rows:
+        print(f"seed: 이미 {count}행")
+        return count
+    print(f"seed: {count} → {target_rows}행")
+    start = time.perf_counter()
+    while count < target_rows:
+        n = min(SEED_BATCH, target_rows - count)
+        rows = [synthetic_notice(rng, _college_for(college_ids, seq + i), seq + i) for i in range(n)]
+        with database_sync.get_sync_session() as session:
+            ids = upsert_notices_bulk_sync(session, rows)
+            schedules = [
+                {
+                    "notice_id": notice_id,
+                    "schedule_type": rng.choice(["서류마감", "면접", "설명회", None]),
+                    "schedule_date": date.today() + timedelta(days=rng.randint(-HISTORY_DAYS, 180)),
+                }
+                for notice_id in ids
+                if rng.random() < SCHEDULE_RATIO
+                for _ in range(rng.randint(1, 3))
+            ]
+            if schedules:
+                session.execute(insert(NoticeSchedule), schedules)
+        count += n
+        seq += n
+        if count % (SEED_BATCH * 20) == 0 or count >= target_rows:
+            print(f"  {count}행 ({count / (time.perf_counter() - start):.0f} rows/s)")
+    return count
+
+
+def bench_upserts(
+    rng: random.Random, college_ids: list[int], next_seq: int, batch_sizes: list[int], samples: int
+) -> None:
+    print("\n[upsert_notices_bulk_sync + commit]")
+    seq = next_seq
+    for size in batch_sizes:
+        batches = []
+        for _ in range(samples):
+            batches.append([synthetic_notice(rng, _college_for(college_ids, seq + i), seq + i) for i in range(size)])
+            seq += size
+        results: dict[str, list[float]] = {"insert": [], "update": [], "no-op": []}
+        returned: dict[str, int] = {"insert": 0, "update": 0, "no-op": 0}
+        for batch in batches:
+            changed = [
+                {**row, "body_text": row["body_text"] + " (수정)", "content_hash": row["content_hash"][::-1]}
+                for row in batch
+            ]
+            for label, rows in (("insert", batch), ("update", changed), ("no-op", changed)):
+                start = time.perf_counter()
+                with database_sync.get_sync_session() as session:
+                    returned[label] += len(upsert_notices_bulk_sync(session, rows))
+                results[label].append((time.perf_counter() - start) * 1000)
+        for label, latencies in results.items():
+            print(f"  batch {size:>5} {label:<7} {_stats(latencies, rows=size)}  RETURNING {returned[label]}")
+
+
+def bench_point_lookup(rng: random.Random, college_ids: list[int], max_seq: int, samples: int) -> None:
+    print("\n[get_by_college_external_sync]")
+    with database_sync.get_sync_session() as session:
+        for profile in ("full", "list_card"):
+
+            def lookup(profile: Any = profile) -> Any:
+                seq = rng.randrange(max_seq)
+                return get_by_college_external_sync(session, _college_for(college_ids, seq), str(seq), profile=profile)
+
+            print(f"  profile {profile:<9} {_stats(_timed(lookup, samples))}")
+
+
+async def _timed_async(fn: Callable[[], Any], samples: int) -> list[float]:
+    out = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        await fn()
+        out.append((time.perf_counter() - start) * 1000)
+    return out
+
+
+async def bench_reads(rng: random.Random, samples: int, deep_pages: int) -> None:
+    database.init_db()
+    assert database.async_session_maker is not None
+    async with database.async_session_maker() as session:
+        print("\n[list_feed limit=21]")
+        for label, codes in (("bench 전체", BENCH_COLLEGES), ("단과대 1곳", BENCH_COLLEGES[:1])):
+            latencies = await _timed_async(lambda c=codes: list_feed(session, college_codes=c, limit=21), samples)
+            print(f"  첫 페이지 {label:<10} {_stats(latencies)}")
+        # 깊은 페이지: deep_pages번 커서를 따라간 위치에서 다음 페이지
+        after = None
+        for _ in range(deep_pages):
+            rows = await list_feed(session, college_codes=BENCH_COLLEGES, after=after, limit=20)
+            if not rows:
+                break
+            after = (rows[-1][0].published_at, rows[-1][0].id)
+        latencies = await _timed_async(
+            lambda: list_feed(session, college_codes=BENCH_COLLEGES, after=after, limit=21), samples
+        )
+        print(f"  {deep_pages}페이지 뒤 keyset  {_stats(latencies)}")
+
+        print("\n[list_in_range (월별 달력)]")
+        today = date.today()
+
+        async def calendar_month() -> Any:
+            month_start = today - timedelta(days=rng.randint(0, 365))
+            start, end = month_window(month_start.year, month_start.month)
+            return await list_in_range(session, start, end, college_codes=BENCH_COLLEGES)
+
+        latencies = await _timed_async(calendar_month, samples)
+        print(f"  임의 월 bench 전체   {_stats(latencies)}")
+    if database.engine is not None:
+        await database.engine.dispose()
+
+
+def cleanup() -> None:
+    with database_sync.get_sync_session() as session:
+        college_ids = select(College.id).where(College.external_id.in_(BENCH_COLLEGES))
+        notice_ids = select(Notice.id).where(Notice.college_id.in_(college_ids))
+        session.execute(delete(NoticeSchedule).where(NoticeSchedule.notice_id.in_(notice_ids)))
+        deleted = session.execute(delete(Notice).where(Notice.college_id.in_(college_ids))).rowcount
+        session.execute(delete(College).where(College.external_id.in_(BENCH_COLLEGES)))
+    print(f"cleanup: 벤치 공지 {deleted}행 삭제")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="notices upsert·조회 DB 벤치마크 (로컬 Postgres)")
+    parser.add_argument("--rows", type=int, default=100_000, help="벤치 단과대 공지 목표 행 수(부족하면 채움)")
+    parser.add_argument("--batch-sizes", default="10,100,500,1000", help="upsert 배치 크기 (쉼표)")
+    parser.add_argument("--samples", type=int, default=20, help="측정 반복 수")
+    parser.add_argument("--deep-pages", type=int, default=50, help="깊은 피드 페이지 위치")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--cleanup", action="store_true", help="벤치 데이터 삭제 후 종료")
+    parser.add_argument("--allow-remote", action="store_true", help="localhost가 아닌 DB에서도 실행")
+    args = parser.parse_args()
+
+    host = urlparse(settings.database_url or "").hostname
+    if not settings.database_url:
+        sys.exit("DATABASE_URL 없음")
+    if host not in ("localhost", "127.0.0.1", "::1") and not args.allow_remote:
+        sys.exit(f"DB 호스트 {host}: 로컬 DB가 아니면 --allow-remote 필요 (합성 데이터 수십만 행을 씀)")
+
+    rng = random.Random(args.seed)
+    database_sync.init_sync_db()
+    if args.cleanup:
+        cleanup()
+        return
+    by_code = ensure_colleges()
+    college_ids = [by_code[code] for code in BENCH_COLLEGES]
+    seed(rng, college_ids, args.rows)
+    next_seq = _bench_count(college_ids)
+    batch_sizes = [int(s) for s in args.batch_sizes.split(",") if s.strip()]
+    if next_seq:
+        bench_point_lookup(rng, college_ids, next_seq, args.samples * 10)
+    bench_upserts(rng, college_ids, next_seq, batch_sizes, args.samples)
+    asyncio.run(bench_reads(rng, args.samples, args.deep_pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+크롤러 HTML 파서 백엔드 벤치마크. 녹화 fixture(scripts/crawl_replay.py FixtureStore, bench_crawlers와 공유)를
+ReplayAdapter로 재생해 목록·상세 페이지를 받고, 7개 단과대 parse_*를 백엔드별로 측정.
+fixture가 없으면 먼저 --save(또는 bench_crawlers.py record)로 녹화(사이트당 목록 1 + 상세 1 요청).
+
+  python scripts/bench_html_parsers.py --save          # fixture 녹화 후 측정
+  python scripts/bench_html_parsers.py -n 50           # 녹화된 fixture로 측정
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.getcwd())
+
+from app.core.crawl_http import fetch_html, set_transport
+from app.core.crawler_config import CRAWLER_CONFIG, get_parsers
+from app.services.crawlers.html_backend import available_backends, set_parser_backend
+from scripts.crawl_replay import DEFAULT_FIXTURE_DIR, FixtureStore, ReplayAdapter, record_fixtures
+
+
+def load_pages(store: FixtureStore) -> dict[str, tuple[str, str, str | None, str | None]]:
+    """모듈별 (목록 URL, 목록 HTML, 첫 상세 URL, 상세 HTML). 재생 fetch_html로 크롤과 같은 디코딩."""
+    pages: dict[str, tuple[str, str, str | None, str | None]] = {}
+    set_transport(ReplayAdapter(store))
+    try:
+        for module_name, index in store.modules.items():
+            encoding = CRAWLER_CONFIG.get(module_name, {}).get("encoding")
+            list_url = index["list_url"]
+            detail_url = next(iter(index["detail_urls"]), None)
+            list_html = fetch_html(list_url, encoding=encoding)
+            detail_html = fetch_html(detail_url, encoding=encoding) if detail_url else None
+            pages[module_name] = (list_url, list_html, detail_url, detail_html)
+    finally:
+        set_transport(None)
+    return pages
+
+
+def bench(fixture_dir: Path, rounds: int) -> None:
+    pages = load_pages(FixtureStore(fixture_dir))
+    backends = available_backends()
+    print(f"백엔드: {', '.join(backends)} / 반복 {rounds}회 (ms = 1회 평균)")
+    print(f"{'module':<22}" + "".join(f"{b:>14}" for b in backends))
+    for module_name in CRAWLER_CONFIG:
+        if module_name not in pages:
+            print(f"{module_name:<22}  (fixture 없음, --save 필요)")
+            continue
+        list_url, list_html, detail_url, detail_html = pages[module_name]
+        parse_links, parse_detail = get_parsers(module_name)
+
+        row = f"{module_name:<22}"
+        for backend in backends:
+            set_parser_backend(backend)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                parse_links(list_html, list_url)
+                if detail_url and detail_html is not None:
+                    parse_detail(detail_html, detail_url)
+            row += f"{(time.perf_counter() - start) * 1000 / rounds:>14.2f}"
+        print(row)
+    set_parser_backend(None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤러 HTML 파서 백엔드 벤치마크")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR, help="fixture 디렉터리")
+    parser.add_argument("--save", action="store_true", help="실제 사이트에서 fixture 녹화 후 측정")
+    parser.add_argument("-n", "--rounds", type=int, default=20, help="백엔드별 반복 횟수")
+    args = parser.parse_args()
+
+    if args.save:
+        record_fixtures(args.fixtures, details=1)
+    bench(args.fixtures, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+크롤 HTTP 녹화·재생 (requests 전송 어댑터). 크롤러 모듈(get_*_links·scrape_*)을 코드 수정 없이 네트워크 없이 실행.
+- RecordingAdapter: 실제 응답(상태·Content-Type·Location·원본 바이트)을 FixtureStore에 저장.
+- ReplayAdapter: FixtureStore에서 URL로 응답을 만들어 반환. 녹화되지 않은 URL은 ConnectionError.
+- record_fixtures: 실제 사이트에서 단과대별 목록 1 + 상세 N 녹화.
+crawl_http.set_transport(adapter)로 설치. 벤치마크 전용(scripts/bench_crawlers.py·bench_html_parsers.py가 같은
+fixture를 공유)·회귀 테스트용 — 운영 코드(app)는 import하지 않음.
+fixture 디렉터리(기본 tests/fixtures/crawl): manifest.json(URL → 본문 파일·상태·헤더, 모듈별 목록·상세 URL)
++ 원본 바이트 파일(인코딩 보존).
+"""
+
+import hashlib
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from app.core.crawl_http import set_transport
+from app.core.crawler_config import CRAWLER_CONFIG, get_crawler
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_FIXTURE_DIR = Path("tests/fixtures/crawl")
+MANIFEST_NAME = "manifest.json"
+# 재생에 필요한 응답 헤더만 저장 (리다이렉트·인코딩 판단)
+_KEPT_HEADERS = ("Content-Type", "Location")
+
+
+class FixtureStore:
+    """녹화 응답 저장소 (디렉터리 1개). save() 전까지 manifest는 메모리에만."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        manifest_path = self.root / MANIFEST_NAME
+        manifest: dict[str, Any] = (
+            json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        )
+        self.responses: dict[str, dict[str, Any]] = manifest.get("responses", {})
+        self.modules: dict[str, dict[str, Any]] = manifest.get("modules", {})
+
+    def put(self, url: str, status: int, headers: dict[str, str], body: bytes) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        name = hashlib.sha256(url.encode()).hexdigest()[:20] + ".bin"
+        (self.root / name).write_bytes(body)
+        self.responses[url] = {"file": name, "status": status, "headers": headers}
+
+    def get(self, url: str) -> tuple[int, dict[str, str], bytes] | None:
+        entry = self.responses.get(url)
+        if entry is None:
+            return None
+        return entry["status"], entry["headers"], (self.root / entry["file"]).read_bytes()
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest = {"responses": self.responses, "modules": self.modules}
+        (self.root / MANIFEST_NAME).write_text(
+            json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+
+class RecordingAdapter(BaseAdapter):
+    """inner 어댑터(기본 HTTPAdapter)로 보내고 응답을 store에 기록. 본문은 미리 읽어 두므로 stream 소비와 무관."""
+
+    def __init__(self, store: FixtureStore, inner: BaseAdapter | None = None) -> None:
+        super().__init__()
+        self.store = store
+        self.inner = inner or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        resp = self.inner.send(request, *args, **kwargs)
+        body = resp.content
+        headers = {k: resp.headers[k] for k in _KEPT_HEADERS if k in resp.headers}
+        self.store.put(str(request.url), resp.status_code, headers, body)
+        return resp
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """store의 녹화 응답을 반환. 조건부 GET 헤더는 무시하고 항상 녹화된 상태 코드로 응답."""
+
+    def __init__(self, store: FixtureStore) -> None:
+        super().__init__()
+        self.store = store
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        url = str(request.url)
+        recorded = self.store.get(url)
+        if recorded is None:
+            raise requests.ConnectionError(f"not recorded: {url}", request=request)
+        status, headers, body = recorded
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers = CaseInsensitiveDict({**headers, "Content-Length": str(len(body))})
+        resp.raw = io.BytesIO(body)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.reason = "OK" if status < 400 else "Error"
+        resp.url = url
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def record_fixtures(fixture_dir: Path, details: int) -> None:
+    """실제 사이트에서 단과대별 목록 1 + 상세 details건을 크롤러 모듈 그대로 실행하며 녹화 (요청 간 1초)."""
+    store = FixtureStore(fixture_dir)
+    set_transport(RecordingAdapter(store))
+    try:
+        for module_name, config in CRAWLER_CONFIG.items():
+            get_links, scrape = get_crawler(module_name)
+            try:
+                links = get_links(config["url"])
+            except Exception as e:
+                print(f"❌ {module_name}: 목록 실패 {e}")
+                continue
+            detail_urls = [link["url"] for link in links[:details]]
+            for url in detail_urls:
+                time.sleep(1)  # polite
+                try:
+                    scrape(url)
+                except Exception as e:
+                    print(f"⚠️ {module_name}: 상세 실패 {url} {e}")
+            store.modules[module_name] = {"list_url": config["url"], "detail_urls": detail_urls}
+            print(f"💾 {module_name}: 목록 {len(links)}건, 상세 {len(detail_urls)}건 녹화")
+            store.save()
+    finally:
+        set_transport(None)
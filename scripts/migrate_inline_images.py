@@ -0,0 +1,60 @@
+"""
+기존 공지의 base64 인라인 이미지를 blob 저장소로 이전하고 Notice.images를 참조로 치환.
+BLOB_STORE_BACKEND 설정(local | s3)을 그대로 사용 — APP_ENV가 development가 아니면 s3가 아닐 때 행을 건드리기 전에 중단.
+이전된 이미지는 GET /v1/blobs/{key}로 제공. 배치마다 commit하므로 중간에 끊겨도 다시 실행하면 이어서 진행.
+로컬: 프로젝트 루트에서 python scripts/migrate_inline_images.py [--batch-size=50] [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+# 프로젝트 루트 (스크립트 디렉터리의 상위)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.blob_store import get_blob_store
+from app.core.database_sync import get_sync_session, init_sync_db
+from app.models.notice import Notice
+from app.services.crawl_service import externalize_inline_images
+from sqlalchemy import select, update
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move inline base64 notice images into the blob store.")
+    parser.add_argument("--batch-size", type=int, default=50, help="notices per commit (default 50)")
+    parser.add_argument("--dry-run", action="store_true", help="count only, no upload/update")
+    args = parser.parse_args()
+
+    init_sync_db()
+    store = get_blob_store()
+    last_id = 0
+    moved = 0
+    with get_sync_session() as session:
+        while True:
+            rows = session.execute(
+                select(Notice.id, Notice.images)
+                .where(Notice.id > last_id, Notice.images.contains([{"type": "base64"}]))
+                .order_by(Notice.id)
+                .limit(args.batch_size)
+            ).all()
+            if not rows:
+                break
+            for notice_id, images in rows:
+                last_id = notice_id
+                if args.dry_run:
+                    moved += 1
+                    continue
+                session.execute(
+                    update(Notice)
+                    .where(Notice.id == notice_id)
+                    .values(images=externalize_inline_images(images, store))
+                )
+                moved += 1
+            if not args.dry_run:
+                session.commit()
+            print(f"... up to notice_id={last_id} ({moved} notice(s))")
+    action = "Would migrate" if args.dry_run else "Migrated"
+    print(f"{action} inline images of {moved} notice(s).")
+
+
+if __name__ == "__main__":
+    main()
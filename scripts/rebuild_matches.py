@@ -0,0 +1,37 @@
+"""
+유저↔공지 매칭(user_notice_matches) 전체 재계산. 마이그레이션 010 적용 후·매칭 규칙 변경 시 1회 실행.
+1) 모든 유저의 profile_json → users.match_department·match_grade 재계산
+2) 유저별로 최근 MATCH_ACTIVE_DAYS 공지와 매칭 재계산 (유저마다 commit, 중간에 끊겨도 재실행 가능)
+로컬: 프로젝트 루트에서 python scripts/rebuild_matches.py
+"""
+import os
+import sys
+
+# 프로젝트 루트 (스크립트 디렉터리의 상위)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database_sync import get_sync_session, init_sync_db
+from app.models.user import User
+from app.services.match_service import refresh_user_matches_sync, user_match_keys
+from sqlalchemy import select, update
+
+
+def main():
+    init_sync_db()
+    with get_sync_session() as session:
+        users = session.execute(select(User.id, User.profile_json).order_by(User.id)).all()
+        for user_id, profile_json in users:
+            department, grade = user_match_keys(profile_json)
+            session.execute(
+                update(User).where(User.id == user_id).values(match_department=department, match_grade=grade)
+            )
+        session.commit()
+        total = 0
+        for user_id, _ in users:
+            total += refresh_user_matches_sync(session, user_id)
+            session.commit()
+    print(f"Rebuilt matches for {len(users)} user(s), {total} match(es).")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,10 @@ import sys
 sys.path.insert(0, os.getcwd())
 
 from app.core import database
-from app.services.crawl_service import crawl_college
+from app.services.crawl_service import crawl_colleges
 
 
-async def main():
+async def main(college_codes: list[str]):
     database.init_db()
     print("🕷️ 크롤러 테스트 시작...")
 
@@ -16,10 +16,13 @@ async def main():
         print("❌ DB 세션 생성 실패. .env 설정을 확인하세요.")
         return
 
-    async with database.async_session_maker() as session:
-        count = await crawl_college(session, "engineering")
-        await session.commit()
-        print(f"✅ 공대 크롤 완료. Upsert된 공지 수: {count}")
+    # 여러 단과대 동시 크롤 (호스트별 polite 간격 유지). 예: python scripts/test_crawler.py engineering science
+    counts = await crawl_colleges(database.async_session_maker, college_codes)
+    for code, count in counts.items():
+        if count < 0:
+            print(f"❌ {code} 크롤 실패 (로그 확인)")
+        else:
+            print(f"✅ {code} 크롤 완료. Upsert된 공지 수: {count}")
 
     print("✅ 테스트 종료!")
 
@@ -27,4 +30,4 @@ async def main():
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    asyncio.run(main())
+    asyncio.run(main(sys.argv[1:] or ["engineering"]))
@@ -17,3 +17,71 @@ def client() -> TestClient:
     """FastAPI TestClient. DB 없이 /health 등 테스트용."""
     from app.main import app
     return TestClient(app)
+
+
+class FakeRedis:
+    """
+    테스트용 Redis 대역 (문자열·해시 명령만, TTL 무시). redis-py와 같은 시그니처로 decode_responses=True처럼 str 반환.
+    crawl_scheduler·crawl_breaker·ai_service 속도 제한 등 Redis를 쓰는 로직 테스트에 공용.
+    """
+
+    def __init__(self) -> None:
+        self.kv: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.kv:
+            return False
+        self.kv[key] = str(value)
+        return True
+
+    def get(self, key: str) -> str | None:
+        return self.kv.get(key)
+
+    def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            found = self.kv.pop(key, None) is not None
+            found = self.hashes.pop(key, None) is not None or found
+            removed += found
+        return removed
+
+    def expire(self, key: str, seconds: int) -> bool:
+        return key in self.kv or key in self.hashes
+
+    def hget(self, name: str, key: str) -> str | None:
+        return self.hashes.get(name, {}).get(key)
+
+    def hgetall(self, name: str) -> dict[str, str]:
+        return dict(self.hashes.get(name, {}))
+
+    def hset(self, name: str, key: str | None = None, value=None, mapping: dict | None = None) -> int:
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        h = self.hashes.setdefault(name, {})
+        added = sum(1 for k in items if k not in h)
+        h.update({k: str(v) for k, v in items.items()})
+        return added
+
+    def hsetnx(self, name: str, key: str, value: str) -> int:
+        h = self.hashes.setdefault(name, {})
+        if key in h:
+            return 0
+        h[key] = str(value)
+        return 1
+
+    def hdel(self, name: str, *keys: str) -> int:
+        h = self.hashes.get(name, {})
+        return sum(1 for key in keys if h.pop(key, None) is not None)
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        h = self.hashes.setdefault(name, {})
+        h[key] = str(int(h.get(key, "0")) + amount)
+        return int(h[key])
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """빈 FakeRedis 1개."""
+    return FakeRedis()
@@ -0,0 +1,220 @@
+"""ai_service 단위 테스트. 공유 속도 제한·배치 조회 SQL·배치 처리 흐름·Gemini 추출(Redis·DB·네트워크 없이) 검증."""
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from app.services import ai_service
+from app.services.ai_service import GeminiExtractor, SlotRateLimiter
+from sqlalchemy.dialects import postgresql
+
+
+class _Limiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    def acquire(self) -> None:
+        self.acquired += 1
+
+
+class _ScriptClient:
+    """register_script만 흉내: Lua 호출 인자를 기록하고 정해 둔 반환값을 차례로 돌려줌."""
+
+    def __init__(self, replies: list) -> None:
+        self.scripts: list[str] = []
+        self.calls: list[tuple[list, list]] = []
+        self._replies = iter(replies)
+
+    def register_script(self, script: str):
+        self.scripts.append(script)
+
+        def run(keys, args):
+            self.calls.append((keys, args))
+            return next(self._replies)
+
+        return run
+
+
+def test_slot_rate_limiter_reserves_in_one_server_clock_script() -> None:
+    """예약은 Lua 1회(Redis TIME 기준): 간격 6초(10/m), burst 3이면 2간격까지 즉시 허용."""
+    client = _ScriptClient(["0", "4.5"])
+    limiter = SlotRateLimiter(client, "ai:rate", rate_per_minute=10, burst=3)  # type: ignore[arg-type]
+    assert [limiter.reserve(), limiter.reserve()] == [0.0, 4.5]
+    assert "TIME" in client.scripts[0] and len(client.calls) == 2
+    keys, args = client.calls[0]
+    assert keys == ["ai:rate"] and args[:3] == [6.0, 12.0, 720.0]
+
+
+def test_slot_rate_limiter_acquire_waits_for_slot_or_full_window() -> None:
+    slept: list[float] = []
+    client = _ScriptClient([None, "2.5"])  # 예약 범위가 모두 차면 nil
+    limiter = SlotRateLimiter(client, "ai:rate", rate_per_minute=10, sleep=slept.append)  # type: ignore[arg-type]
+    limiter.acquire()
+    assert slept == [720.0, 2.5]
+
+
+def test_get_by_ids_uses_single_any_array() -> None:
+    """배치 조회는 id = ANY(배열) 한 번, 무거운 이미지·첨부 컬럼 제외."""
+    from app.repositories import notice_repository
+
+    captured = {}
+
+    class _Session:
+        def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+
+            class _Result:
+                def scalars(self):
+                    return self
+
+                def all(self):
+                    return []
+
+            return _Result()
+
+    notice_repository.get_by_ids_sync(_Session(), [3, 1, 2], profile="ai_input")
+    sql = captured["sql"]
+    assert "notices.id = ANY (CAST(" in sql
+    assert " IN (" not in sql
+    assert "notices.images" not in sql
+
+
+def test_process_ai_batch_skips_processed_and_writes_once(monkeypatch) -> None:
+    notices = [
+        SimpleNamespace(id=1, college_id=10, ai_extracted_json=None),
+        SimpleNamespace(id=2, college_id=20, ai_extracted_json={"target_grades": ["3학년"]}),
+        SimpleNamespace(id=3, college_id=30, ai_extracted_json=None),
+    ]
+    calls: dict = {"schedules": [], "matches": [], "commits": 0}
+    monkeypatch.setattr(ai_service, "get_by_ids_sync", lambda s, ids, profile: notices)
+    monkeypatch.setattr(ai_service, "bulk_update_ai_results_sync", lambda s, rows: calls.update(rows=rows))
+    monkeypatch.setattr(
+        ai_service, "sync_notice_schedules_sync", lambda s, nid, dates: calls["schedules"].append(nid)
+    )
+    monkeypatch.setattr(
+        ai_service, "refresh_notice_matches_sync", lambda s, nid, extracted: calls["matches"].append(nid)
+    )
+    monkeypatch.setattr(ai_service, "get_external_ids_by_ids_sync", lambda s, ids: [f"c{i}" for i in sorted(ids)])
+    monkeypatch.setattr(ai_service, "bump_data_versions_sync", lambda codes: calls.update(bumped=codes))
+
+    class _Session:
+        def commit(self) -> None:
+            calls["commits"] += 1
+
+    limiter = _Limiter()
+    extracted = {"ai_extracted_json": {"target_grades": []}, "dates": [{"type": "마감", "date": "2026-11-01"}]}
+    stats = ai_service.process_ai_batch_sync(
+        _Session(), [1, 2, 3, 4], limiter=limiter, extract=lambda n: extracted if n.id == 1 else None  # type: ignore[arg-type]
+    )
+    assert stats == {"loaded": 3, "skipped": 1, "extracted": 1}
+    assert limiter.acquired == 2  # 미처리 공지마다 슬롯 1개
+    assert [row["id"] for row in calls["rows"]] == [1]
+    assert set(calls["rows"][0]) == {"id", *ai_service.AI_RESULT_FIELDS}
+    # 조회 후 읽기 트랜잭션 종료 1번 + 결과 반영 1번
+    assert calls["schedules"] == [1] and calls["matches"] == [1] and calls["commits"] == 2
+    assert calls["bumped"] == ["c10"]  # 결과가 반영된 공지의 단과대만
+
+
+def test_process_ai_batch_without_model_does_not_wait_for_slots(monkeypatch) -> None:
+    """모델 미연동(default_extractor None)이면 limiter를 건드리지 않고 읽기 트랜잭션만 끝내고 반환."""
+    notices = [SimpleNamespace(id=i, college_id=1, ai_extracted_json=None) for i in range(20)]
+    monkeypatch.setattr(ai_service, "get_by_ids_sync", lambda s, ids, profile: notices)
+    commits: list[int] = []
+
+    class _Session:
+        def commit(self) -> None:
+            commits.append(1)
+
+    class _Limiter:
+        def acquire(self) -> None:
+            raise AssertionError("no model call, no slot")
+
+    stats = ai_service.process_ai_batch_sync(_Session(), list(range(20)), limiter=_Limiter())  # type: ignore[arg-type]
+    assert stats == {"loaded": 20, "skipped": 0, "extracted": 0}
+    assert commits == [1]
+
+
+def test_process_ai_batch_keeps_results_before_model_error(monkeypatch) -> None:
+    """모델 429 등으로 중간에 실패하면 그때까지 결과는 반영하고 raise(재시도는 남은 공지만)."""
+    notices = [SimpleNamespace(id=i, college_id=1, ai_extracted_json=None) for i in (1, 2, 3)]
+    written: list[list[int]] = []
+    monkeypatch.setattr(ai_service, "get_by_ids_sync", lambda s, ids, profile: notices)
+    monkeypatch.setattr(
+        ai_service, "bulk_update_ai_results_sync", lambda s, rows: written.append([r["id"] for r in rows])
+    )
+    monkeypatch.setattr(ai_service, "sync_notice_schedules_sync", lambda s, nid, dates: None)
+    monkeypatch.setattr(ai_service, "refresh_notice_matches_sync", lambda s, nid, extracted: None)
+    monkeypatch.setattr(ai_service, "get_external_ids_by_ids_sync", lambda s, ids: ["c1"])
+    monkeypatch.setattr(ai_service, "bump_data_versions_sync", lambda codes: None)
+
+    def extract(notice):
+        if notice.id == 2:
+            raise httpx.HTTPStatusError("429", request=httpx.Request("POST", "x"), response=httpx.Response(429))
+        return {"hashtags": ["장학"]}
+
+    class _Session:
+        def commit(self) -> None:
+            pass
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ai_service.process_ai_batch_sync(_Session(), [1, 2, 3], limiter=_Limiter(), extract=extract)  # type: ignore[arg-type]
+    assert written == [[1]]
+
+
+def _notice() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=5, title="2027 교환학생 모집", body_text="3학년 대상. 11월 1일까지 신청.",
+        published_at=datetime(2026, 10, 18, tzinfo=UTC),
+    )
+
+
+def _gemini(handler) -> GeminiExtractor:
+    return GeminiExtractor("key", "gemini-test", timeout=5, client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_gemini_extractor_requests_schema_and_maps_result() -> None:
+    sent: dict = {}
+    output = {
+        "target_departments": ["전체"],
+        "target_grades": ["3학년"],
+        "deadline": "2026-11-01",
+        "event_title": "설명회",
+        "event_start": "2026-10-25",
+        "event_end": None,
+        "eligibility": ["평점 3.0 이상"],
+        "hashtags": ["교환학생"],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent["url"] = str(request.url)
+        sent["key"] = request.headers["x-goog-api-key"]
+        sent["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": json.dumps(output)}]}}]})
+
+    result = _gemini(handler)(_notice())  # type: ignore[arg-type]
+    assert sent["url"].endswith("/models/gemini-test:generateContent") and sent["key"] == "key"
+    config = sent["body"]["generationConfig"]
+    assert config["responseMimeType"] == "application/json"
+    assert set(config["responseJsonSchema"]["properties"]) == set(output)
+    assert "2027 교환학생 모집" in sent["body"]["contents"][0]["parts"][0]["text"]
+    assert result is not None and set(result) == set(ai_service.AI_RESULT_FIELDS)
+    assert result["dates"] == [{"type": "마감", "date": "2026-11-01"}, {"type": "설명회", "date": "2026-10-25"}]
+    assert result["ai_extracted_json"]["target_grades"] == ["3학년"]
+    assert result["eligibility"] == ["평점 3.0 이상"] and result["hashtags"] == ["교환학생"]
+
+
+def test_gemini_extractor_raises_on_rate_limit_and_skips_bad_output() -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        _gemini(lambda r: httpx.Response(429))(_notice())  # type: ignore[arg-type]
+    assert _gemini(lambda r: httpx.Response(400))(_notice()) is None  # type: ignore[arg-type]
+    bad = {"candidates": [{"content": {"parts": [{"text": '{"target_grades": 3}'}]}}]}
+    assert _gemini(lambda r: httpx.Response(200, json=bad))(_notice()) is None  # type: ignore[arg-type]
+    blocked = {"promptFeedback": {"blockReason": "SAFETY"}}
+    assert _gemini(lambda r: httpx.Response(200, json=blocked))(_notice()) is None  # type: ignore[arg-type]
+
+
+def test_default_extractor_is_none_without_api_key(monkeypatch) -> None:
+    monkeypatch.setattr(ai_service.settings, "gemini_api_key", "")
+    assert ai_service.default_extractor() is None
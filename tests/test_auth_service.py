@@ -35,3 +35,15 @@ def test_decode_google_id_token_valid(
     result = decode_google_id_token("fake-id-token")
     assert result["sub"] == "123"
     assert result["email"] == "a@b.com"
+
+
+def test_decode_access_token_round_trip() -> None:
+    """decode_access_token: access 토큰 → user_id, refresh 토큰은 AuthError."""
+    from app.services.auth_service import decode_access_token
+
+    access, refresh = create_jwt_pair(user_id=42)
+    assert decode_access_token(access) == 42
+    with pytest.raises(AuthError):
+        decode_access_token(refresh)
+    with pytest.raises(AuthError):
+        decode_access_token("not-a-jwt")
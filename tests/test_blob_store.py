@@ -0,0 +1,74 @@
+"""blob_store·인라인 이미지 이전·blob 조회 API 단위 테스트. 로컬 파일시스템 백엔드(tmp_path) 사용."""
+
+import base64
+
+import pytest
+from app.api.v1 import blobs as blobs_api
+from app.core import blob_store
+from app.core.blob_store import LocalBlobStore, blob_key
+from app.services.crawl_service import externalize_inline_images
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"0" * 32
+
+
+def test_local_blob_store_is_content_addressed(tmp_path) -> None:
+    """같은 내용은 같은 키·파일 1개. 없는 키는 None."""
+    store = LocalBlobStore(tmp_path)
+    key = store.put(PNG)
+    assert key == blob_key(PNG)
+    assert store.put(PNG) == key
+    assert store.get(key) == PNG
+    assert store.exists(key)
+    assert store.get("0" * 64) is None
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+def test_externalize_inline_images_replaces_base64_with_refs(tmp_path) -> None:
+    """base64만 blob 참조로 치환, URL 이미지·깨진 base64는 그대로."""
+    store = LocalBlobStore(tmp_path)
+    enc = base64.b64encode(PNG).decode()
+    images = [
+        {"type": "base64", "data": enc, "name": "img.png"},
+        {"type": "url", "data": "https://x.ac.kr/a.jpg", "name": "a.jpg"},
+        {"type": "base64", "data": enc, "name": "dup.png"},
+        {"type": "base64", "data": "%%%", "name": "bad.png"},
+    ]
+    out = externalize_inline_images(images, store)
+    assert out is not None
+    ref = {"type": "blob", "key": blob_key(PNG), "name": "img.png", "content_type": "image/png", "size": len(PNG)}
+    assert out[0] == ref
+    assert out[1] == images[1]
+    assert out[2]["key"] == out[0]["key"]
+    assert out[3] == images[3]
+
+
+def test_get_blob_store_refuses_local_outside_development(monkeypatch) -> None:
+    """APP_ENV가 development가 아니면 휘발성 local 백엔드 거부."""
+    monkeypatch.setattr(blob_store, "_store", None)
+    monkeypatch.setattr(blob_store.settings, "blob_store_backend", "local")
+    monkeypatch.setattr(blob_store.settings, "app_env", "production")
+    with pytest.raises(RuntimeError, match="BLOB_STORE_BACKEND=s3"):
+        blob_store.get_blob_store()
+    monkeypatch.setattr(blob_store.settings, "app_env", "development")
+    assert isinstance(blob_store.get_blob_store(), LocalBlobStore)
+
+
+def test_get_blob_serves_image_with_immutable_etag(client, tmp_path, monkeypatch) -> None:
+    """key로 이미지 본문·Content-Type 반환, If-None-Match 일치 시 304, 없는·잘못된 key는 404."""
+    store = LocalBlobStore(tmp_path)
+    key = store.put(PNG)
+    monkeypatch.setattr(blobs_api, "get_blob_store", lambda: store)
+
+    r = client.get(f"/v1/blobs/{key}")
+    assert r.status_code == 200
+    assert r.content == PNG
+    assert r.headers["content-type"] == "image/png"
+    assert r.headers["etag"] == f'"{key}"'
+    assert "immutable" in r.headers["cache-control"]
+
+    r = client.get(f"/v1/blobs/{key}", headers={"If-None-Match": f'"{key}"'})
+    assert r.status_code == 304
+    assert r.content == b""
+
+    assert client.get(f"/v1/blobs/{'0' * 64}").status_code == 404
+    assert client.get("/v1/blobs/..%2Fsecret").status_code == 404
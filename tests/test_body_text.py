@@ -0,0 +1,37 @@
+"""body_text 렌더링 단위 테스트. 표 markdown·불필요 요소 제거·트리 불변·재파싱 동일성 검증."""
+
+from app.services.crawlers.body_text import render_body_text
+from app.services.crawlers.html_backend import make_fragment_soup, make_soup
+
+
+def test_render_strips_noise_and_renders_tables_as_markdown() -> None:
+    html = (
+        '<div><p>모집 <b>안내</b>&nbsp; 입니다</p><style>.a{color:red}</style><script>x()</script>'
+        '<img src="data:image/png;base64,iVBORw0KGgo=">'
+        "<table><tr><th>구분</th><th>일정</th></tr><tr><td>서류 | 마감</td><td>3/1<br>18시</td></tr></table>"
+        "<ul><li>하나</li><li>둘</li></ul><p>목록</p><p>목록</p><!-- 주석 --></div>"
+    )
+    assert render_body_text(html) == (
+        "모집 안내 입니다\n"
+        "| 구분 | 일정 |\n"
+        "| --- | --- |\n"
+        "| 서류 \\| 마감 | 3/1 18시 |\n"
+        "- 하나\n"
+        "- 둘"
+    )
+
+
+def test_render_plain_text_without_parsing() -> None:
+    assert render_body_text("  첫 줄  \n\n\n둘째   줄 ") == "첫 줄\n둘째 줄"
+    assert render_body_text(None) == ""
+
+
+def test_render_does_not_mutate_tree_and_matches_reparse() -> None:
+    """크롤러 트리에서 렌더링해도 트리 불변, 직렬화 후 재파싱한 결과와 같음 (img 제거로 쪼개진 문자열 포함)."""
+    html = '<div id="c"><p>앞 <img src="a.png"> 뒤</p><table><tr><td>A &amp; B</td></tr></table>\n<!-- x --> 끝</div>'
+    div = make_soup(html).find("div")
+    for img in div.find_all("img"):
+        img.decompose()
+    serialized = div.decode_contents().strip()
+    assert render_body_text(div) == render_body_text(make_fragment_soup(serialized))
+    assert div.decode_contents().strip() == serialized
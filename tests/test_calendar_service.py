@@ -0,0 +1,55 @@
+"""calendar_service 단위 테스트. 일정 정규화·월 범위·달력 조회 SQL(DB 없이 컴파일) 검증."""
+
+from datetime import date
+
+from app.services.calendar_service import month_window, parse_schedule_entries
+from sqlalchemy.dialects import postgresql
+
+
+def test_parse_schedule_entries_normalizes_and_skips_invalid() -> None:
+    """ISO·점·슬래시 구분 날짜 허용, 잘못된 날짜·중복·dict 아닌 항목은 제외."""
+    dates = [
+        {"type": "서류마감", "date": "2026-03-01"},
+        {"type": "면접", "date": "2026.3.10 14:00"},
+        {"type": "서류마감", "date": "2026-03-01"},
+        {"type": "발표", "date": "2026-02-30"},
+        {"type": "기타", "date": "추후 공지"},
+        {"date": "2026/04/01"},
+        "2026-05-01",
+    ]
+    assert parse_schedule_entries(dates) == [
+        ("서류마감", date(2026, 3, 1)),
+        ("면접", date(2026, 3, 10)),
+        (None, date(2026, 4, 1)),
+    ]
+    assert parse_schedule_entries(None) == []
+
+
+def test_month_window_wraps_year() -> None:
+    assert month_window(2026, 3) == (date(2026, 3, 1), date(2026, 4, 1))
+    assert month_window(2026, 12) == (date(2026, 12, 1), date(2027, 1, 1))
+
+
+async def test_list_in_range_uses_date_range_not_jsonb() -> None:
+    """달력 조회는 notice_schedules.schedule_date 반열린 범위 조건, notices.dates(JSONB) 미사용."""
+    from app.repositories import notice_schedule_repository
+
+    captured = {}
+
+    class _Session:
+        async def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+
+            class _Result:
+                def all(self):
+                    return []
+
+            return _Result()
+
+    start, end = month_window(2026, 3)
+    await notice_schedule_repository.list_in_range(_Session(), start, end, college_codes=["engineering"])
+    sql = captured["sql"]
+    assert "notice_schedules.schedule_date >= " in sql
+    assert "notice_schedules.schedule_date < " in sql
+    assert "notices.dates" not in sql
+    assert "notices.raw_html" not in sql
@@ -0,0 +1,76 @@
+"""
+crawl_breaker 단위 테스트. closed → open(연속 실패) → half_open 탐침 → 시험 기간 → closed / 재open(기간 2배) 전이 검증.
+"""
+
+from app.services.crawl_breaker import CLOSED, HALF_OPEN, OPEN, HostCircuitBreaker
+
+
+def _breaker(client, now: list[float]) -> HostCircuitBreaker:
+    return HostCircuitBreaker(
+        client,
+        failure_threshold=2,
+        open_seconds=100,
+        max_open_seconds=300,
+        trial_successes=2,
+        clock=lambda: now[0],
+    )
+
+
+def test_breaker_opens_after_consecutive_failures_and_skips(fake_redis) -> None:
+    now = [0.0]
+    breaker = _breaker(fake_redis, now)
+    probes: list[str] = []
+
+    def probe() -> bool:
+        probes.append("x")
+        return True
+
+    breaker.record_failure("h")
+    assert breaker.allow("h", probe)  # 1회 실패는 closed
+    breaker.record_success("h")  # 성공이 연속 실패를 끊음
+    breaker.record_failure("h")
+    breaker.record_failure("h")
+    assert breaker.state("h")["state"] == OPEN
+    now[0] = 50
+    assert not breaker.allow("h", probe)
+    assert probes == []  # open 기간에는 탐침도 안 함
+
+
+def test_half_open_probe_closes_or_reopens_with_doubled_period(fake_redis) -> None:
+    now = [0.0]
+    breaker = _breaker(fake_redis, now)
+    breaker.record_failure("h")
+    breaker.record_failure("h")
+
+    now[0] = 101
+    assert not breaker.allow("h", lambda: False)  # 탐침 실패 → 200초 재open
+    assert float(breaker.state("h")["open_until"]) == 301
+    now[0] = 250
+    assert not breaker.allow("h", lambda: True)
+
+    now[0] = 302
+    assert breaker.allow("h", lambda: True)
+    assert breaker.state("h")["state"] == HALF_OPEN  # 탐침 성공 → 시험 기간
+    assert breaker.allow("h", lambda: False)  # 시험 기간에는 탐침 없이 허용
+    breaker.record_success("h")
+    assert breaker.state("h")["state"] == HALF_OPEN
+    breaker.record_success("h")
+    assert breaker.state("h").get("state", CLOSED) == CLOSED
+    assert breaker.allow("h", lambda: False)  # closed에서는 탐침 없이 허용
+
+
+def test_first_failure_in_trial_reopens_with_doubled_period(fake_redis) -> None:
+    """탐침 성공 직후 실제 크롤이 실패하면 failure_threshold를 기다리지 않고 곧바로 재open."""
+    now = [0.0]
+    breaker = _breaker(fake_redis, now)
+    breaker.record_failure("h")
+    breaker.record_failure("h")
+    now[0] = 101
+    assert breaker.allow("h", lambda: True)
+    breaker.record_success("h")
+    breaker.record_failure("h")
+    state = breaker.state("h")
+    assert state["state"] == OPEN and "trial" not in state
+    assert float(state["open_until"]) == 301
+    now[0] = 200
+    assert not breaker.allow("h", lambda: True)
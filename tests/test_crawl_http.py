@@ -0,0 +1,98 @@
+"""crawl_http 단위 테스트. 네트워크 없이 가짜 세션으로 조건부 GET·검증자 저장소 검증."""
+
+import pytest
+from app.core import crawl_http
+from app.core.crawl_http import HtmlTooLargeError, ValidatorStore, _Validator, fetch_html
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i : i + chunk_size]
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code}")
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses: list[_FakeResponse]) -> None:
+        self.responses = responses
+        self.sent_headers: list[dict] = []
+
+    def get(self, url: str, headers: dict, timeout: int, stream: bool) -> _FakeResponse:
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def fake_session(monkeypatch: pytest.MonkeyPatch):
+    def install(responses: list[_FakeResponse]) -> _FakeSession:
+        session = _FakeSession(responses)
+        monkeypatch.setattr(crawl_http, "get_session", lambda url: session)
+        monkeypatch.setattr(crawl_http, "validator_store", ValidatorStore())
+        return session
+
+    return install
+
+
+def test_fetch_html_conditional_get_reuses_body_on_304(fake_session) -> None:
+    """ETag 저장 후 재요청 시 If-None-Match 전송, 304면 보관 본문 반환."""
+    html = "<p>공지</p>".encode()
+    session = fake_session([
+        _FakeResponse(200, html, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}),
+        _FakeResponse(304),
+    ])
+    assert fetch_html("https://a.ac.kr/n?id=1") == "<p>공지</p>"
+    assert fetch_html("https://a.ac.kr/n?id=1") == "<p>공지</p>"
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+def test_fetch_html_explicit_encoding(fake_session) -> None:
+    """encoding 인자(예: cp949)가 Content-Type보다 우선."""
+    fake_session([_FakeResponse(200, "경영대".encode("cp949"), {"Content-Type": "text/html"})])
+    assert fetch_html("https://b.ac.kr/", encoding="cp949") == "경영대"
+
+
+def test_fetch_html_rejects_large_content_length(fake_session) -> None:
+    """Content-Length가 max_bytes 초과면 본문을 읽기 전에 HtmlTooLargeError."""
+    fake_session([_FakeResponse(200, b"x", {"Content-Length": "999"})])
+    with pytest.raises(HtmlTooLargeError):
+        fetch_html("https://c.ac.kr/", max_bytes=10)
+
+
+def test_validator_store_evicts_by_bytes() -> None:
+    """바이트 상한 초과 시 가장 오래된 항목부터 제거."""
+    store = ValidatorStore(max_entries=10, max_bytes=10)
+    store.put("u1", _Validator(etag="a", last_modified=None, body=b"123456", content_type=None))
+    store.put("u2", _Validator(etag="b", last_modified=None, body=b"123456", content_type=None))
+    assert store.get("u1") is None
+    assert store.get("u2") is not None
+
+
+def test_async_host_throttle_spaces_same_host_only() -> None:
+    """같은 호스트 2번째 요청은 interval만큼 대기, 다른 호스트는 대기 없음."""
+    import asyncio
+
+    async def _run() -> tuple[float, float, float]:
+        throttle = crawl_http.AsyncHostThrottle(0.05)
+        first = await throttle.wait("a.ac.kr")
+        other = await throttle.wait("b.ac.kr")
+        second = await throttle.wait("a.ac.kr")
+        return first, other, second
+
+    first, other, second = asyncio.run(_run())
+    assert first == 0.0
+    assert other == 0.0
+    assert second > 0.0
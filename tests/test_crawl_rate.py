@@ -0,0 +1,71 @@
+"""crawl_rate 단위 테스트. AIMD 간격 조정·Retry-After 해석·호스트 예약/보류(메모리 상태, 주입 시계)."""
+
+import pytest
+from app.core.crawl_rate import (
+    HostBackoffError,
+    HostRateController,
+    MemoryRateState,
+    RateParams,
+    RedisRateState,
+    adjust_delay,
+    parse_retry_after,
+)
+
+PARAMS = RateParams(
+    initial_delay=1.0, min_delay=0.5, max_delay=8.0, step=0.1, factor=2.0, slow_latency=3.0, max_wait=30.0
+)
+
+
+def test_adjust_delay_aimd() -> None:
+    assert adjust_delay(1.0, PARAMS, status=200, latency=0.2) == pytest.approx(0.9)
+    assert adjust_delay(0.5, PARAMS, status=200, latency=0.2) == 0.5  # 하한
+    assert adjust_delay(1.0, PARAMS, status=429, latency=0.2) == 2.0
+    assert adjust_delay(1.0, PARAMS, status=None, latency=30.0) == 2.0  # 타임아웃·연결 오류
+    assert adjust_delay(6.0, PARAMS, status=503, latency=0.2) == 8.0  # 상한
+    assert adjust_delay(1.0, PARAMS, status=200, latency=5.0) == 1.5  # 느린 응답은 절반 세기 후퇴
+    assert adjust_delay(1.0, PARAMS, status=404, latency=0.2) == 1.0
+    assert adjust_delay(1.0, PARAMS, status=429, latency=0.2, retry_after=5.0) == 5.0
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    assert parse_retry_after("120", now=0) == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0) == 30.0
+    assert parse_retry_after("soon", now=0) is None
+    assert parse_retry_after(None, now=0) is None
+
+
+def test_controller_spaces_requests_and_blocks_on_retry_after() -> None:
+    now = [100.0]
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    rate = HostRateController(MemoryRateState(clock=lambda: now[0]), PARAMS, clock=lambda: now[0], sleep=sleep)
+    assert rate.wait("a.example") == 0.0
+    assert rate.wait("a.example") == 1.0  # 초기 간격
+    assert rate.wait("b.example") == 0.0  # 호스트별 독립
+
+    assert rate.observe("a.example", status=200, latency=0.1) == pytest.approx(0.9)
+    assert rate.observe("a.example", status=429, latency=0.1, retry_after_header="60") == 8.0
+    with pytest.raises(HostBackoffError) as backoff:
+        rate.wait("a.example")  # Retry-After 60초 > max_wait 30초
+    assert backoff.value.retry_after == pytest.approx(60.0)
+    now[0] += 45
+    assert rate.wait("a.example") == pytest.approx(15.0)
+    assert slept == [1.0, pytest.approx(15.0)]
+
+
+def test_redis_state_sends_relative_hold_to_server_clock_script() -> None:
+    """Retry-After 보류는 워커 시각이 아닌 상대 초로 보내 Lua에서 Redis TIME 기준으로 계산."""
+    calls: list[tuple[str, list, list]] = []
+
+    class _Client:
+        def register_script(self, script: str):
+            return lambda keys, args: calls.append((script, keys, args))
+
+    RedisRateState(_Client()).update("a.example", 8.0, 60.0)  # type: ignore[arg-type]
+    script, keys, args = calls[0]
+    assert "TIME" in script and keys == ["crawl:rate:a.example"]
+    assert args[:2] == [8.0, 60.0]
@@ -0,0 +1,36 @@
+"""scripts/crawl_replay 단위 테스트. fixture 녹화 → 재생으로 fetch_html이 네트워크 없이 같은 본문을 돌려주는지 검증."""
+
+import pytest
+import requests
+from app.core.crawl_http import fetch_html, set_transport
+from scripts.crawl_replay import FixtureStore, RecordingAdapter, ReplayAdapter
+
+
+@pytest.fixture(autouse=True)
+def _restore_transport():
+    yield
+    set_transport(None)
+
+
+def test_record_then_replay_round_trip(tmp_path) -> None:
+    upstream = FixtureStore(tmp_path / "upstream")
+    upstream.put("https://ysb.example/list", 200, {"Content-Type": "text/html"}, "경영 공지".encode("cp949"))
+    upstream.put("https://ysb.example/old", 302, {"Location": "https://ysb.example/list"}, b"")
+
+    recorded = FixtureStore(tmp_path / "recorded")
+    set_transport(RecordingAdapter(recorded, inner=ReplayAdapter(upstream)))
+    assert fetch_html("https://ysb.example/old", encoding="cp949") == "경영 공지"
+    recorded.modules["yonsei_business"] = {"list_url": "https://ysb.example/old", "detail_urls": []}
+    recorded.save()
+
+    replay = FixtureStore(tmp_path / "recorded")
+    assert replay.modules["yonsei_business"]["list_url"] == "https://ysb.example/old"
+    set_transport(ReplayAdapter(replay))
+    # 리다이렉트도 녹화되어 재생 시 같은 경로로 따라감, 원본 바이트(cp949) 보존
+    assert fetch_html("https://ysb.example/old", encoding="cp949") == "경영 공지"
+
+
+def test_replay_unknown_url_raises_connection_error(tmp_path) -> None:
+    set_transport(ReplayAdapter(FixtureStore(tmp_path)))
+    with pytest.raises(requests.ConnectionError):
+        fetch_html("https://nowhere.example/")
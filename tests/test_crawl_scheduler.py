@@ -0,0 +1,90 @@
+"""crawl_scheduler 단위 테스트. Redis·DB 없이 적응형 주기·호스트 lease·dispatch 검증."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.models.crawl_run import CrawlRun
+from app.services.crawl_scheduler import (
+    PENDING_KEY,
+    HostLeases,
+    clear_backfill_checkpoint,
+    compute_crawl_interval,
+    dispatch_pending,
+    enqueue_pending,
+    get_backfill_checkpoint,
+    is_crawl_due,
+    set_backfill_checkpoint,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+MIN = timedelta(minutes=30)
+MAX = timedelta(hours=6)
+
+
+def _run(hours_ago: float, upserted: int, status: str = "success") -> CrawlRun:
+    finished = NOW - timedelta(hours=hours_ago)
+    return CrawlRun(
+        college_id=1,
+        started_at=finished - timedelta(minutes=1),
+        finished_at=finished if status != "running" else None,
+        status=status,
+        notices_upserted=upserted,
+    )
+
+
+def test_compute_crawl_interval_follows_posting_rate() -> None:
+    """24시간 동안 8건 게시 → 3시간 주기. 게시 없으면 상한, 이력 부족하면 하한."""
+    busy = [_run(0, 4), _run(12, 4), _run(24, 10)]
+    assert compute_crawl_interval(busy, min_interval=MIN, max_interval=MAX) == timedelta(hours=3)
+    quiet = [_run(0, 0), _run(24, 0)]
+    assert compute_crawl_interval(quiet, min_interval=MIN, max_interval=MAX) == MAX
+    assert compute_crawl_interval([_run(0, 3)], min_interval=MIN, max_interval=MAX) == MIN
+
+
+def test_is_crawl_due() -> None:
+    """성공 후 interval 경과 시에만 due. 실행 중이면 아님, 실패 직후면 due."""
+    kw = {"interval": timedelta(hours=3), "running_timeout": timedelta(hours=1)}
+    assert is_crawl_due([], NOW, **kw)
+    assert not is_crawl_due([_run(1, 2)], NOW, **kw)
+    assert is_crawl_due([_run(4, 2)], NOW, **kw)
+    assert not is_crawl_due([_run(0.1, 0, status="running"), _run(4, 2)], NOW, **kw)
+    assert is_crawl_due([_run(0.5, 0, status="failed"), _run(1, 2)], NOW, **kw)
+
+
+def test_host_leases_limit_and_token_release(fake_redis) -> None:
+    """호스트당 limit개까지만 점유. 다른 토큰의 lease로는 해제되지 않음."""
+    r = fake_redis
+    leases = HostLeases(r, limit=1, ttl_seconds=60)  # type: ignore[arg-type]
+    first = leases.acquire("a.ac.kr")
+    assert first is not None
+    assert leases.acquire("a.ac.kr") is None
+    assert leases.acquire("b.ac.kr") is not None
+    leases.release(first.rpartition("#")[0] + "#stale")
+    assert leases.acquire("a.ac.kr") is None
+    leases.release(first)
+    assert leases.acquire("a.ac.kr") is not None
+
+
+def test_dispatch_pending_starts_free_hosts_and_keeps_busy_ones(fake_redis) -> None:
+    """호스트 슬롯이 빈 단과대만 시작하고, 점유된 호스트의 단과대는 pending에 남김."""
+    r = fake_redis
+    leases = HostLeases(r, limit=1, ttl_seconds=60)  # type: ignore[arg-type]
+    assert leases.acquire("engineering.yonsei.ac.kr") is not None
+    enqueue_pending(r, ["engineering", "science"], incremental=True)  # type: ignore[arg-type]
+    enqueue_pending(r, ["science"], incremental=False)  # type: ignore[arg-type]
+
+    started: list[tuple[str, bool]] = []
+    result = dispatch_pending(r, leases, lambda code, inc, lease: started.append((code, inc)))  # type: ignore[arg-type]
+    assert result == ["science"]
+    assert started == [("science", False)]
+    assert r.hgetall(PENDING_KEY) == {"engineering": "1"}
+
+
+def test_backfill_checkpoint_round_trip(fake_redis) -> None:
+    r = fake_redis
+    assert get_backfill_checkpoint(r, "engineering") == (0, set())
+    set_backfill_checkpoint(r, "engineering", 4, {"https://x/2", "https://x/1"})
+    assert get_backfill_checkpoint(r, "engineering") == (4, {"https://x/1", "https://x/2"})
+    clear_backfill_checkpoint(r, "engineering")
+    assert get_backfill_checkpoint(r, "engineering") == (0, set())
+    r.hset("crawl:backfill", "engineering", "3")
+    assert get_backfill_checkpoint(r, "engineering") == (3, set())
@@ -0,0 +1,183 @@
+"""crawl_service 순수 함수 단위 테스트. DB/HTTP 호출 없이 검증."""
+
+import threading
+from types import SimpleNamespace
+
+from app.core.crawl_http import FetchInfo
+from app.core.crawl_rate import HostRateController, MemoryRateState, default_rate_params
+from app.core.crawler_config import list_page_url
+from app.services import crawl_service
+from app.services.crawl_service import (
+    _external_id_for_post,
+    _iter_posts_to_fetch,
+    _select_posts_to_fetch,
+    iter_list_pages,
+)
+
+
+def _post(no: str, title: str | None = None) -> dict:
+    post = {"no": no, "url": f"https://example.ac.kr/board?articleNo={no}"}
+    if title is not None:
+        post["title"] = title
+    return post
+
+
+def test_external_id_for_post_falls_back_to_url() -> None:
+    """_external_id_for_post: no가 없으면 URL 쿼리(articleNo 등)에서 추출."""
+    assert _external_id_for_post({"no": "", "url": "https://x.ac.kr/view?idx=77"}) == "77"
+    assert _external_id_for_post({"no": "12", "url": "https://x.ac.kr/view?idx=77"}) == "12"
+
+
+def test_select_posts_to_fetch_keeps_new_and_stops_on_known_streak() -> None:
+    """신규만 선별하고, 기존 공지가 연속 known_streak_stop건이면 이후 행은 보지 않음."""
+    links = [_post("10"), _post("9"), _post("8"), _post("7"), _post("6"), _post("5")]
+    known = {"8": "a", "7": "b", "6": "c", "5": "d"}
+    selected = _select_posts_to_fetch(links, known, known_streak_stop=2)
+    assert [p["no"] for p in selected] == ["10", "9"]
+
+
+def test_select_posts_to_fetch_refetches_changed_list_title() -> None:
+    """목록 제목이 저장된 제목과 다르면 재수집. [카테고리] 접두어·말줄임은 동일 취급."""
+    links = [
+        _post("4", "[학사] 수강신청 안내"),
+        _post("3", "장학금 공고 (수정)"),
+        _post("2", "2026학년도 1학기 교환학생..."),
+        _post("1", "특강"),
+    ]
+    known = {"4": "수강신청 안내", "3": "장학금 공고", "2": "2026학년도 1학기 교환학생 모집", "1": "특강"}
+    selected = _select_posts_to_fetch(links, known, known_streak_stop=0)
+    assert [p["no"] for p in selected] == ["3"]
+
+
+def test_select_posts_to_fetch_dedupes_pinned_rows() -> None:
+    """같은 external_id가 목록에 여러 번 나와도 한 번만 선별."""
+    links = [_post("4"), _post("4"), _post("3")]
+    selected = _select_posts_to_fetch(links, {})
+    assert [p["no"] for p in selected] == ["4", "3"]
+
+
+def test_payload_body_text_same_from_tree_or_html() -> None:
+    """크롤러가 트리에서 렌더링한 body_text와 HTML로 렌더링한 값이 같고, content_hash는 body_text 기준."""
+    from app.services.crawl_service import _content_hash, build_notice_payload
+    from app.services.crawlers.body_text import render_body_text
+    from app.services.crawlers.html_backend import make_fragment_soup
+
+    html = "<p>수강 신청</p><ul><li>기간: 3/2</li></ul>"
+    post = {"no": "1"}
+    from_html = build_notice_payload(1, post, "https://x.ac.kr/v?no=1", "공지", None, html, [], [])
+    from_tree = build_notice_payload(
+        1, post, "https://x.ac.kr/v?no=1", "공지", None, html, [], [], render_body_text(make_fragment_soup(html))
+    )
+    assert from_html is not None and from_tree is not None
+    assert from_html["body_text"] == from_tree["body_text"] == "수강 신청\n- 기간: 3/2"
+    assert from_html["content_hash"] == from_tree["content_hash"] == _content_hash("공지", "수강 신청\n- 기간: 3/2")
+
+
+def test_notice_batcher_flushes_by_rows_and_bytes() -> None:
+    """행 수·바이트 상한 중 먼저 닿는 쪽에서 배치 반환, 중복 external_id는 배치가 달라도 한 번만."""
+    from app.services.crawl_service import NoticeBatcher
+
+    batcher = NoticeBatcher(max_rows=2, max_bytes=100)
+    assert batcher.add({"external_id": "1", "raw_html": "a"}) is None
+    assert [p["external_id"] for p in batcher.add({"external_id": "2", "raw_html": "b"}) or []] == ["1", "2"]
+    assert batcher.add({"external_id": "1", "raw_html": "a"}) is None
+    big = {"external_id": "3", "raw_html": "", "images": [{"type": "base64", "data": "x" * 100}]}
+    assert [p["external_id"] for p in batcher.add(big) or []] == ["3"]
+    assert batcher.add({"external_id": "4", "raw_html": "c"}) is None
+    assert [p["external_id"] for p in batcher.drain()] == ["4"]
+    assert batcher.total == 4
+
+
+def test_crawl_college_sync_fetches_details_concurrently_in_list_order(monkeypatch) -> None:
+    """detail_concurrency=2: 상세 fetch가 겹쳐 실행되고 upsert 순서는 목록 순서 그대로."""
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_fetch(url: str, encoding: str | None = None, **_kw):
+        nonlocal in_flight, peak
+        if url == "list":
+            return "<list>", FetchInfo(bytes_read=1, not_modified=False)
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        if url.endswith(("/1", "/2")):
+            both_started.wait()  # 첫 두 건은 동시에 진행 중이어야 통과
+        with lock:
+            in_flight -= 1
+        return f"<p>{url[-1]}</p>", FetchInfo(bytes_read=1, not_modified=False)
+
+    links = [{"no": str(i), "title": f"t{i}", "url": f"https://x/{i}"} for i in range(1, 6)]
+    upserted: list[str] = []
+
+    def fake_upsert(session, batch: list[dict]) -> list[int]:
+        upserted.extend(p["external_id"] for p in batch)
+        return []
+
+    monkeypatch.setattr(crawl_service, "get_college_by_external_id_sync", lambda s, c: SimpleNamespace(id=7))
+    monkeypatch.setattr(crawl_service, "CRAWLER_CONFIG", {"yonsei_science": {"url": "list", "detail_concurrency": 2}})
+    monkeypatch.setattr(
+        crawl_service,
+        "get_parsers",
+        lambda m: (lambda html, url: links, lambda html, url: (f"제목 {url[-1]}", "2026-10-18", html, [], [])),
+    )
+    monkeypatch.setattr(crawl_service, "fetch_html_with_info", fake_fetch)
+    monkeypatch.setattr(crawl_service, "get_blob_store", lambda: None)
+    monkeypatch.setattr(crawl_service, "upsert_notices_bulk_sync", fake_upsert)
+
+    class _Session:
+        def commit(self) -> None:
+            pass
+
+    rate = HostRateController(MemoryRateState(), default_rate_params(), sleep=lambda s: None)
+    count, _ = crawl_service.crawl_college_sync(_Session(), "science", incremental=False, rate=rate)
+    assert count == 5 and peak == 2
+    assert upserted == ["1", "2", "3", "4", "5"]
+
+
+def test_list_page_url_offset_and_page_modes() -> None:
+    offset = {
+        "url": "https://x.ac.kr/notice.do?mode=list",
+        "pagination": {"param": "article.offset", "offset": True, "size_param": "articleLimit", "size": 10},
+    }
+    assert list_page_url(offset, 0) == "https://x.ac.kr/notice.do?mode=list"
+    assert list_page_url(offset, 2) == "https://x.ac.kr/notice.do?mode=list&articleLimit=10&article.offset=20"
+    numbered = {"url": "https://x.ac.kr/board.php?bo_table=n&page=1", "pagination": {"param": "page", "first": 1}}
+    assert list_page_url(numbered, 1) == "https://x.ac.kr/board.php?bo_table=n&page=2"
+
+
+def test_paged_selection_stops_fetching_after_known_streak() -> None:
+    """기존 공지 연속 N건이 페이지 경계를 넘어 이어지면 다음 페이지는 요청하지 않음."""
+    config = {"url": "https://x.ac.kr/b?page=1", "pagination": {"param": "page", "first": 1}}
+    board = {1: ["30", "29", "28"], 2: ["27", "26", "25"], 3: ["24", "23", "22"]}
+    fetched: list[str] = []
+
+    def fetch_links(url: str) -> list[dict]:
+        fetched.append(url)
+        return [_post(no) for no in board.get(int(url.rsplit("=", 1)[1]), [])]
+
+    known = {"28": "a", "27": "b", "26": "c", "25": "d", "24": "e"}
+    pages = iter_list_pages(config, fetch_links, max_pages=10)
+    selected = _iter_posts_to_fetch(pages, lambda ids: {k: v for k, v in known.items() if k in ids}, 3)
+    assert [p["no"] for p in selected] == ["30", "29"]
+    assert fetched == ["https://x.ac.kr/b?page=1", "https://x.ac.kr/b?page=2"]
+
+
+def test_iter_list_pages_ends_on_empty_or_repeated_page() -> None:
+    config = {"url": "https://x.ac.kr/b?page=1", "pagination": {"param": "page", "first": 1}}
+    last = [_post("2"), _post("1")]
+    # 범위 밖 페이지에 마지막 페이지를 다시 돌려주는 게시판
+    pages = list(iter_list_pages(config, lambda url: last, max_pages=10))
+    assert pages == [last]
+    assert list(iter_list_pages(config, lambda url: [], max_pages=10)) == []
+
+
+def test_iter_list_pages_compares_with_previous_call_page() -> None:
+    """페이지를 나눠 호출해도(백필) last_page_urls로 직전 쪽과 같은 쪽을 목록 끝으로 판정."""
+    config = {"url": "https://x.ac.kr/b?page=1", "pagination": {"param": "page", "first": 1}}
+    last = [_post("2"), _post("1")]
+    previous: set[str] = set()
+    assert list(iter_list_pages(config, lambda url: last, start_page=0, last_page_urls=previous)) == [last]
+    assert previous == {p["url"] for p in last}
+    assert list(iter_list_pages(config, lambda url: last, start_page=1, last_page_urls=previous)) == []
@@ -0,0 +1,89 @@
+"""crawl_stats 단위 테스트. 단계별 계측 수집(crawl_college_sync, 네트워크·DB 없이)·단과대별 백분위 요약 검증."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from app.core.crawl_http import FetchInfo, HtmlTooLargeError
+from app.core.crawl_rate import HostRateController, MemoryRateState, default_rate_params
+from app.services import crawl_service
+from app.services.crawl_stats import CrawlStats, percentile, summarize_runs
+
+
+def test_crawl_college_sync_records_stages_and_skip_reasons(monkeypatch) -> None:
+    pages = {
+        "list": ("<list>", FetchInfo(bytes_read=100, not_modified=False)),
+        "https://x/1": ("<p>a</p>", FetchInfo(bytes_read=50, not_modified=False)),
+        "https://x/2": ("<p>b</p>", FetchInfo(bytes_read=0, not_modified=True)),
+        "https://x/4": ("", FetchInfo(bytes_read=0, not_modified=False)),
+    }
+
+    def fake_fetch(url: str, encoding: str | None = None, **_kw):
+        if url == "https://x/3":
+            raise HtmlTooLargeError("too big")
+        if url == "https://x/5":
+            raise OSError("reset")
+        return pages[url]
+
+    links = [{"no": str(i), "title": f"t{i}", "url": f"https://x/{i}"} for i in range(1, 6)]
+    links.append({"no": "1", "title": "t1", "url": "https://x/1"})  # 목록에 같은 글 반복(고정 공지)
+
+    def parse_detail(html: str, url: str) -> tuple:
+        title = "" if url.endswith("/4") else f"제목 {url[-1]}"
+        return (title, "2026-10-18", html, [], [])
+
+    monkeypatch.setattr(crawl_service, "get_college_by_external_id_sync", lambda s, c: SimpleNamespace(id=7))
+    monkeypatch.setattr(crawl_service, "CRAWLER_CONFIG", {"yonsei_science": {"url": "list"}})
+    monkeypatch.setattr(crawl_service, "get_parsers", lambda m: (lambda html, url: links, parse_detail))
+    monkeypatch.setattr(crawl_service, "fetch_html_with_info", fake_fetch)
+    monkeypatch.setattr(crawl_service, "get_blob_store", lambda: None)
+    monkeypatch.setattr(crawl_service, "upsert_notices_bulk_sync", lambda s, batch: [101])  # 2건 중 1건만 변경
+    monkeypatch.setattr(crawl_service, "bump_data_versions_sync", lambda codes: None)
+
+    class _Session:
+        def commit(self) -> None:
+            pass
+
+    stats = CrawlStats()
+    rate = HostRateController(MemoryRateState(), default_rate_params(), sleep=lambda s: None)
+    count, ids = crawl_service.crawl_college_sync(_Session(), "science", incremental=False, stats=stats, rate=rate)
+    assert (count, ids) == (2, [101])
+    data = stats.to_dict()
+    assert data["pages_fetched"] == 5 and data["bytes_downloaded"] == 200 and data["not_modified"] == 1
+    assert data["links_listed"] == 6 and data["notices_changed"] == 1
+    assert data["skipped"] == {"too_large": 1, "fetch_error": 1, "invalid": 1, "duplicate": 1, "unchanged": 1}
+    assert set(data["stage_ms"]) == {"list_fetch", "detail_fetch", "polite_sleep", "parse", "hash", "images", "upsert"}
+
+
+def test_stage_accumulates_with_injected_clock() -> None:
+    ticks = iter([0.0, 0.5, 1.0, 1.25])
+    stats = CrawlStats(clock=lambda: next(ticks))
+    with stats.stage("parse"):
+        pass
+    with stats.stage("parse"):
+        pass
+    assert stats.stage_ms["parse"] == 750.0
+
+
+def test_summarize_runs_percentiles_per_college() -> None:
+    t0 = datetime(2026, 10, 18, tzinfo=UTC)
+
+    def run(seconds: int, status: str = "success", stats: dict | None = None) -> SimpleNamespace:
+        return SimpleNamespace(
+            started_at=t0, finished_at=t0 + timedelta(seconds=seconds), status=status, stats=stats
+        )
+
+    runs = [
+        (run(10, stats={"stage_ms": {"upsert": 100.0}, "pages_fetched": 3, "skipped": {"known": 2}}), "science"),
+        (run(20, stats={"stage_ms": {"upsert": 300.0}, "pages_fetched": 5, "skipped": {"known": 1}}), "science"),
+        (run(30, status="failed"), "science"),  # 계측 이전 run: 소요 시간만
+        (run(5), "medicine"),
+    ]
+    summary = summarize_runs(runs)  # type: ignore[arg-type]
+    science = summary["science"]
+    assert science["runs"] == 3 and science["status"] == {"success": 2, "failed": 1}
+    assert science["duration_ms"] == {"p50": 20000.0, "p95": 29000.0, "max": 30000.0}
+    assert science["stage_ms"]["upsert"]["p50"] == 200.0
+    assert science["stage_ms"]["parse"]["p50"] is None
+    assert science["skipped"] == {"known": 3}
+    assert summary["medicine"]["duration_ms"]["max"] == 5000.0
+    assert percentile([], 50) is None and percentile([4.0], 95) == 4.0
@@ -0,0 +1,39 @@
+"""html_backend 단위 테스트. 백엔드 fallback·조각 왕복 직렬화 검증."""
+
+from app.services.crawlers import html_backend
+from app.services.crawlers.html_backend import (
+    FALLBACK_BACKEND,
+    available_backends,
+    make_fragment_soup,
+    make_soup,
+    set_parser_backend,
+)
+
+
+def test_unavailable_backend_falls_back_to_html_parser() -> None:
+    """미설치·미지원 백엔드 지정 시 html.parser로 fallback."""
+    try:
+        assert set_parser_backend("no-such-parser") == FALLBACK_BACKEND
+        assert make_soup("<p>a</p>").find("p").get_text() == "a"
+    finally:
+        html_backend._backend = None
+
+
+def test_fragment_soup_round_trips_without_document_wrapper() -> None:
+    """본문 조각은 <html><body>로 감싸지 않아 raw_html·해시가 백엔드와 무관."""
+    fragment = '<div class="x"><p>본문</p><table border="1"><tr><td>1</td></tr></table></div>'
+    assert str(make_fragment_soup(fragment)) == fragment
+
+
+def test_all_available_backends_find_same_links() -> None:
+    """사용 가능한 모든 백엔드가 같은 선택자 결과를 냄."""
+    html = '<html><body><ul><li><a href="/a?no=1">첫째</a></li><li><a href="/a?no=2">둘째</a></li></ul></body></html>'
+    try:
+        results = []
+        for backend in available_backends():
+            set_parser_backend(backend)
+            results.append([a["href"] for a in make_soup(html).select("ul li a")])
+        assert all(r == results[0] for r in results)
+    finally:
+        html_backend._backend = None
+
@@ -0,0 +1,44 @@
+"""http_validators 단위 테스트. If-None-Match·If-Modified-Since 판단과 본문 해시 ETag 미들웨어(304) 검증."""
+
+from datetime import UTC, datetime
+
+from app.core.http_validators import ConditionalGetMiddleware, etag_matches, http_date, is_not_modified
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def test_etag_matches_weak_comparison_and_lists() -> None:
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches("*", 'W/"x"')
+    assert not etag_matches('W/"a"', 'W/"b"')
+    assert not etag_matches(None, 'W/"a"')
+
+
+def test_is_not_modified_prefers_if_none_match() -> None:
+    lm = datetime(2026, 10, 18, 3, 0, 0, 500000, tzinfo=UTC)
+    since = {"if-modified-since": http_date(lm)}
+    assert is_not_modified(since, 'W/"a"', lm)  # 초 미만은 비교하지 않음
+    assert not is_not_modified({"if-modified-since": "Sat, 17 Oct 2026 00:00:00 GMT"}, 'W/"a"', lm)
+    assert not is_not_modified({"if-modified-since": "garbage"}, 'W/"a"', lm)
+    # If-None-Match가 있으면 If-Modified-Since 무시
+    assert not is_not_modified({**since, "if-none-match": 'W/"b"'}, 'W/"a"', lm)
+
+
+def test_middleware_adds_body_etag_and_answers_304() -> None:
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware)
+
+    @app.get("/items")
+    def items() -> dict:
+        return {"items": [1, 2, 3]}
+
+    client = TestClient(app)
+    first = client.get("/items")
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and etag.startswith('W/"')
+
+    again = client.get("/items", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b"" and again.headers["etag"] == etag
+    assert client.get("/items", headers={"If-None-Match": 'W/"other"'}).status_code == 200
+    assert "etag" not in client.post("/items").headers
@@ -0,0 +1,80 @@
+"""match_service 단위 테스트. 매칭 규칙·역색인 후보 SQL·증분 갱신(DB 없이) 검증."""
+
+from app.services import match_service
+from app.services.match_service import (
+    MatchTargets,
+    department_key,
+    grade_values,
+    notice_targets,
+    profile_matches,
+    user_match_keys,
+)
+from sqlalchemy.dialects import postgresql
+
+
+def test_department_key_and_grade_values() -> None:
+    assert department_key(" 컴퓨터 과학과 ") == "컴퓨터과학"
+    assert department_key("경영학부") == department_key("경영학과") == "경영학"
+    assert department_key(None) is None
+    assert grade_values("3학년") == {3}
+    assert grade_values("3학년 이상") == {3, 4, 5, 6}
+    assert grade_values("2학년 이하") == {1, 2}
+    assert grade_values("전학년") is None
+
+
+def test_notice_targets_wildcards_clear_restriction() -> None:
+    """"전체" 학과·숫자 없는 학년이 섞이면 해당 조건은 제한 없음."""
+    targets = notice_targets({"target_departments": ["컴퓨터과학과", "전기전자공학부"], "target_grades": ["4학년"]})
+    assert targets == MatchTargets(departments=frozenset({"컴퓨터과학", "전기전자공학"}), grades=frozenset({4}))
+    wildcard = {"target_departments": ["컴퓨터과학과", "전 학과"], "target_grades": ["전학년"]}
+    assert notice_targets(wildcard) == MatchTargets()
+    assert notice_targets(None) == MatchTargets()
+
+
+def test_profile_matches_exposes_when_ambiguous() -> None:
+    targets = MatchTargets(departments=frozenset({"컴퓨터과학"}), grades=frozenset({3, 4}))
+    department, grade = user_match_keys({"major": "컴퓨터과학과", "grade": 3})
+    assert (department, grade) == ("컴퓨터과학", 3)
+    assert profile_matches(department, grade, targets)
+    assert not profile_matches("경영학", 3, targets)
+    assert not profile_matches("컴퓨터과학", 1, targets)
+    assert profile_matches(None, None, targets)
+    assert profile_matches("경영학", 1, MatchTargets())
+
+
+def test_find_match_candidates_uses_match_key_columns() -> None:
+    """후보 유저는 users.match_department·match_grade(역색인)로 조회, profile_json JSONB 미사용."""
+    from app.repositories import user_repository
+
+    captured = {}
+
+    class _Session:
+        def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+
+            class _Result:
+                def scalars(self):
+                    return self
+
+                def all(self):
+                    return []
+
+            return _Result()
+
+    user_repository.find_match_candidates_sync(_Session(), departments={"컴퓨터과학"}, grades={3})
+    sql = captured["sql"]
+    assert "users.match_department IN" in sql
+    assert "users.match_grade IN" in sql
+    assert "profile_json" not in sql
+
+
+def test_refresh_notice_matches_applies_diff_only(monkeypatch) -> None:
+    """기존 매칭은 유지, 새 후보만 추가·빠진 유저만 삭제."""
+    calls: dict = {}
+    monkeypatch.setattr(match_service, "find_match_candidates_sync", lambda s, departments, grades: [1, 2, 4])
+    monkeypatch.setattr(match_service, "get_user_ids_for_notice_sync", lambda s, nid: {1, 2, 3})
+    monkeypatch.setattr(match_service, "delete_for_notice_sync", lambda s, nid, ids: calls.update(deleted=set(ids)))
+    monkeypatch.setattr(match_service, "add_matches_sync", lambda s, pairs: calls.update(added=list(pairs)))
+
+    assert match_service.refresh_notice_matches_sync(object(), 10, {"target_grades": ["3학년"]}) == 3
+    assert calls == {"deleted": {3}, "added": [(4, 10)]}
@@ -0,0 +1,93 @@
+"""metrics 단위 테스트. 히스토그램·텍스트 렌더링, 라우트 템플릿 라벨 미들웨어, 브로커 큐의 AI 태스크 집계 검증."""
+
+import base64
+import json
+
+from app.core.metrics import (
+    AI_QUEUE_NOTICES,
+    AI_QUEUE_TASKS,
+    HTTP_REQUEST_DURATION,
+    MetricsMiddleware,
+    MetricsRegistry,
+    observe_broker_queue,
+    render,
+)
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def test_histogram_renders_cumulative_buckets_with_instance_label() -> None:
+    registry = MetricsRegistry()
+    hist = registry.histogram("t_latency_seconds", "test", ("host",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        hist.observe(value, host="a.yonsei.ac.kr")
+    registry.counter("t_bytes", "test", ("host",)).inc(1024, host="a.yonsei.ac.kr")
+
+    text = render([("worker:h:1", registry.collect())])
+    assert "# TYPE t_latency_seconds histogram" in text
+    assert 't_latency_seconds_bucket{instance="worker:h:1",host="a.yonsei.ac.kr",le="0.1"} 1' in text
+    assert 't_latency_seconds_bucket{instance="worker:h:1",host="a.yonsei.ac.kr",le="1"} 2' in text
+    assert 't_latency_seconds_bucket{instance="worker:h:1",host="a.yonsei.ac.kr",le="+Inf"} 3' in text
+    assert 't_latency_seconds_count{instance="worker:h:1",host="a.yonsei.ac.kr"} 3' in text
+    assert 't_bytes_total{instance="worker:h:1",host="a.yonsei.ac.kr"} 1024' in text
+
+
+def test_snapshot_families_merge_under_one_header() -> None:
+    registry = MetricsRegistry()
+    registry.gauge("t_depth", "test").set(3)
+    families = json.loads(json.dumps(registry.collect()))  # Redis 스냅샷 왕복
+    text = render([("web:h:1", families), ("worker:h:2", families)])
+    assert text.count("# TYPE t_depth gauge") == 1
+    assert 't_depth{instance="web:h:1"} 3' in text and 't_depth{instance="worker:h:2"} 3' in text
+
+
+def test_middleware_labels_by_route_template() -> None:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/things/{thing_id}")
+    def thing(thing_id: int) -> dict:
+        return {"id": thing_id}
+
+    client = TestClient(app)
+    client.get("/things/1")
+    client.get("/things/2")
+    client.get("/nowhere")
+
+    counts = {
+        (labels["route"], labels["status"]): value
+        for suffix, labels, value in HTTP_REQUEST_DURATION.samples()
+        if suffix == "_count"
+    }
+    assert counts[("/things/{thing_id}", "2xx")] >= 2
+    assert counts[("unmatched", "4xx")] >= 1
+
+
+class _FakeBroker:
+    def __init__(self, messages: list[bytes]) -> None:
+        self.messages = messages
+
+    def llen(self, key: str) -> int:
+        return len(self.messages)
+
+    def lrange(self, key: str, start: int, end: int) -> list[bytes]:
+        return self.messages[start : end + 1]
+
+
+def _message(task: str, args: list) -> bytes:
+    body = base64.b64encode(json.dumps([args, {}, {}]).encode()).decode()
+    return json.dumps({"body": body, "headers": {"task": task}}).encode()
+
+
+def test_broker_queue_counts_ai_tasks_and_notices() -> None:
+    broker = _FakeBroker(
+        [
+            _message("app.services.tasks.process_notice_ai_batch_task", [[1, 2, 3]]),
+            _message("app.services.tasks.process_notice_ai_task", [7]),
+            _message("app.services.tasks.crawl_college_task", ["science"]),
+            b"not json",
+        ]
+    )
+    observe_broker_queue(broker)  # type: ignore[arg-type]
+    assert AI_QUEUE_TASKS.samples() == [("", {}, 2.0)]
+    assert AI_QUEUE_NOTICES.samples() == [("", {}, 4.0)]
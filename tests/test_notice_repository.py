@@ -0,0 +1,30 @@
+"""notice_repository 로드 프로필 단위 테스트. DB 없이 컴파일된 SELECT 컬럼만 검증."""
+
+from app.models.notice import Notice
+from app.repositories.notice_repository import notice_load_options
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+
+def _selected_sql(profile) -> str:
+    stmt = select(Notice).options(*notice_load_options(profile))
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_list_card_profile_skips_heavy_columns() -> None:
+    """list_card: raw_html·images·attachments·ai_extracted_json 미조회, 카드용 컬럼은 조회."""
+    sql = _selected_sql("list_card")
+    for col in ("raw_html", "images", "attachments", "ai_extracted_json"):
+        assert f"notices.{col}" not in sql
+    assert "notices.title" in sql
+    assert "notices.dates" in sql
+
+
+def test_ai_input_and_full_profiles() -> None:
+    """ai_input은 정제 본문(body_text)·AI 결과만, full은 전 컬럼."""
+    ai_sql = _selected_sql("ai_input")
+    assert "notices.body_text" in ai_sql and "notices.ai_extracted_json" in ai_sql
+    assert "notices.raw_html" not in ai_sql and "notices.images" not in ai_sql
+    full_sql = _selected_sql("full")
+    heavy = ("raw_html", "body_text", "images", "attachments", "ai_extracted_json")
+    assert all(f"notices.{c}" in full_sql for c in heavy)
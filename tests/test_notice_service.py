@@ -0,0 +1,97 @@
+"""notice_service 단위 테스트. 커서 인코딩·keyset 조건(DB 없이 SQL 컴파일) 검증."""
+
+from datetime import UTC, datetime
+
+import pytest
+from app.services.notice_service import InvalidCursorError, decode_cursor, encode_cursor
+from sqlalchemy.dialects import postgresql
+
+
+def test_cursor_round_trip() -> None:
+    """(published_at, id) 커서 왕복. published_at이 없는 공지도 지원."""
+    ts = datetime(2026, 10, 18, 9, 30, tzinfo=UTC)
+    assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", encode_cursor(None, 1)[:-3]])
+def test_decode_cursor_rejects_garbage(cursor: str) -> None:
+    """형식이 틀린 커서는 InvalidCursorError (Router에서 400)."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+async def test_list_feed_uses_keyset_condition() -> None:
+    """after 지정 시 OFFSET 없이 (published_at, id) 행 비교 + NULL 꼬리 조건으로 조회."""
+    from app.repositories import notice_repository
+
+    captured = {}
+
+    class _Session:
+        async def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+
+            class _Result:
+                def all(self):
+                    return []
+
+            return _Result()
+
+    ts = datetime(2026, 10, 18, tzinfo=UTC)
+    await notice_repository.list_feed(_Session(), college_codes=["engineering"], after=(ts, 10), limit=21)
+    sql = captured["sql"]
+    assert "OFFSET" not in sql
+    assert "(notices.published_at, notices.id) < (" in sql
+    assert "notices.published_at IS NULL" in sql
+    assert "ORDER BY notices.published_at DESC NULLS LAST, notices.id DESC" in sql
+    assert "notices.raw_html" not in sql
+
+
+def test_search_tokens_bigrams_hangul_and_keeps_words() -> None:
+    """한글은 2글자 bigram(1글자는 그대로), 영숫자는 소문자 단어. 기호·중복 제거."""
+    from app.services.notice_service import search_tokens
+
+    assert search_tokens("장학금 TOEIC-900, 장학!") == ["장학", "학금", "toeic", "900"]
+    assert search_tokens("팀") == ["팀"]
+    assert search_tokens("!!!") == []
+
+
+def test_build_search_query_ands_tokens_with_prefix_for_words() -> None:
+    from app.services.notice_service import build_search_query
+
+    assert build_search_query("교환학생 toe") == "'교환' & '환학' & '학생' & 'toe':*"
+    assert build_search_query("팀") == "'팀':*"
+    assert build_search_query("  ...  ") is None
+
+
+def test_search_cursor_round_trip() -> None:
+    from app.services.notice_service import decode_search_cursor, encode_search_cursor
+
+    assert decode_search_cursor(encode_search_cursor(0.6079271, 12)) == (0.6079271, 12)
+    with pytest.raises(InvalidCursorError):
+        decode_search_cursor(encode_cursor(None, 1))
+
+
+async def test_search_uses_gin_match_and_rank_keyset() -> None:
+    """검색은 search_vector @@ tsquery(GIN) + (rank, id) keyset, LIKE·raw_html 미사용."""
+    from app.repositories import notice_repository
+
+    captured = {}
+
+    class _Session:
+        async def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+
+            class _Result:
+                def all(self):
+                    return []
+
+            return _Result()
+
+    await notice_repository.search(_Session(), "'장학':*", after=(0.5, 10), limit=21)
+    sql = captured["sql"]
+    assert "notices.search_vector @@ CAST(" in sql
+    assert "AS TSQUERY)" in sql
+    assert "(ts_rank(notices.search_vector, CAST(" in sql
+    assert "LIKE" not in sql
+    assert "notices.raw_html" not in sql
@@ -0,0 +1,129 @@
+"""response_cache 단위 테스트. 2계층 히트·데이터 버전 무효화·Redis 오류 시 fallback (실제 Redis 없이)."""
+
+import redis
+from app.core.response_cache import (
+    DATA_VERSION_KEY_PREFIX,
+    LocalLRU,
+    ResponseCache,
+    bump_data_versions_sync,
+    scope_codes,
+)
+
+
+class _FakeAsyncRedis:
+    """mget·get·set만 흉내 (TTL 무시)."""
+
+    def __init__(self) -> None:
+        self.kv: dict[str, bytes] = {}
+        self.gets = 0
+        self.fail = False
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        if self.fail:
+            raise redis.ConnectionError("down")
+        return [self.kv.get(k) for k in keys]
+
+    async def get(self, key: str) -> bytes | None:
+        self.gets += 1
+        return self.kv.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self.kv[key] = value
+        return True
+
+
+class _FakePipeline:
+    def __init__(self, kv: dict[str, bytes]) -> None:
+        self._kv = kv
+        self._ops: list[tuple[str, object]] = []
+
+    def incr(self, key: str) -> None:
+        self._ops.append((key, None))
+
+    def set(self, key: str, value: object) -> None:
+        self._ops.append((key, value))
+
+    def execute(self) -> None:
+        for key, value in self._ops:
+            if value is None:
+                value = int(self._kv.get(key) or 0) + 1
+            self._kv[key] = str(value).encode()
+
+
+class _FakeSyncRedis:
+    def __init__(self, kv: dict[str, bytes]) -> None:
+        self.kv = kv
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.kv)
+
+
+def _counting_build(counter: list[int], body: bytes):
+    async def build() -> bytes:
+        counter.append(1)
+        return body
+
+    return build
+
+
+async def test_get_or_build_serves_from_local_then_redis_tier() -> None:
+    client = _FakeAsyncRedis()
+    built: list[int] = []
+    cache = ResponseCache(client, LocalLRU(8), ttl_seconds=60)
+    for _ in range(2):
+        body = await cache.get_or_build("feed", {"limit": 20}, ["science"], _counting_build(built, b"{}"))
+        assert body == b"{}"
+    assert len(built) == 1 and client.gets == 1  # 두 번째는 메모리 LRU 히트
+
+    other_process = ResponseCache(client, LocalLRU(8), ttl_seconds=60)
+    assert await other_process.get_or_build("feed", {"limit": 20}, ["science"], _counting_build(built, b"x")) == b"{}"
+    assert len(built) == 1  # Redis 계층 히트
+
+
+async def test_bump_invalidates_only_entries_of_that_college() -> None:
+    client = _FakeAsyncRedis()
+    built: list[int] = []
+    cache = ResponseCache(client, LocalLRU(8), ttl_seconds=60)
+    await cache.get_or_build("feed", {}, ["science"], _counting_build(built, b"s1"))
+    await cache.get_or_build("feed", {}, ["medicine"], _counting_build(built, b"m1"))
+
+    bump_data_versions_sync(["science"], client=_FakeSyncRedis(client.kv))  # type: ignore[arg-type]
+    assert client.kv[f"{DATA_VERSION_KEY_PREFIX}science"] == b"1"
+
+    assert await cache.get_or_build("feed", {}, ["science"], _counting_build(built, b"s2")) == b"s2"
+    assert await cache.get_or_build("feed", {}, ["medicine"], _counting_build(built, b"m2")) == b"m1"
+    # 필터 없는 요청은 전체 단과대 버전에 의존
+    assert "science" in scope_codes(None) and scope_codes(["b", "a", "b"]) == ["a", "b"]
+
+
+async def test_slot_validators_follow_data_version() -> None:
+    """ETag은 본문 없이 버전으로 계산, bump 후 바뀌고 Last-Modified는 마지막 bump 시각."""
+    client = _FakeAsyncRedis()
+    cache = ResponseCache(client, LocalLRU(8), ttl_seconds=60)
+    before = await cache.slot("feed", {"limit": 20}, ["science"])
+    assert before.etag and before.last_modified is None
+    assert (await cache.slot("feed", {"limit": 20}, ["science"])).etag == before.etag
+    assert (await cache.slot("feed", {"limit": 10}, ["science"])).etag != before.etag
+
+    bump_data_versions_sync(["science"], client=_FakeSyncRedis(client.kv))  # type: ignore[arg-type]
+    after = await cache.slot("feed", {"limit": 20}, ["science"])
+    assert after.etag != before.etag and after.last_modified is not None
+
+
+async def test_redis_error_or_disabled_falls_back_to_build() -> None:
+    client = _FakeAsyncRedis()
+    client.fail = True
+    built: list[int] = []
+    for cache in (ResponseCache(client, LocalLRU(8), ttl_seconds=60), ResponseCache(None, LocalLRU(8), ttl_seconds=60)):
+        assert await cache.get_or_build("feed", {}, None, _counting_build(built, b"{}")) == b"{}"
+        assert await cache.get_or_build("feed", {}, None, _counting_build(built, b"{}")) == b"{}"
+    assert len(built) == 4
+
+
+def test_local_lru_evicts_least_recent() -> None:
+    lru = LocalLRU(2)
+    lru.put("a", b"1")
+    lru.put("b", b"2")
+    lru.get("a")
+    lru.put("c", b"3")
+    assert lru.get("b") is None and lru.get("a") == b"1" and len(lru) == 2
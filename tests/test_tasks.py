@@ -0,0 +1,187 @@
+"""tasks 단위 테스트. DB·Redis·브로커 없이 태스크 본문의 lease 반환·백필 체크포인트 규칙 검증."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from app.core.crawl_http import FetchInfo, HtmlTooLargeError
+from app.core.crawl_rate import HostBackoffError, HostRateController, MemoryRateState, default_rate_params
+from app.services import crawl_service, tasks
+from app.services.crawl_scheduler import get_backfill_checkpoint
+
+
+class _Session:
+    def commit(self) -> None:
+        pass
+
+
+class _Breaker:
+    def __init__(self, open_: bool = False) -> None:
+        self.open = open_
+
+    def allow(self, host, probe) -> bool:
+        return not self.open
+
+    def record_success(self, host) -> None:
+        pass
+
+    def record_failure(self, host) -> None:
+        pass
+
+
+@pytest.fixture
+def released(monkeypatch) -> list[str]:
+    """crawl_college_task 의존성 대체. 반환: 반환된 lease 목록."""
+    out: list[str] = []
+
+    @contextmanager
+    def session():
+        yield _Session()
+
+    monkeypatch.setattr(tasks, "get_sync_session", session)
+    monkeypatch.setattr(tasks, "get_college_by_external_id_sync", lambda s, c: SimpleNamespace(id=1))
+    monkeypatch.setattr(tasks, "create_crawl_run_sync", lambda *a, **k: None)
+    monkeypatch.setattr(tasks, "update_crawl_run_sync", lambda *a, **k: None)
+    monkeypatch.setattr(tasks, "default_breaker", lambda *a: _Breaker())
+    monkeypatch.setattr(tasks, "_release_lease_and_dispatch", out.append)
+    return out
+
+
+def _fail_with(exc: Exception):
+    def crawl(*_a, **_k):
+        raise exc
+
+    return crawl
+
+
+def test_crawl_task_keeps_lease_while_retry_pending(monkeypatch, released) -> None:
+    """재시도될 네트워크 오류면 lease 유지(재시도가 같은 슬롯으로 실행), 재시도 소진 시 반환."""
+    monkeypatch.setattr(tasks, "crawl_college_sync", _fail_with(ConnectionError("reset")))
+    with pytest.raises(ConnectionError):
+        tasks.crawl_college_task("engineering", lease="slot")
+    assert released == []
+
+    tasks.crawl_college_task.push_request(retries=tasks.crawl_college_task.max_retries)
+    try:
+        with pytest.raises(ConnectionError):
+            tasks.crawl_college_task.run("engineering", lease="slot")
+    finally:
+        tasks.crawl_college_task.pop_request()
+    assert released == ["slot"]
+
+
+def test_crawl_task_retries_host_backoff_after_hold_keeping_lease(monkeypatch, released) -> None:
+    """Retry-After 보류(HostBackoffError)는 실패로 버리지 않고 보류가 풀리는 시각에 같은 lease로 재시도."""
+    retried: list[dict] = []
+
+    class _RetryError(Exception):
+        pass
+
+    def retry(**kwargs):
+        retried.append(kwargs)
+        return _RetryError()
+
+    monkeypatch.setattr(tasks, "crawl_college_sync", _fail_with(HostBackoffError("h", 90.4)))
+    monkeypatch.setattr(tasks.crawl_college_task, "retry", retry)
+    with pytest.raises(_RetryError):
+        tasks.crawl_college_task("engineering", lease="slot")
+    assert retried[0]["countdown"] == 91
+    assert released == []
+
+
+def test_crawl_task_releases_lease_on_terminal_outcomes(monkeypatch, released) -> None:
+    monkeypatch.setattr(tasks, "crawl_college_sync", _fail_with(ValueError("parser")))
+    with pytest.raises(ValueError):
+        tasks.crawl_college_task("engineering", lease="a")
+    monkeypatch.setattr(tasks, "crawl_college_sync", lambda *a, **k: (0, []))
+    assert tasks.crawl_college_task("engineering", lease="b") == {"upserted": 0, "enqueued_ai": 0}
+    assert released == ["a", "b"]
+
+
+@pytest.fixture
+def board(monkeypatch, fake_redis) -> dict[int, list[str]]:
+    """
+    backfill_college_task 의존성 대체(가짜 목록 fetcher). 반환: 게시판 {쪽 번호(1부터): 글 번호}.
+    범위 밖 쪽을 요청하면 마지막 쪽을 다시 돌려주는 게시판.
+    """
+    pages: dict[int, list[str]] = {}
+    config = {"url": "https://x.ac.kr/b?page=1", "pagination": {"param": "page", "first": 1}}
+
+    def fake_fetch(url: str, encoding: str | None = None, **_kw):
+        return url, FetchInfo(bytes_read=1, not_modified=False)
+
+    def parse_links(html: str, url: str) -> list[dict]:
+        if "page=" not in url:
+            return []
+        nos = pages.get(int(url.rsplit("=", 1)[1])) or pages[max(pages)]
+        return [{"no": no, "title": f"t{no}", "url": f"https://x.ac.kr/b/{no}"} for no in nos]
+
+    @contextmanager
+    def session():
+        yield _Session()
+
+    monkeypatch.setattr(tasks, "CRAWLER_CONFIG", {"yonsei_engineering": config})
+    monkeypatch.setattr(tasks, "get_redis", lambda: fake_redis)
+    monkeypatch.setattr(tasks, "get_sync_session", session)
+    monkeypatch.setattr(tasks, "default_breaker", lambda *a: _Breaker())
+    monkeypatch.setattr(tasks, "_enqueue_ai", lambda ids: None)
+    monkeypatch.setattr(crawl_service, "CRAWLER_CONFIG", {"yonsei_engineering": config})
+    monkeypatch.setattr(crawl_service, "get_college_by_external_id_sync", lambda s, c: SimpleNamespace(id=1))
+    monkeypatch.setattr(
+        crawl_service,
+        "get_parsers",
+        lambda m: (parse_links, lambda html, url: (f"제목 {url}", "2026-10-18", "<p>본문</p>", [], [])),
+    )
+    monkeypatch.setattr(crawl_service, "fetch_html_with_info", fake_fetch)
+    monkeypatch.setattr(crawl_service, "get_blob_store", lambda: None)
+    monkeypatch.setattr(crawl_service, "get_known_titles_sync", lambda s, c, ids: {})
+    monkeypatch.setattr(crawl_service, "upsert_notices_bulk_sync", lambda s, batch: [])
+    monkeypatch.setattr(
+        crawl_service,
+        "get_rate_controller",
+        lambda: HostRateController(MemoryRateState(), default_rate_params(), sleep=lambda s: None),
+    )
+    return pages
+
+
+def test_backfill_ends_on_repeated_last_page_across_calls(fake_redis, board) -> None:
+    """범위 밖 쪽이 마지막 쪽을 돌려줘도 페이지 단위 호출 사이에서 반복으로 판정해 체크포인트 삭제."""
+    board.update({1: ["6", "5"], 2: ["4", "3"], 3: ["2", "1"]})
+    result = tasks.backfill_college_task("engineering", pages=10)
+    assert result["next_page"] is None and result["upserted"] == 6
+    assert get_backfill_checkpoint(fake_redis, "engineering") == (0, set())
+
+
+def test_backfill_advances_checkpoint_and_resumes(fake_redis, board) -> None:
+    board.update({1: ["6", "5"], 2: ["4", "3"], 3: ["2", "1"]})
+    result = tasks.backfill_college_task("engineering", pages=2)
+    assert (result["from_page"], result["next_page"], result["upserted"]) == (0, 2, 4)
+    assert get_backfill_checkpoint(fake_redis, "engineering") == (2, {"https://x.ac.kr/b/4", "https://x.ac.kr/b/3"})
+
+    result = tasks.backfill_college_task("engineering", pages=2)
+    assert (result["from_page"], result["next_page"], result["upserted"]) == (2, None, 2)
+    assert get_backfill_checkpoint(fake_redis, "engineering") == (0, set())
+
+
+def test_backfill_pauses_without_advancing_when_circuit_open(monkeypatch, fake_redis, board) -> None:
+    board.update({1: ["2", "1"]})
+    monkeypatch.setattr(tasks, "default_breaker", lambda *a: _Breaker(open_=True))
+    result = tasks.backfill_college_task("engineering", pages=5)
+    assert (result["from_page"], result["next_page"], result["upserted"]) == (0, 0, 0)
+    assert get_backfill_checkpoint(fake_redis, "engineering") == (0, set())
+
+
+@pytest.mark.parametrize("error", [HtmlTooLargeError("too large"), ConnectionError("reset")])
+def test_backfill_keeps_checkpoint_when_list_page_unreadable(monkeypatch, fake_redis, board, error) -> None:
+    """못 읽은 목록 페이지를 목록 끝으로 보지 않음: raise하고 체크포인트는 그 페이지에 유지."""
+    board.update({1: ["6", "5"], 2: ["4", "3"], 3: ["2", "1"]})
+
+    def fetch(url: str, encoding: str | None = None, **_kw):
+        if url.endswith("page=2"):
+            raise error
+        return url, FetchInfo(bytes_read=1, not_modified=False)
+
+    monkeypatch.setattr(crawl_service, "fetch_html_with_info", fetch)
+    with pytest.raises(type(error)):
+        tasks.backfill_college_task("engineering", pages=10)
+    assert get_backfill_checkpoint(fake_redis, "engineering") == (1, {"https://x.ac.kr/b/6", "https://x.ac.kr/b/5"})